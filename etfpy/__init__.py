@@ -1,7 +1,31 @@
 import pandas as pd
 
-from etfpy.client.etf_client import get_available_etfs_list
-from etfpy.etf import ETF, load_etf, load_etf_as_tabular, etfs_to_json
+from etfpy.analytics.screener import screen
+from etfpy.client._http_archive import HTTPArchive
+from etfpy.client._page_cache import PageCache
+from etfpy.client._rate_limit import RateLimiter, RetryPolicy, get_rate_limiter
+from etfpy.client._section_store import SectionStore
+from etfpy.client._session_pool import SessionPool, get_session_pool
+from etfpy.client._single_flight import SingleFlight, get_single_flight
+from etfpy.client.etf_client import (
+    get_available_etfs_list,
+    get_etf_universe,
+    search_etfs,
+)
+from etfpy.etf import (
+    ETF,
+    AsyncETF,
+    ETFSnapshot,
+    aload_etfs,
+    etfs_to_json,
+    iter_etf_sections,
+    iter_etfs,
+    load_etf,
+    load_etf_as_tabular,
+    load_etf_sections,
+    load_etfs,
+    load_etfs_as_tabular,
+)
 
 pd.options.display.float_format = "{:.2f}".format
 pd.set_option("display.max_columns", None)
@@ -0,0 +1,118 @@
+import weakref
+from typing import Iterable, Optional, Union
+
+import pandas as pd
+
+from etfpy.client.etf_client import get_etf_universe
+
+# frames are dropped together with their universes, a cache keyed by
+# strong references would keep universes and their mmaps alive
+_FRAMES = weakref.WeakKeyDictionary()
+
+
+def _universe_frame(universe) -> pd.DataFrame:
+    """Returns the (cached) DataFrame representation of the universe."""
+    try:
+        return _FRAMES[universe]
+    except KeyError:
+        df = _FRAMES[universe] = universe.to_frame()
+        return df
+
+
+def _between(
+    column: pd.Series, low: Optional[float], high: Optional[float]
+) -> pd.Series:
+    mask = pd.Series(True, index=column.index)
+    if low is not None:
+        mask &= column >= low
+    if high is not None:
+        mask &= column <= high
+    return mask
+
+
+def screen(
+    asset_class: Union[str, Iterable[str], None] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_volume: Optional[float] = None,
+    max_volume: Optional[float] = None,
+    min_return: Optional[float] = None,
+    max_return: Optional[float] = None,
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    top: Optional[int] = None,
+    top_per_asset_class: bool = False,
+    universe=None,
+) -> pd.DataFrame:
+    """Screens the local ETF universe without touching the network.
+
+    Price, average volume and one year return are numeric columns parsed once
+    when the catalog is built, so every filter is a vectorized comparison.
+    ETFs with missing values are dropped by any filter on that value.
+
+    Parameters
+    ----------
+    asset_class : str or Iterable[str], optional
+        Asset class (or asset classes) to keep e.g. ``Equity`` or ``["Bond", "Equity"]``.
+    min_price, max_price : float, optional
+        Inclusive price range in dollars.
+    min_volume, max_volume : float, optional
+        Inclusive average volume range.
+    min_return, max_return : float, optional
+        Inclusive one year return range in percent e.g. ``10`` for 10%.
+    sort_by : str, optional
+        Column to sort by e.g. ``average_volume``, ``price`` or ``one_year_return``.
+    ascending : bool, default=False
+        Sort order, descending by default so ``top`` picks the largest values.
+    top : int, optional
+        Number of ETFs to return, overall or per asset class.
+    top_per_asset_class : bool, default=False
+        Apply ``top`` within each asset class instead of to the whole result.
+    universe : optional
+        Universe to screen, defaults to the process-wide ETF universe.
+
+    Returns
+    -------
+    pd.DataFrame
+        Matching catalog rows with columns ``symbol``, ``asset_class``, ``price``,
+        ``average_volume``, ``name``, ``url`` and ``one_year_return``.
+
+    Raises
+    ------
+    ValueError
+        If ``sort_by`` is not a catalog column.
+
+    Examples
+    --------
+    >>> screen(asset_class="Bond", min_volume=1_000_000, sort_by="one_year_return", top=5)
+    """
+    df = _universe_frame(get_etf_universe() if universe is None else universe)
+
+    mask = (
+        _between(df["price"], min_price, max_price)
+        & _between(df["average_volume"], min_volume, max_volume)
+        & _between(df["one_year_return"], min_return, max_return)
+    )
+    if asset_class is not None:
+        classes = [asset_class] if isinstance(asset_class, str) else list(asset_class)
+        mask &= df["asset_class"].isin(classes)
+    result = df[mask]
+
+    if sort_by is not None:
+        if sort_by not in df.columns:
+            raise ValueError(
+                f"can't sort by {sort_by}, available columns: {list(df.columns)}"
+            )
+        result = result.sort_values(
+            sort_by, ascending=ascending, kind="stable", na_position="last"
+        )
+    if top is not None:
+        result = (
+            result.groupby("asset_class", sort=False).head(top)
+            if top_per_asset_class
+            else result.head(top)
+        )
+    return result.reset_index(drop=True)
+
+
+__all__ = ["screen"]
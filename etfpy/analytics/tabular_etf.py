@@ -1,3 +1,4 @@
+import inspect
 from typing import Union
 
 import pandas as pd
@@ -7,6 +8,7 @@ from etfpy.analytics.utils import (
     remove_sign_from_values_and_add_as_metric_suffix,
     replace_value_in_df_cell,
 )
+from etfpy.client.etf_client import get_etf_universe
 from etfpy.deco import lowercase_and_underscore_column_names
 from etfpy.log import get_logger
 from etfpy.utils import remove_nested_benchmarks
@@ -174,7 +176,18 @@ class _BaseTabularETF:
         return df
 
     def get_quotes(self, interval="daily", periods=360, order="asc"):
-        return self.etf._get_quotes(self.etf.ticker, interval, periods, order)
+        quotes = self.etf._get_quotes(self.etf.ticker, interval, periods, order)
+        if inspect.iscoroutine(quotes):
+            quotes.close()
+            raise TypeError(
+                f"quotes of {self.etf.ticker} are fetched asynchronously, "
+                "use await aget_quotes() instead"
+            )
+        return quotes
+
+    async def aget_quotes(self, interval="daily", periods=360, order="asc"):
+        """Returns quotes DataFrame of a wrapped ``AsyncETF``."""
+        return await self.etf._get_quotes(self.etf.ticker, interval, periods, order)
 
     def __repr__(self):
         """Returns a string representation of the object."""
@@ -427,9 +440,10 @@ def convert_etf_to_tabular(
         ValueError: If the ETF's asset class is not supported.
     """
 
-    cls = _mapping.get(etf.asset_class)
+    asset_class = etf.asset_class or get_etf_universe().asset_class(etf.ticker)
+    cls = _mapping.get(asset_class)
     if cls is None:
-        raise ValueError(f"Unsupported asset class: {etf.asset_class}")
+        raise ValueError(f"Unsupported asset class: {asset_class}")
     return cls(etf)
 
 
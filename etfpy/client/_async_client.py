@@ -0,0 +1,296 @@
+import asyncio
+import contextlib
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+)
+
+import pandas as pd
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._http_archive import ArchivedResponse
+from etfpy.client._single_flight import T, request_key
+from etfpy.client.etf_client import ETFDBClient
+from etfpy.exc import ExpiredSectionException
+from etfpy.log import get_logger
+from etfpy.utils import get_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = get_logger(__name__)
+
+
+def _require_httpx():
+    if httpx is None:
+        raise ImportError(
+            "async clients require httpx, install it with: pip install 'etfpy[async]'"
+        )
+
+
+def get_async_http_client(
+    max_connections: int = 100, max_keepalive_connections: int = 20, **kwargs: Any
+) -> "httpx.AsyncClient":
+    """Creates pooled keep-alive async HTTP client to share between async clients.
+
+    Parameters
+    ----------
+    max_connections : int, default=100
+        Maximum number of connections open at once.
+    max_keepalive_connections : int, default=20
+        Maximum number of idle connections kept alive.
+    kwargs : Any
+        Additional keyword arguments passed to ``httpx.AsyncClient``.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        HTTP client, close it with ``await client.aclose()``.
+    """
+    _require_httpx()
+    kwargs.setdefault("timeout", 30)
+    kwargs.setdefault("headers", get_headers())
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        follow_redirects=True,
+        **kwargs,
+    )
+
+
+class AsyncClientMixin:
+    """Async counterparts of ``BaseClient`` requests sent with ``httpx``.
+
+    Response handling (page cache, quotes conversion) is shared with the
+    blocking client, only sending requests is asynchronous.
+
+    Attributes
+    ----------
+    http_client : httpx.AsyncClient, optional
+        Client used to send requests, see ``get_async_http_client``. When not
+        set, a client is opened for every request and closed after it.
+    """
+
+    http_client: Optional["httpx.AsyncClient"] = None
+
+    @contextlib.asynccontextmanager
+    async def _http(self) -> AsyncIterator["httpx.AsyncClient"]:
+        if self.http_client is not None:
+            yield self.http_client
+            return
+        async with get_async_http_client() as client:
+            yield client
+
+    async def _arequest(self, method: str, url: str, **kwargs: Any):
+        """Sends HTTP request, every async request of the client goes through here."""
+        archive = self.http_archive
+        if archive is not None and archive.replaying:
+            return self._from_archive(
+                archive.replay(method, url, kwargs.get("params"), kwargs.get("json"))
+            )
+        async with self._http() as client:
+            attempt = 0
+            while True:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire(url)
+                response = await client.request(method, url, **kwargs)
+                delay = self._retry_delay(url, response, attempt)
+                if delay is None:
+                    break
+                await response.aclose()
+                if self.rate_limiter is None:
+                    await asyncio.sleep(delay)
+                attempt += 1
+        if archive is not None:
+            archive.record(
+                self._to_archive(method, url, response),
+                kwargs.get("params"),
+                kwargs.get("json"),
+            )
+        return response
+
+    @staticmethod
+    def _from_archive(archived: ArchivedResponse) -> "httpx.Response":
+        """Builds response replayed from ``http_archive``."""
+        return httpx.Response(
+            archived.status_code,
+            headers=archived.headers,
+            content=archived.content,
+            request=httpx.Request(archived.method, archived.url),
+        )
+
+    async def _acoalesced(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits ``fn()``, or the call of the same key already in flight
+        in ``single_flight``."""
+        if self.single_flight is None:
+            return await fn()
+        return await self.single_flight.ado(self._flight_key(key), fn)
+
+    async def _aget_page(self, url: str) -> str:
+        """Returns body of the page at given url, see ``BaseClient._get_page``."""
+        return await self._acoalesced(
+            request_key("GET", url), lambda: self._aload_page(url)
+        )
+
+    async def _aload_page(self, url: str) -> str:
+        """Returns body of the page from ``page_cache`` or a (conditional) GET."""
+        cached = self._cached_page(url)
+        if cached is not None and cached.is_fresh(self.page_cache.ttl):
+            return cached.body
+        response = await self._arequest(
+            "GET", url, headers=cached.validators if cached is not None else None
+        )
+        return self._page_body(url, cached, response)
+
+    async def post_request(self, request_body: Dict):
+        """Posts a request to the ETFDB screener API, see ``BaseClient.post_request``."""
+        return await self._acoalesced(
+            request_key("POST", self._api_url, body=request_body),
+            lambda: self._arequest(
+                "POST", self._api_url, json=request_body, headers=get_headers()
+            ),
+        )
+
+    async def get_metadata(self) -> Dict:
+        """Gets the metadata for the ETFDB screener API, see
+        ``BaseClient.get_metadata``."""
+        try:
+            response = await self.post_request(self._prepare_request_body())
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(str(e))
+        return {}
+
+    async def _get_quotes(
+        self, ticker: str, interval="daily", periods=360, order="asc"
+    ) -> pd.DataFrame:
+        params = self._quotes_params(ticker, interval, periods, order)
+        response = await self._acoalesced(
+            request_key("GET", self._quotes_url, params=params),
+            lambda: self._arequest("GET", self._quotes_url, params=params),
+        )
+        return self._quotes_frame(response.text)
+
+
+class AsyncBaseClient(AsyncClientMixin, BaseClient):
+    """Async client of the etfdb screener and quotes APIs.
+
+    Parameters
+    ----------
+    http_client : httpx.AsyncClient, optional
+        Client used to send requests, see ``get_async_http_client``.
+    kwargs : Any
+        Additional keyword arguments passed to ``BaseClient``.
+    """
+
+    def __init__(self, http_client: Optional["httpx.AsyncClient"] = None, **kwargs):
+        _require_httpx()
+        super().__init__(**kwargs)
+        self.http_client = http_client
+
+
+class AsyncETFDBClient(AsyncClientMixin, ETFDBClient):
+    """Async client of ETF pages from etfdb.com.
+
+    The page is fetched with ``await prefetch()`` (or ``await load(...)``),
+    after that all sections are parsed by the ``ETFDBClient`` parsers.
+    Accessing sections before the page is fetched raises RuntimeError,
+    unless they are fresh in ``section_store``. Sections older than
+    ``cache_ttl`` aren't fetched again on access, that raises
+    ExpiredSectionException until ``await refresh()``.
+
+    Parameters
+    ----------
+    ticker : str
+        ETF symbol e.g. SPY.
+    http_client : httpx.AsyncClient, optional
+        Client used to send requests, see ``get_async_http_client``.
+    kwargs : Any
+        Additional keyword arguments passed to ``ETFDBClient``
+        e.g. ``sections`` or ``page_cache``.
+
+    Examples
+    --------
+    >>> etf = await AsyncETFDBClient.load("SPY")
+    >>> etf.extract_sections(["holdings"])
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        **kwargs,
+    ):
+        _require_httpx()
+        kwargs["lazy"] = True
+        super().__init__(ticker, **kwargs)
+        self.http_client = http_client
+
+    @classmethod
+    async def load(cls, ticker: str, **kwargs):
+        """Creates the client and fetches its page."""
+        return await cls(ticker, **kwargs).prefetch()
+
+    def _get_section(self, section: str) -> Any:
+        cached = self._sections_cache.get(section)
+        if (
+            cached is not None
+            and self.cache_ttl is not None
+            and time.monotonic() - cached[0] >= self.cache_ttl
+            and (
+                self.section_store is None
+                or self.section_store.get_fresh(self.ticker, section) is None
+            )
+        ):
+            raise ExpiredSectionException(
+                f"{section} of {self.ticker} expired, use await refresh() first"
+            )
+        return super()._get_section(section)
+
+    def _make_soup_request(self):
+        raise RuntimeError(
+            f"page of {self.ticker} isn't fetched yet, use await prefetch() first"
+        )
+
+    async def _fetch(self) -> None:
+        self._soup = await self._acoalesced(self._soup_key(), self._afetch_soup)
+
+    async def _afetch_soup(self):
+        html = await self._aget_page(self._prepare_url())
+        return await asyncio.to_thread(self._parse_page, html)
+
+    async def prefetch(self):
+        """Fetches and parses the ETF page, if it wasn't fetched yet and
+        requested sections aren't fresh in ``section_store``.
+
+        Parsing runs in a worker thread, so the event loop isn't blocked.
+
+        Returns
+        -------
+        AsyncETFDBClient
+            The client itself.
+        """
+        if self._page_soup is None and not self._all_sections_stored():
+            await self._fetch()
+        if self.low_memory and self._page_soup is not None:
+            await asyncio.to_thread(self.release_page)
+        return self
+
+    async def refresh(self):
+        """Drops cached page and parsed sections, and fetches the page again."""
+        self._sections_cache.clear()
+        self._soup = None
+        await self._fetch()
+        if self.low_memory:
+            await asyncio.to_thread(self.release_page)
+        return self
@@ -1,11 +1,30 @@
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
 
 import pandas as pd
 import requests
 from requests import HTTPError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 
+from etfpy.client._http_archive import ArchivedResponse, HTTPArchive
+from etfpy.client._page_cache import CachedPage, PageCache
+from etfpy.client._rate_limit import (
+    THROTTLED,
+    RateLimiter,
+    RetryPolicy,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from etfpy.client._session_pool import get_session_pool
+from etfpy.client._single_flight import (
+    SingleFlight,
+    T,
+    get_single_flight,
+    request_key,
+)
 from etfpy.log import get_logger
-from etfpy.utils import get_headers, get_retry_session
+from etfpy.utils import get_headers
 
 logger = get_logger(__name__)
 
@@ -15,6 +34,11 @@ class BaseClient:
 
     Parameters
     ----------
+    session: requests.Session, optional
+        Session used to make all requests. By default all clients share the
+        session of the process-wide ``SessionPool``, so connections are reused
+        between them. The pooled session is looked up on every request, so
+        clients follow the pool when it's closed or reset after fork.
     kwargs: Any
         Additional keyword arguments to pass to the client.
 
@@ -24,17 +48,42 @@ class BaseClient:
         The base URL for the etfdb API.
     _api_url: str
         The URL for the etfdb screener API.
-    _request_session: requests.Session
-        A session object used to make all requests.
+    _requests_session: requests.Session
+        A session object used to make all requests, the pooled one unless
+        a session was passed (or assigned here).
+    page_cache: PageCache, optional
+        Disk cache of fetched pages, see ``PageCache``. Pages are always
+        downloaded if not set.
+    rate_limiter: RateLimiter, optional
+        Limits the rate of all requests and pauses hosts that throttle them,
+        see ``RateLimiter``. The process-wide limiter by default, set it to
+        None to send requests without limits.
+    retry_policy: RetryPolicy, optional
+        Retries throttled (429 and 5xx) requests, see ``RetryPolicy``, with or
+        without ``rate_limiter``. Set it to None to never retry them.
+    single_flight: SingleFlight, optional
+        Shares one request between concurrent identical page, screener and
+        quotes requests, see ``SingleFlight``. Only clients with the same
+        ``page_cache``, ``http_archive``, session and ``rate_limiter`` share
+        requests. The process-wide one by default, set it to None to send
+        every request.
+    http_archive: HTTPArchive, optional
+        Records all responses to, or replays them from, a local archive,
+        see ``HTTPArchive``. Requests go to the network if not set.
     """
 
-    def __init__(self, **kwargs: Any):
+    def __init__(self, session: Optional[requests.Session] = None, **kwargs: Any):
         self._base_url = "https://etfdb.com"
         self._api_url = f"{self._base_url}/api/screener/"
         self._quotes_url = (
             "https://etfflows.websol.barchart.com/proxies/timeseries/queryeod.ashx"
         )
-        self._requests_session = get_retry_session()
+        self._pinned_session: Optional[requests.Session] = session
+        self.page_cache: Optional[PageCache] = None
+        self.rate_limiter: Optional[RateLimiter] = get_rate_limiter()
+        self.retry_policy: Optional[RetryPolicy] = RetryPolicy()
+        self.single_flight: Optional[SingleFlight] = get_single_flight()
+        self.http_archive: Optional[HTTPArchive] = None
 
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -42,7 +91,264 @@ class BaseClient:
     @property
     def _session(self) -> requests.Session:
         """Returns the request session object."""
-        return self._requests_session
+        if self._pinned_session is not None:
+            return self._pinned_session
+        return get_session_pool().session
+
+    @property
+    def _requests_session(self) -> requests.Session:
+        return self._session
+
+    @_requests_session.setter
+    def _requests_session(self, session: requests.Session) -> None:
+        self._pinned_session = session
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Sends HTTP request, every request of the client goes through here.
+
+        The request waits for ``rate_limiter`` and is sent again while the
+        server throttles it, up to ``retry_policy.max_retries`` times.
+        With ``http_archive`` set, the response is recorded to the archive,
+        or taken from it without sending the request when replaying.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method e.g. GET.
+        url: str
+            Requested url.
+        kwargs: Any
+            Additional keyword arguments passed to ``requests.Session.request``.
+
+        Returns
+        -------
+        requests.Response
+            The response object.
+        """
+        archive = self.http_archive
+        if archive is not None and archive.replaying:
+            return self._from_archive(
+                archive.replay(method, url, kwargs.get("params"), kwargs.get("json"))
+            )
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            response = self._session.request(method, url, **kwargs)
+            delay = self._retry_delay(url, response, attempt)
+            if delay is None:
+                break
+            # release the connection of a streamed response before retrying
+            response.close()
+            if self.rate_limiter is None:
+                time.sleep(delay)
+            attempt += 1
+        if archive is not None:
+            archive.record(
+                self._to_archive(method, url, response),
+                kwargs.get("params"),
+                kwargs.get("json"),
+            )
+        return response
+
+    @staticmethod
+    def _to_archive(method: str, url: str, response) -> ArchivedResponse:
+        """Converts response of given request to be stored in ``http_archive``."""
+        return ArchivedResponse(
+            method.upper(),
+            url,
+            response.status_code,
+            getattr(response, "reason", None) or getattr(response, "reason_phrase", ""),
+            dict(response.headers),
+            response.content,
+        )
+
+    @staticmethod
+    def _from_archive(archived: ArchivedResponse) -> requests.Response:
+        """Builds response replayed from ``http_archive``."""
+        response = requests.Response()
+        response.status_code = archived.status_code
+        response.reason = archived.reason
+        response.headers = CaseInsensitiveDict(archived.headers)
+        response.url = archived.url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = archived.content
+        response._content_consumed = True
+        return response
+
+    def _retry_delay(self, url: str, response, attempt: int) -> Optional[float]:
+        """Reports the response to ``rate_limiter`` and returns number of
+        seconds to wait before sending the request again, or None if it
+        shouldn't be sent again.
+
+        With ``rate_limiter`` the wait is spent in ``rate_limiter.acquire``,
+        which pauses the throttled host for all clients."""
+        status_code, policy = response.status_code, self.retry_policy
+        delay = 0.0
+        if status_code in THROTTLED:
+            delay = (
+                policy.wait(response.headers, attempt)
+                if policy is not None
+                else parse_retry_after(response.headers.get("Retry-After")) or 0.0
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.report(url, status_code, delay)
+        if policy is None or not policy.should_retry(status_code, attempt):
+            return None
+        logger.warning("%s responded %s, retrying (%d)", url, status_code, attempt + 1)
+        return delay
+
+    def _flight_key(self, key: Hashable) -> Hashable:
+        """Adds the client's ``page_cache``, ``http_archive``, pinned session
+        and ``rate_limiter`` to the ``single_flight`` key.
+
+        Only clients sending requests the same way share a call, so every
+        caller's page cache is filled and archive recorded, and a response
+        never comes from another session or request budget."""
+        archive = self.http_archive
+        return (
+            key,
+            id(self.page_cache),
+            None if archive is None else (id(archive), archive.mode),
+            id(self._pinned_session),
+            id(self.rate_limiter),
+        )
+
+    def _coalesced(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Runs ``fn``, or waits for the call of the same key already in
+        flight in ``single_flight``."""
+        if self.single_flight is None:
+            return fn()
+        return self.single_flight.do(self._flight_key(key), fn)
+
+    @staticmethod
+    def _loaded(response):
+        """Reads the whole response body, so a response shared by coalesced
+        callers is never read by two of them at once."""
+        response.content
+        return response
+
+    def _get_page(self, url: str) -> str:
+        """Returns body of the page at given url.
+
+        With ``page_cache`` set, a cached page is returned without a request
+        while it's fresh. A stale page is revalidated with a conditional GET,
+        and a ``304 Not Modified`` response serves the cached body without
+        downloading it again. Concurrent calls for the same url share one
+        request.
+
+        Parameters
+        ----------
+        url: str
+            Page url.
+
+        Returns
+        -------
+        str
+            Page body.
+
+        Raises
+        ------
+        Exception
+            If the response status is neither 200 nor 304.
+        """
+        return self._coalesced(request_key("GET", url), lambda: self._load_page(url))
+
+    def _load_page(self, url: str) -> str:
+        """Returns body of the page from ``page_cache`` or a (conditional) GET."""
+        cached = self._cached_page(url)
+        if cached is not None and cached.is_fresh(self.page_cache.ttl):
+            return cached.body
+        response = self._request(
+            "GET", url, headers=cached.validators if cached is not None else None
+        )
+        return self._page_body(url, cached, response)
+
+    def _cached_page(self, url: str) -> Optional[CachedPage]:
+        """Returns page of given url from ``page_cache``, fresh or stale."""
+        return self.page_cache.get(url) if self.page_cache is not None else None
+
+    def _page_body(self, url: str, cached: Optional[CachedPage], response) -> str:
+        """Returns page body from the response of a (conditional) page GET,
+        and stores it in ``page_cache``.
+
+        Raises
+        ------
+        Exception
+            If the response status is neither 200 nor 304.
+        """
+        if response.status_code == 304 and cached is not None:
+            logger.debug("%s not modified, serving cached page", url)
+            return self.page_cache.touch(cached).body
+        self._check_page_status(response)
+        if self.page_cache is not None:
+            self.page_cache.put(
+                url,
+                response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return response.text
+
+    @staticmethod
+    def _check_page_status(response) -> None:
+        """Raises Exception if the page response status isn't 200."""
+        if response.status_code != 200:
+            reason = getattr(response, "reason", None) or getattr(
+                response, "reason_phrase", ""
+            )
+            raise Exception(f"response {response.status_code}: {reason}")
+
+    def _stream_page(self, url: str, chunk_size: int = 65536) -> Iterator[str]:
+        """Yields decoded chunks of the page at given url as they arrive.
+
+        The connection is released when the generator is closed, so the rest
+        of the body isn't downloaded if the caller stops early. A fresh page
+        from ``page_cache`` is yielded whole, a completely read page is stored
+        in it. Streamed requests are not shared by ``single_flight``.
+
+        Parameters
+        ----------
+        url: str
+            Page url.
+        chunk_size: int, default=65536
+            Number of bytes read at once.
+
+        Raises
+        ------
+        Exception
+            If the response status is neither 200 nor 304.
+        """
+        cached = self._cached_page(url)
+        if cached is not None and cached.is_fresh(self.page_cache.ttl):
+            yield cached.body
+            return
+        response = self._request(
+            "GET",
+            url,
+            headers=cached.validators if cached is not None else None,
+            stream=True,
+        )
+        try:
+            if response.status_code == 304 and cached is not None:
+                yield self.page_cache.touch(cached).body
+                return
+            self._check_page_status(response)
+            response.encoding = response.encoding or "utf-8"
+            chunks = []
+            for chunk in response.iter_content(chunk_size, decode_unicode=True):
+                if self.page_cache is not None:
+                    chunks.append(chunk)
+                yield chunk
+            if self.page_cache is not None:
+                self.page_cache.put(
+                    url,
+                    "".join(chunks),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+        finally:
+            response.close()
 
     @staticmethod
     def _prepare_request_body(
@@ -83,6 +389,9 @@ class BaseClient:
     def post_request(self, request_body: Dict) -> requests.Response:
         """Posts a request to the ETFDB screener API.
 
+        Concurrent identical requests get the same response object from
+        ``single_flight``, don't modify it.
+
         Parameters
         ----------
         request_body: Dict
@@ -93,8 +402,13 @@ class BaseClient:
         requests.Response
             The response object.
         """
-        return self._session.post(
-            self._api_url, json=request_body, headers=get_headers()
+        return self._coalesced(
+            request_key("POST", self._api_url, body=request_body),
+            lambda: self._loaded(
+                self._request(
+                    "POST", self._api_url, json=request_body, headers=get_headers()
+                )
+            ),
         )
 
     def get_metadata(self) -> Dict:
@@ -103,7 +417,8 @@ class BaseClient:
         Returns
         -------
         Dict
-            The metadata dictionary.
+            The metadata dictionary, decoded for every caller, so callers
+            sharing one response with ``single_flight`` get their own copies.
         """
 
         try:
@@ -114,7 +429,9 @@ class BaseClient:
             logger.error(str(ae))
         return {}
 
-    def _get_quotes(self, ticker: str, interval="daily", periods=360, order="asc"):
+    @staticmethod
+    def _quotes_params(ticker: str, interval="daily", periods=360, order="asc") -> Dict:
+        """Prepares query parameters of a quotes request."""
         assert interval in [
             "monthly",
             "daily",
@@ -127,7 +444,7 @@ class BaseClient:
             )
             order = "asc"
 
-        query_params = {
+        return {
             "symbol": ticker,
             "data": interval,
             "maxrecords": periods,
@@ -139,11 +456,12 @@ class BaseClient:
             "contractroll": "expiration",
         }
 
-        r = self._session.get(self._quotes_url, params=query_params)
-
+    @staticmethod
+    def _quotes_frame(text: str) -> pd.DataFrame:
+        """Converts csv body of a quotes response to a DataFrame."""
         headers = ["symbol", "date", "open", "high", "low", "close", "volume"]
         try:
-            data = list(x.split(",") for x in r.text.split("\n") if len(x) > 1)
+            data = list(x.split(",") for x in text.split("\n") if len(x) > 1)
         except (AttributeError, TypeError) as ate:
             logger.error("couldn't convert response do dataframe: %s", str(ate))
             return pd.DataFrame(columns=headers)
@@ -161,3 +479,13 @@ class BaseClient:
         )
         df["date"] = pd.to_datetime(df["date"]).dt.date
         return df
+
+    def _get_quotes(self, ticker: str, interval="daily", periods=360, order="asc"):
+        query_params = self._quotes_params(ticker, interval, periods, order)
+        r = self._coalesced(
+            request_key("GET", self._quotes_url, params=query_params),
+            lambda: self._loaded(
+                self._request("GET", self._quotes_url, params=query_params)
+            ),
+        )
+        return self._quotes_frame(r.text)
@@ -0,0 +1,266 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from etfpy.log import get_logger
+from etfpy.utils import atomic_write
+
+logger = get_logger(__name__)
+
+# Binary layout of the columnar catalog (all integers little-endian):
+#
+#   header     : magic (4s) | version (H) | number of columns (H) | number of rows (I)
+#   directory  : per column -> name (32s) | kind (B) | data offset (Q) | data size (Q)
+#   data       : column blocks, each one aligned to 8 bytes
+#
+# String columns are stored as ``rows + 1`` uint32 offsets followed by one
+# UTF-8 blob, numeric columns as float64 arrays and the symbol index as an
+# uint32 permutation of rows sorted by symbol.
+CATALOG_MAGIC = b"ETFC"
+CATALOG_VERSION = 2
+
+_HEADER = struct.Struct("<4sHHI")
+_COLUMN = struct.Struct("<32sBQQ")
+
+_STRING, _FLOAT, _INDEX = 0, 1, 2
+_SYMBOL_INDEX = "__symbol_index__"
+
+STRING_COLUMNS = (
+    "symbol",
+    "asset_class",
+    "price",
+    "average_volume",
+    "name",
+    "url",
+    "one_year_return",
+)
+NUMERIC_COLUMNS = {
+    "price_value": "price",
+    "average_volume_value": "average_volume",
+    "one_year_return_value": "one_year_return",
+}
+FRAME_COLUMNS = ("symbol", "asset_class", "name", "url")
+
+
+def parse_catalog_number(value: Optional[str]) -> float:
+    """Parses catalog strings like ``$523.07``, ``75,663,711`` or ``10.39%``.
+
+    Returns NaN for missing values or values like ``N/A``.
+    """
+    if value is None:
+        return np.nan
+    try:
+        return float(str(value).replace("$", "").replace(",", "").replace("%", ""))
+    except ValueError:
+        return np.nan
+
+
+def _unique_records(records: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+    seen = set()
+    unique = []
+    for record in records:
+        symbol = (record.get("symbol") or "").upper()
+        if symbol and symbol not in seen:
+            seen.add(symbol)
+            unique.append(record)
+    return unique
+
+
+def _string_block(values: List[str]) -> bytes:
+    encoded = [(v or "").encode("utf8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets.tobytes() + b"".join(encoded)
+
+
+def write_columnar_catalog(records: Iterable[Dict[str, str]], file_path: str) -> int:
+    """Writes catalog records to a compact binary columnar file.
+
+    Parameters
+    ----------
+    records : Iterable[Dict[str, str]]
+        Catalog records as produced by ``ETFListScraper``. Duplicated symbols
+        are dropped, the first record wins.
+    file_path : str
+        Path of the output file.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    rows = _unique_records(records)
+    blocks = {
+        name: (_STRING, _string_block([r.get(name) for r in rows]))
+        for name in STRING_COLUMNS
+    }
+    for name, source in NUMERIC_COLUMNS.items():
+        values = np.array([parse_catalog_number(r.get(source)) for r in rows], "<f8")
+        blocks[name] = (_FLOAT, values.tobytes())
+    order = sorted(range(len(rows)), key=lambda i: rows[i]["symbol"].upper())
+    blocks[_SYMBOL_INDEX] = (_INDEX, np.array(order, dtype="<u4").tobytes())
+
+    offset = _HEADER.size + _COLUMN.size * len(blocks)
+    directory, data = [], []
+    for name, (kind, block) in blocks.items():
+        if len(name) > 32:
+            raise ValueError(f"column name too long: {name}")
+        padding = -offset % 8
+        data.append(b"\0" * padding + block)
+        offset += padding
+        directory.append(_COLUMN.pack(name.encode("ascii"), kind, offset, len(block)))
+        offset += len(block)
+
+    with atomic_write(file_path, "wb") as f:
+        f.write(_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(blocks), len(rows)))
+        f.write(b"".join(directory))
+        f.write(b"".join(data))
+    return len(rows)
+
+
+class ColumnarCatalog:
+    """Read-only, memory-mapped view over a binary columnar ETF catalog.
+
+    Exposes the same lookup interface as ``ETFUniverse``. Nothing is
+    materialized up front: symbol lookups binary search the symbol index and
+    decode only the rows they hit, and numeric columns are zero-copy NumPy
+    views over the mapped file, so processes mapping the same file share
+    its pages.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to a catalog written by ``write_columnar_catalog``.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a columnar catalog or has an unsupported version.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_columns, n_rows = (
+            _HEADER.unpack_from(self._mmap, 0)
+            if len(self._mmap) >= _HEADER.size
+            else (None, None, 0, 0)
+        )
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{file_path} is not a supported ETF catalog file")
+        self._rows = n_rows
+        self._columns = {}
+        for i in range(n_columns):
+            name, kind, offset, size = _COLUMN.unpack_from(
+                self._mmap, _HEADER.size + i * _COLUMN.size
+            )
+            self._columns[name.rstrip(b"\0").decode("ascii")] = (kind, offset, size)
+        self._order = self._array(_SYMBOL_INDEX, "<u4")
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._string("symbol", row) for row in range(self._rows))
+
+    def __contains__(self, symbol) -> bool:
+        return isinstance(symbol, str) and self._find(symbol) is not None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(etfs={len(self)})"
+
+    @property
+    def columns(self) -> List[str]:
+        """Returns names of the data columns stored in the catalog."""
+        return [c for c in self._columns if c != _SYMBOL_INDEX]
+
+    @property
+    def symbols(self) -> List[str]:
+        """Returns all symbols in catalog order."""
+        return list(self)
+
+    def _array(self, name: str, dtype: str) -> np.ndarray:
+        _, offset, size = self._columns[name]
+        count = size // np.dtype(dtype).itemsize
+        return np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+
+    def _string(self, name: str, row: int) -> str:
+        _, offset, _ = self._columns[name]
+        start, end = struct.unpack_from("<II", self._mmap, offset + 4 * row)
+        blob = offset + 4 * (self._rows + 1)
+        return self._mmap[blob + start : blob + end].decode("utf8")
+
+    def _find(self, symbol: str) -> Optional[int]:
+        symbol = symbol.upper()
+        lo, hi = 0, self._rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = int(self._order[mid])
+            current = self._string("symbol", row).upper()
+            if current == symbol:
+                return row
+            if current < symbol:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def column(self, name: str):
+        """Returns a whole column.
+
+        Numeric columns are returned as read-only float64 arrays backed by the
+        mapped file, string columns as a list of decoded strings.
+        """
+        kind = self._columns[name][0]
+        if kind == _FLOAT:
+            return self._array(name, "<f8")
+        if kind == _STRING:
+            return [self._string(name, row) for row in range(self._rows)]
+        raise KeyError(name)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the catalog as a DataFrame with numeric price, volume and
+        return columns, as parsed at catalog build time."""
+        data = {name: self.column(name) for name in FRAME_COLUMNS}
+        data.update({s: self.column(n) for n, s in NUMERIC_COLUMNS.items()})
+        return pd.DataFrame(data, columns=list(STRING_COLUMNS))
+
+    def get(self, symbol: str, default=None) -> Optional[Dict[str, str]]:
+        """Returns the catalog record for given symbol, or ``default``."""
+        row = self._find(symbol)
+        if row is None:
+            return default
+        return {name: self._string(name, row) for name in STRING_COLUMNS}
+
+    def asset_class(self, symbol: str) -> Optional[str]:
+        """Returns the asset class for given symbol, or None if unknown."""
+        row = self._find(symbol)
+        return self._string("asset_class", row) if row is not None else None
+
+    def close(self) -> None:
+        """Unmaps the catalog file."""
+        self._order = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            logger.debug("catalog %s still has exported views", self.file_path)
+
+
+def records_to_frame(records: Iterable[Dict[str, str]]) -> pd.DataFrame:
+    """Builds a catalog DataFrame from records, parsing price, volume
+    and return strings into float columns."""
+    df = pd.DataFrame(list(records), columns=list(STRING_COLUMNS))
+    for column in NUMERIC_COLUMNS.values():
+        df[column] = df[column].map(parse_catalog_number).astype("float64")
+    return df
+
+
+def columnar_path_for(json_path: str) -> str:
+    """Returns the columnar catalog path that belongs to a json catalog."""
+    return os.path.splitext(json_path)[0] + ".bin"
@@ -1,5 +1,7 @@
 import itertools
-from typing import Any, Dict, Generator, List
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Optional
 
 from requests.exceptions import ConnectionError, Timeout
 
@@ -58,6 +60,35 @@ class ETFListScraper(BaseClient):
         for etf in etfs:
             yield self._parse_etf_record(etf)
 
+    def _fetch_page(self, page: int, page_size=250) -> Dict[str, Any]:
+        """Fetches a page of the ETFDB screener, including its meta block.
+
+        Parameters
+        ----------
+        page: int
+            The page number to fetch.
+        page_size: int, default=250
+            The number of ETFs to fetch per page.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The screener response with ``meta`` and ``data`` keys,
+            or an empty dictionary if the request failed.
+
+        """
+        logger.debug("getting data for page: %s with page_size: %s", page, page_size)
+        request_body = self._prepare_request_body(page=page, page_size=page_size)
+        try:
+            response = self.post_request(request_body).json()
+            if isinstance(response, dict):
+                return response
+        except (ConnectionError, Timeout) as e:
+            logger.error("connection timeout: %s", str(e))
+        except (AttributeError, ValueError) as e:
+            logger.error("another exception happened: %s", str(e))
+        return {}
+
     def _scrape_page(self, page: int, page_size=250) -> List[Dict[Any, Any]]:
         """Scrapes a page of ETFs from the ETFDB API.
 
@@ -71,58 +102,122 @@ class ETFListScraper(BaseClient):
         Returns
         -------
         List[dict]
-            A list of ETF records.
-
-        Raises
-        ------
-        ConnectionError
-            If there is a connection error.
-        Timeout
-            If the request times out.
+            A list of ETF records, empty if the request failed.
 
         """
-        logger.debug("getting data for page: %s with page_size: %s", page, page_size)
-        request_body = self._prepare_request_body(page=page, page_size=page_size)
         try:
-            return self.post_request(request_body).json()["data"]
-        except (ConnectionError, Timeout) as e:
-            logger.error("connection timeout: %s", str(e))
-        except (AttributeError, KeyError) as e:
+            return self._fetch_page(page, page_size)["data"]
+        except KeyError as e:
             logger.error("another exception happened: %s", str(e))
         return []
 
+    @staticmethod
+    def _count_pages(meta: Optional[Dict[str, Any]], page_size: int) -> Optional[int]:
+        """Computes the number of screener pages from the response meta block.
+
+        Returns None when the meta block doesn't carry the total number of records.
+        """
+        try:
+            total = int(meta["total_records"])
+        except (TypeError, KeyError, ValueError):
+            return None
+        return max(1, math.ceil(total / page_size))
+
+    def _scrape_required_page(
+        self, page: int, page_size=250, retries: int = 2
+    ) -> List[Dict[Any, Any]]:
+        """Scrapes a page known to exist, retrying it if it comes back empty.
+
+        Raises
+        ------
+        ConnectionError
+            If the page is still empty after all retries, a skipped page
+            would silently drop its ETFs from the catalog.
+        """
+        for attempt in range(retries + 1):
+            etfs = self._scrape_page(page, page_size)
+            if etfs:
+                return etfs
+            logger.warning(
+                "page %s returned no ETFs (attempt %s/%s)",
+                page,
+                attempt + 1,
+                retries + 1,
+            )
+        raise ConnectionError(
+            f"page {page} returned no ETFs after {retries + 1} attempts"
+        )
+
     def get_etfs(
-        self, page_size: int = 250
+        self, page_size: int = 250, max_workers: int = 8
     ) -> Generator[List[Dict[str, Any]], None, None]:
         """Scrapes all ETFs from the ETFDB API.
 
+        The first page tells the total number of records, remaining pages are
+        then fetched concurrently and yielded in page order. Pages within the
+        total that come back empty are retried, see ``_scrape_required_page``.
+        If the total is unknown, pages are fetched one by one until an empty
+        page comes back.
+
         Parameters
         ----------
         page_size: int, default=250
             The number of ETFs to scrape per page.
+        max_workers: int, default=8
+            The maximum number of pages fetched at the same time.
 
         Yields
         ------
         List[Dict[str, Any]]
             A list of parsed ETF records.
 
-        """
-        page = 1
-        while True:
-            etfs = self._scrape_page(page, page_size)
-            if not etfs:
-                break
-            yield list(self._prepare_etfs_list(etfs))
-            page += 1
-
+        Raises
+        ------
+        ConnectionError
+            If a page within the known total can't be fetched.
 
-def get_all_etfs(page_size: int = 250) -> List[Dict[str, Any]]:
+        """
+        first_page = self._fetch_page(1, page_size)
+        etfs = first_page.get("data")
+        if not etfs:
+            return
+        yield list(self._prepare_etfs_list(etfs))
+
+        pages = self._count_pages(first_page.get("meta"), page_size)
+        if pages is None:
+            page = 2
+            while True:
+                etfs = self._scrape_page(page, page_size)
+                if not etfs:
+                    break
+                yield list(self._prepare_etfs_list(etfs))
+                page += 1
+            return
+        if max_workers <= 1:
+            for page in range(2, pages + 1):
+                etfs = self._scrape_required_page(page, page_size)
+                yield list(self._prepare_etfs_list(etfs))
+            return
+
+        logger.debug("fetching %s pages with %s workers", pages, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda p: self._scrape_required_page(p, page_size),
+                range(2, pages + 1),
+            )
+            for etfs in results:
+                yield list(self._prepare_etfs_list(etfs))
+
+
+def get_all_etfs(page_size: int = 250, max_workers: int = 8) -> List[Dict[str, Any]]:
     """Scrapes all ETFs from the ETFDB API and returns them as a list.
 
     Parameters
     ----------
     page_size: int, default=250
         The number of ETFs to scrape per page.
+    max_workers: int, default=8
+        The maximum number of pages fetched at the same time.
 
     Returns
     -------
@@ -131,5 +226,5 @@ def get_all_etfs(page_size: int = 250) -> List[Dict[str, Any]]:
 
     """
 
-    etfs_gen = ETFListScraper().get_etfs(page_size)
+    etfs_gen = ETFListScraper().get_etfs(page_size, max_workers)
     return list(itertools.chain(*etfs_gen))
@@ -0,0 +1,142 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+import bs4
+
+
+class Container(NamedTuple):
+    """Element of ETF page holding the data of one or more sections.
+
+    Matched like ``soup.find(tag, {attr: value})``: a class container matches
+    either one of the element classes or the whole class attribute.
+    ``subtree`` is a CSS selector of the only descendant the section parsers
+    read, so parser backends may drop the rest of the container.
+    ``max_count`` is the number of first elements of a ``many`` container
+    the section parsers read, so a streamed page may stop after them.
+    """
+
+    tag: str
+    attr: str
+    value: str
+    many: bool = False
+    subtree: Optional[str] = None
+    max_count: Optional[int] = None
+
+
+CONTAINERS = {
+    "etf_ticker_body": Container("div", "id", "etf-ticker-body", subtree="div.row"),
+    "profile": Container("div", "class", "profile-container"),
+    "trading": Container("div", "class", "data-trading bar-charts-table"),
+    "ticker_assets": Container("div", "class", "ticker-assets", many=True, max_count=2),
+    "factset": Container("div", "id", "factset-classification"),
+    "holdings_table": Container("table", "id", "holdings-table"),
+    "size_table": Container("table", "id", "size-table"),
+    "valuation_tab": Container("div", "id", "etf-ticker-valuation-dividend_tab"),
+    "dividend_table": Container("div", "id", "dividend-table"),
+    "holding_section": Container("div", "id", "holding_section"),
+    "performance": Container("div", "id", "performance-collapse"),
+    "technicals": Container("div", "id", "technicals-collapse"),
+    "charts": Container("table", "class", "chart base-table", many=True),
+}
+
+# section name -> containers its parser reads
+SECTION_CONTAINERS = {
+    "info": (
+        "etf_ticker_body",
+        "profile",
+        "valuation_tab",
+        "trading",
+        "ticker_assets",
+        "factset",
+    ),
+    "holdings": ("holding_section",),
+    "asset_categories": ("ticker_assets",),
+    "holding_statistics": ("holdings_table",),
+    "exposure": ("charts",),
+    "volatility": ("technicals",),
+    "technicals": ("technicals",),
+    "performance": ("performance",),
+    "dividends": ("dividend_table",),
+}
+
+Located = Dict[str, Union[bs4.Tag, List[bs4.Tag], None]]
+
+
+def _matches_class(classes, value: str) -> bool:
+    if not classes:
+        return False
+    if isinstance(classes, str):
+        classes = classes.split()
+    return value in classes or " ".join(classes) == value
+
+
+def matches_container(name: str, tag_name: str, attrs) -> bool:
+    """Checks whether an element with given tag name and attributes
+    is the container of given name."""
+    container = CONTAINERS[name]
+    if container.tag != tag_name:
+        return False
+    if container.attr == "id":
+        return attrs.get("id") == container.value
+    return _matches_class(attrs.get("class"), container.value)
+
+
+def containers_for(sections: Iterable[str]) -> List[str]:
+    """Returns names of containers the parsers of given sections read."""
+    names = []
+    for section in sections:
+        for name in SECTION_CONTAINERS[section]:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def locate_containers(root: bs4.Tag, names: Optional[Iterable[str]] = None) -> Located:
+    """Finds section containers in a single walk over the document.
+
+    Parameters
+    ----------
+    root : bs4.Tag
+        Parsed document (or part of it) to search.
+    names : Iterable[str], optional
+        Names of containers from ``CONTAINERS`` to find, all by default.
+
+    Returns
+    -------
+    Dict[str, Union[bs4.Tag, List[bs4.Tag], None]]
+        First matching element for every container (None if missing),
+        or a list of all matching elements for containers with ``many=True``.
+    """
+    names = list(CONTAINERS) if names is None else list(names)
+    found: Located = {n: [] if CONTAINERS[n].many else None for n in names}
+    by_id: Dict[str, List[str]] = {}
+    by_class: Dict[str, List[str]] = {}
+    for name in names:
+        container = CONTAINERS[name]
+        if container.attr == "id":
+            by_id.setdefault(container.value, []).append(name)
+        else:
+            by_class.setdefault(container.tag, []).append(name)
+
+    missing = sum(1 for n in names if not CONTAINERS[n].many)
+    walk_to_end = any(CONTAINERS[n].many for n in names)
+    for node in root.descendants:
+        if not isinstance(node, bs4.Tag):
+            continue
+        candidates = list(by_id.get(node.get("id"), ()))
+        candidates += [
+            name
+            for name in by_class.get(node.name, ())
+            if _matches_class(node.get("class"), CONTAINERS[name].value)
+        ]
+        for name in candidates:
+            container = CONTAINERS[name]
+            if container.tag != node.name:
+                continue
+            if container.many:
+                found[name].append(node)
+            elif found[name] is None:
+                found[name] = node
+                missing -= 1
+        if not missing and not walk_to_end:
+            break
+    return found
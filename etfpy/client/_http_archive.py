@@ -0,0 +1,155 @@
+import base64
+import gzip
+import json
+import os
+import threading
+from typing import IO, Dict, NamedTuple, Optional, Tuple
+
+from etfpy.client._single_flight import request_key
+from etfpy.exc import NotArchivedException
+from etfpy.log import get_logger
+
+logger = get_logger(__name__)
+
+MODES = ("record", "replay")
+
+# the archive stores decoded bodies, so transfer headers of the original
+# response would make clients decode them again
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class ArchivedResponse(NamedTuple):
+    """Response stored in ``HTTPArchive``."""
+
+    method: str
+    url: str
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    content: bytes
+
+    def to_record(self) -> Dict:
+        record = self._asdict()
+        record["content"] = base64.b64encode(self.content).decode("ascii")
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "ArchivedResponse":
+        record = dict(record)
+        record["content"] = base64.b64decode(record["content"])
+        return cls(**record)
+
+
+class HTTPArchive:
+    """Gzip-compressed archive of HTTP responses, recorded from live requests
+    and replayed without network access.
+
+    In ``record`` mode every response received by clients using the archive
+    is appended to the file as one json line in its own gzip member, so the
+    archive stays readable even if the process dies while recording. In
+    ``replay`` mode clients send no requests, every request is answered
+    byte-for-byte with the last response recorded for the same method, url,
+    query parameters and json body.
+
+    Parameters
+    ----------
+    path : str
+        Path to the archive file e.g. ``crawl.har.gz``.
+    mode : str, default="replay"
+        ``record`` or ``replay``.
+
+    Examples
+    --------
+    >>> archive = HTTPArchive("spy.har.gz", mode="record")
+    >>> ETF("SPY", http_archive=archive).to_dict()
+    >>> archive.close()
+    >>> ETF("SPY", http_archive=HTTPArchive("spy.har.gz")).to_dict()  # offline
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"mode needs to be one of: {MODES}")
+        self.path = os.path.expanduser(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._responses: Optional[Dict[Tuple, ArchivedResponse]] = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path}, mode={self.mode})"
+
+    @property
+    def replaying(self) -> bool:
+        """Whether requests are answered from the archive."""
+        return self.mode == "replay"
+
+    def record(
+        self,
+        response: ArchivedResponse,
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None,
+    ) -> None:
+        """Appends the response of a request with given query parameters
+        and json body to the archive."""
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in _TRANSFER_HEADERS
+        }
+        record = response._replace(headers=headers).to_record()
+        record = {"params": params, "body": body, "response": record}
+        member = gzip.compress(json.dumps(record, default=str).encode("utf8") + b"\n")
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(member)
+            self._file.flush()
+
+    def _load(self) -> Dict[Tuple, ArchivedResponse]:
+        responses = {}
+        try:
+            with gzip.open(self.path, "rt", encoding="utf8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    response = ArchivedResponse.from_record(record["response"])
+                    key = request_key(
+                        response.method, response.url, record["params"], record["body"]
+                    )
+                    responses[key] = response
+        except FileNotFoundError:
+            logger.warning("http archive %s doesn't exist", self.path)
+        except EOFError:
+            logger.warning("http archive %s is truncated", self.path)
+        return responses
+
+    def replay(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None,
+    ) -> ArchivedResponse:
+        """Returns the response recorded for given request.
+
+        Raises
+        ------
+        NotArchivedException
+            If the request wasn't recorded.
+        """
+        if self._responses is None:
+            with self._lock:
+                if self._responses is None:
+                    self._responses = self._load()
+        try:
+            return self._responses[request_key(method, url, params, body)]
+        except KeyError:
+            raise NotArchivedException(
+                f"{method} {url} is not in http archive {self.path}"
+            ) from None
+
+    def close(self) -> None:
+        """Closes the archive file, recorded responses are flushed already."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,143 @@
+import contextlib
+import hashlib
+import json
+import os
+import time
+from typing import Iterator, NamedTuple, Optional
+
+from etfpy.log import get_logger
+from etfpy.utils import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+class CachedPage(NamedTuple):
+    """Page body stored in ``PageCache`` with its validators."""
+
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Checks whether the page was fetched or revalidated less than ``ttl`` seconds ago."""
+        return time.time() - self.fetched_at < ttl
+
+    @property
+    def validators(self) -> dict:
+        """Returns headers of a conditional GET revalidating the page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Disk cache of fetched pages keyed by url, shared between processes.
+
+    Every page is stored in one file: a json header line with url, ``ETag``
+    and ``Last-Modified`` followed by the page body, the file modification
+    time is the time the page was last fetched or revalidated. Files are
+    written to a temporary file and renamed over the entry, so readers never
+    see partial entries and need no lock. Writers of the same entry are
+    serialized with an exclusive ``flock`` on a lock file next to it.
+
+    Parameters
+    ----------
+    directory : str
+        Cache directory, created if it doesn't exist.
+    ttl : float, default=3600
+        Number of seconds an entry is served without asking the server.
+        Stale entries are revalidated with a conditional GET.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory={self.directory}, ttl={self.ttl})"
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.page")
+
+    @contextlib.contextmanager
+    def _lock(self, path: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(f"{path}.lock", "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Returns the cached page of given url, fresh or stale, or None."""
+        try:
+            with open(self._path(url), "r", encoding="utf8", newline="") as f:
+                fetched_at = os.fstat(f.fileno()).st_mtime
+                header = json.loads(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("couldn't read cached page of %s: %s", url, e)
+            return None
+        if header.get("url") != url:
+            return None
+        return CachedPage(
+            url, body, header.get("etag"), header.get("last_modified"), fetched_at
+        )
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedPage:
+        """Stores page body and its validators, replacing previous entry."""
+        path = self._path(url)
+        header = {"url": url, "etag": etag, "last_modified": last_modified}
+        with self._lock(path):
+            with atomic_write(path, "w", encoding="utf8", newline="") as f:
+                f.write(json.dumps(header) + "\n")
+                f.write(body)
+                now = time.time()
+        return CachedPage(url, body, etag, last_modified, now)
+
+    def touch(self, page: CachedPage) -> CachedPage:
+        """Marks a page revalidated by the server (304) as freshly fetched,
+        without rewriting its body."""
+        path = self._path(page.url)
+        now = time.time()
+        try:
+            with self._lock(path):
+                os.utime(path, (now, now))
+        except FileNotFoundError:
+            return self.put(page.url, page.body, page.etag, page.last_modified)
+        return page._replace(fetched_at=now)
+
+    def invalidate(self, url: str) -> None:
+        """Removes the cached page of given url."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(url))
+
+    def clear(self) -> None:
+        """Removes all cached pages."""
+        for name in os.listdir(self.directory):
+            if name.endswith((".page", ".page.lock")):
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(os.path.join(self.directory, name))
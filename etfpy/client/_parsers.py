@@ -0,0 +1,164 @@
+import functools
+import importlib.util
+from html import escape
+from typing import Callable, Dict, Iterable, List, Optional
+
+import bs4
+
+from etfpy.client._extraction import CONTAINERS, matches_container
+
+# parser backends from fastest to slowest, the first installed one is the default
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+_REQUIREMENTS = {"selectolax": "selectolax", "lxml": "lxml", "html.parser": None}
+
+
+def _installed(module: Optional[str]) -> bool:
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def available_parsers() -> List[str]:
+    """Returns names of parser backends that can be used in this environment,
+    fastest first."""
+    return [name for name in BACKENDS if _installed(_REQUIREMENTS[name])]
+
+
+def default_parser() -> str:
+    """Returns the fastest installed parser backend."""
+    return available_parsers()[0]
+
+
+def _css_selector(name: str) -> str:
+    container = CONTAINERS[name]
+    if container.attr == "id":
+        return f"{container.tag}#{container.value}"
+    return container.tag + "".join(f".{c}" for c in container.value.split())
+
+
+def _bs4_parser() -> str:
+    return "lxml" if "lxml" in available_parsers() else "html.parser"
+
+
+class ContainerStrainer(bs4.SoupStrainer):
+    """``SoupStrainer`` keeping only given section containers (with everything
+    inside them), so no tree nodes are built for the rest of the page.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Names of containers from ``CONTAINERS`` to keep.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        super().__init__()
+        self.names = list(names)
+
+    def _matches(self, name: str, attrs) -> bool:
+        attrs = dict(attrs or {})
+        return any(matches_container(n, name, attrs) for n in self.names)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # beautifulsoup4 >= 4.13
+        return self._matches(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs=None):
+        # beautifulsoup4 < 4.13, called with tag name and attributes while parsing
+        if markup_attrs is None:
+            markup_attrs = {}
+        if isinstance(markup_name, bs4.Tag):
+            return super().search_tag(markup_name, markup_attrs)
+        return markup_name if self._matches(markup_name, markup_attrs) else None
+
+
+def _parse_selectolax(
+    html: str, names: Optional[Iterable[str]] = None
+) -> bs4.BeautifulSoup:
+    """Parses the page with lexbor and builds BeautifulSoup tree only
+    from the section containers, in document order.
+
+    Nested containers are kept inside their outermost container only, so every
+    container occurs in the resulting tree exactly once. Containers with
+    ``subtree`` are reduced to an empty copy wrapping just that subtree.
+    """
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    selectors = {name: _css_selector(name) for name in (names or CONTAINERS)}
+    nodes = tree.css(", ".join(selectors.values()))
+    kept, enclosing = {}, set()  # html of every container, ids of kept subtrees
+    for node in nodes:
+        name = next(n for n, sel in selectors.items() if node.css_matches(sel))
+        subtree = CONTAINERS[name].subtree
+        if subtree is None:
+            kept[node.mem_id] = node.html
+            enclosing.add(node.mem_id)
+            continue
+        inner = node.css_first(subtree)
+        attrs = "".join(f' {k}="{escape(v or "")}"' for k, v in node.attributes.items())
+        inner_html = ""
+        if inner is not None:
+            inner_html = inner.html
+            enclosing.add(inner.mem_id)
+        kept[node.mem_id] = f"<{node.tag}{attrs}>{inner_html}</{node.tag}>"
+
+    outermost = []
+    for node in nodes:
+        parent = node.parent
+        while parent is not None and parent.mem_id not in enclosing:
+            parent = parent.parent
+        if parent is None:
+            outermost.append(kept[node.mem_id])
+    return bs4.BeautifulSoup("".join(outermost), _bs4_parser())
+
+
+def _bs4_backend(features: str):
+    def parse(html: str, names: Optional[Iterable[str]] = None) -> bs4.BeautifulSoup:
+        strainer = ContainerStrainer(names) if names is not None else None
+        return bs4.BeautifulSoup(html, features, parse_only=strainer)
+
+    return parse
+
+
+_PARSERS: Dict[str, Callable[..., bs4.BeautifulSoup]] = {
+    "selectolax": _parse_selectolax,
+    "lxml": _bs4_backend("lxml"),
+    "html.parser": _bs4_backend("html.parser"),
+}
+
+
+def parse_html(
+    html: str,
+    parser: Optional[str] = None,
+    containers: Optional[Iterable[str]] = None,
+) -> bs4.BeautifulSoup:
+    """Parses ETF page into BeautifulSoup tree ready for section parsers.
+
+    Parameters
+    ----------
+    html : str
+        ETF page source.
+    parser : str, optional
+        Parser backend, one of ``selectolax``, ``lxml`` or ``html.parser``.
+        Defaults to the fastest installed one. The ``selectolax`` backend keeps
+        only the section containers of the page in the returned tree.
+    containers : Iterable[str], optional
+        Names of containers from ``CONTAINERS`` to build tree nodes for, see
+        ``containers_for``. The whole page is parsed by default.
+
+    Returns
+    -------
+    bs4.BeautifulSoup
+        Parsed page.
+
+    Raises
+    ------
+    ValueError
+        If the parser backend is unknown or not installed.
+    """
+    parser = parser or default_parser()
+    if parser not in available_parsers():
+        raise ValueError(
+            f"parser {parser} is not available, use one of: {available_parsers()}"
+        )
+    return _PARSERS[parser](html, containers)
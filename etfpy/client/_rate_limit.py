@@ -0,0 +1,210 @@
+import asyncio
+import email.utils
+import functools
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+# statuses telling the client to slow down, retried after a backoff
+THROTTLED = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns number of seconds to wait from a ``Retry-After`` header value,
+    given either as seconds or as HTTP date, or None if it can't be parsed."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Token bucket of one host, refilled with ``rate`` tokens per second up
+    to ``burst`` tokens.
+
+    Requests reserve their send time instead of polling for tokens, so
+    waiting happens outside the lock and the bucket can be shared by threads
+    and async tasks alike. The rate is halved on every throttled response
+    (down to ``min_rate``) and recovers additively on successful ones.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # theoretical arrival time of the next request (GCRA)
+        self._tat = clock()
+
+    def _tolerance(self) -> float:
+        return (self.burst - 1) / self.rate
+
+    def reserve(self) -> float:
+        """Takes a token and returns number of seconds to wait before sending."""
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            send_at = max(now, tat - self._tolerance())
+            self._tat = tat + 1 / self.rate
+            return send_at - now
+
+    def penalize(self, delay: float) -> None:
+        """Slows the bucket down after a throttled response, no request is
+        sent for ``delay`` seconds and they are spaced by the lowered rate
+        afterwards."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tat = max(self._tat, self._clock() + delay + self._tolerance())
+
+    def reward(self) -> None:
+        """Recovers the rate after a successful response."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class RateLimiter:
+    """Rate limiter of HTTP requests with one token bucket per host.
+
+    One limiter is meant to be shared by all clients of the process, see
+    ``get_rate_limiter``, so concurrent threads and async tasks respect
+    a single request budget and back off together when the server throttles
+    them, instead of every worker retrying on its own.
+
+    Throttled requests are retried by clients with ``RetryPolicy``, the
+    limiter pauses the host for the wait before the retry, so every request
+    to the host waits too.
+
+    Parameters
+    ----------
+    rate : float, default=5.0
+        Number of requests per second sent to one host.
+    burst : int, default=10
+        Number of requests sent at once before ``rate`` applies.
+    min_rate : float, default=0.2
+        Lowest rate a throttled host is slowed down to.
+    clock : Callable[[], float], default=time.monotonic
+        Source of the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        min_rate: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate needs to be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rate={self.rate}, burst={self.burst})"
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Returns the token bucket of the host of given url."""
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    host, TokenBucket(self.rate, self.burst, self.min_rate, self._clock)
+                )
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        """Blocks until a request to given url can be sent."""
+        delay = self.bucket(url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, url: str) -> None:
+        """Waits, without blocking the event loop, until a request to given
+        url can be sent."""
+        delay = self.bucket(url).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def report(self, url: str, status_code: int, delay: float = 0.0) -> None:
+        """Adapts the rate of the host to the response, a throttled (429 or
+        5xx) one pauses the host for ``delay`` seconds and lowers its rate."""
+        bucket = self.bucket(url)
+        if status_code in THROTTLED:
+            bucket.penalize(delay)
+        else:
+            bucket.reward()
+
+
+class RetryPolicy:
+    """Retries of throttled (429 or 5xx) responses, independent of
+    ``RateLimiter``, so clients sent without rate limits still back off.
+
+    Parameters
+    ----------
+    max_retries : int, default=5
+        Number of times a throttled request is retried.
+    backoff : float, default=1.0
+        Seconds to wait before the first retry when the response has no
+        ``Retry-After`` header, doubled on every next retry.
+    max_backoff : float, default=60.0
+        Upper bound of the wait before a retry.
+    """
+
+    def __init__(
+        self, max_retries: int = 5, backoff: float = 1.0, max_backoff: float = 60.0
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_retries={self.max_retries})"
+
+    def wait(self, headers: Mapping[str, str], attempt: int) -> float:
+        """Returns seconds to wait after a throttled response: its
+        ``Retry-After``, or an exponential backoff when the header is missing.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            Response headers.
+        attempt : int
+            Number of retries of the request made so far.
+        """
+        delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is None:
+            delay = self.backoff * 2**attempt
+        return min(delay, self.max_backoff)
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """Tells whether a request with given response status should be sent
+        again after ``attempt`` retries."""
+        return status_code in THROTTLED and attempt < self.max_retries
+
+
+@functools.lru_cache(maxsize=None)
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process-wide rate limiter shared by all clients."""
+    return RateLimiter()
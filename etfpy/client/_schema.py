@@ -0,0 +1,198 @@
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Union
+
+import bs4
+
+from etfpy.utils import _handle_nth_child, _handle_spans, chunkify
+
+# ``Callable`` returning the container element(s) of given name, see ``CONTAINERS``
+Containers = Callable[[str], Union[bs4.Tag, List[bs4.Tag], None]]
+ClassMatch = Union[str, Pattern, None]
+
+
+def _find_rows(container: bs4.Tag, row: str, row_class: ClassMatch) -> List[bs4.Tag]:
+    # bs4 treats ``class_=None`` as "without class attribute", not as no filter
+    if row_class is None:
+        return container.find_all(row)
+    return container.find_all(row, class_=row_class)
+
+
+def _container(containers: Containers, name: str, item: Optional[int]):
+    container = containers(name)
+    if item is None:
+        return container
+    return container[item] if container and len(container) > item else None
+
+
+class Rows(NamedTuple):
+    """Rows of key/value pairs, ``key`` and ``value`` are ``:nth-child``
+    positions of the cells inside every row.
+
+    Parameters
+    ----------
+    container : str
+        Container name.
+    row : str
+        Tag name of rows.
+    row_class : str or Pattern, optional
+        Class of rows, matched like ``find_all(row, class_=row_class)``.
+    key, value : int
+        ``:nth-child`` positions of key and value inside the row.
+    item : int, optional
+        Which element of a container with many elements to read.
+    skip_empty_keys : bool
+        Drop rows without key.
+    skip_empty_values : bool
+        Drop rows with empty string value.
+    """
+
+    container: str
+    row: str
+    row_class: ClassMatch = None
+    key: int = 1
+    value: int = 2
+    item: Optional[int] = None
+    skip_empty_keys: bool = True
+    skip_empty_values: bool = False
+
+    def extract(self, containers: Containers) -> Dict:
+        container = _container(containers, self.container, self.item)
+        if container is None:
+            return {}
+        results = {}
+        for row in _find_rows(container, self.row, self.row_class):
+            key = _handle_nth_child(row, self.key)
+            value = _handle_nth_child(row, self.value)
+            if (self.skip_empty_keys and not key) or (
+                self.skip_empty_values and value == ""
+            ):
+                continue
+            results[key] = value
+        return results
+
+
+class Spans(NamedTuple):
+    """Rows of key/value pairs stored in the first two ``span`` of every row."""
+
+    container: str
+    row: str = "div"
+    row_class: ClassMatch = "row"
+
+    def extract(self, containers: Containers) -> Dict:
+        results = []
+        for row in containers(self.container).find_all(self.row, class_=self.row_class):
+            record = _handle_spans(row.find_all("span"))
+            if record is not None:
+                results.append(record)
+        return dict(results)
+
+
+class Table(NamedTuple):
+    """Table with ``thead`` and ``tbody``, returned as ``{first column: {header: value}}``.
+
+    Parameters
+    ----------
+    container : str
+        Container name, the container holds ``thead`` and ``tbody``.
+    columns : int
+        Number of cells in every body row.
+    clean_header : Callable[[str], str], optional
+        Applied to every header value.
+    """
+
+    container: str
+    columns: int = 4
+    clean_header: Optional[Callable[[str], str]] = None
+
+    def extract(self, containers: Containers) -> Dict:
+        table = containers(self.container)
+        cells = [x.text.strip() for x in table.find("tbody").find_all("td")]
+        header = [x.text.strip() for x in table.find("thead").find_all("th")][1:]
+        if self.clean_header is not None:
+            header = [self.clean_header(h) for h in header]
+        results = {}
+        for row in chunkify(cells, self.columns):
+            results[row[0]] = dict(zip(header, row[1:]))
+        return results
+
+
+class Lines(NamedTuple):
+    """Rows holding key and value as lines of their text.
+
+    Parameters
+    ----------
+    container : str
+        Container name.
+    row : str
+        Tag name of rows.
+    row_class : str or Pattern, optional
+        Class of rows.
+    separator : str
+        Separator of key and value in the stripped row text.
+    within : Tuple[str, str], optional
+        Tag name and class of elements rows are looked up in.
+    """
+
+    container: str
+    row: str
+    row_class: ClassMatch = None
+    separator: str = "\n"
+    within: Optional[tuple] = None
+
+    def extract(self, containers: Containers) -> Dict:
+        container = containers(self.container)
+        parents = (
+            container.find_all(self.within[0], class_=self.within[1])
+            if self.within
+            else [container]
+        )
+        return dict(
+            row.text.strip().split(self.separator)
+            for parent in parents
+            for row in _find_rows(parent, self.row, self.row_class)
+        )
+
+
+Spec = Union[Rows, Spans, Table, Lines]
+
+# valuation metric names e.g. "ETF", "ETF Database Category Average"
+VALUATION_NAME = re.compile("h4 center*")
+
+# section name -> declarative extraction spec, compiled once at import
+SCHEMA: Dict[str, Spec] = {
+    "profile": Spans("profile"),
+    "trading": Rows("trading", "li", skip_empty_keys=False, skip_empty_values=True),
+    "asset_categories": Rows("ticker_assets", "div", "row", item=1),
+    "factset": Rows("factset", "tr"),
+    "holding_statistics": Table("holdings_table"),
+    "size": Table("size_table"),
+    "dividends": Table("dividend_table"),
+    "performance": Table(
+        "performance", clean_header=lambda header: header.replace("\n\n", " ")
+    ),
+    "technicals": Lines("technicals", "li", within=("ul", "list-unstyled")),
+    "volatility": Lines(
+        "technicals",
+        "div",
+        re.compile("row relative-metric"),
+        separator="\n\n\n\n",
+    ),
+}
+
+
+def extract(name: str, containers: Containers):
+    """Extracts section data described by ``SCHEMA[name]``.
+
+    Parameters
+    ----------
+    name : str
+        Section name in ``SCHEMA``.
+    containers : Callable[[str], Any]
+        Returns the page container(s) of given name.
+
+    Returns
+    -------
+    Dict
+        Extracted section data.
+    """
+    return SCHEMA[name].extract(containers)
@@ -0,0 +1,147 @@
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_IDS = None  # trie node key holding ids of all symbols under the node
+
+
+def _ngrams(text: str, n: int = 3) -> List[str]:
+    """Returns n-grams of every word of normalized text.
+
+    Words are left padded only, so partially typed words still match
+    the beginning of indexed words e.g. ``vangu`` -> ``vanguard``.
+    """
+    grams = []
+    for word in _NON_ALNUM.sub(" ", text.lower()).split():
+        padded = " " * (n - 1) + word
+        grams.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class ETFSearchIndex:
+    """Type-ahead search index over ETF symbols and fund names.
+
+    Symbols are stored in a prefix trie where every node keeps ids of all
+    symbols below it already in rank order, so a symbol prefix lookup is a
+    walk of ``len(query)`` nodes. Names are indexed by word trigrams, and name
+    matches are scored by the fraction of query trigrams they contain, which
+    tolerates typos and partially typed words.
+
+    Parameters
+    ----------
+    symbols : Sequence[str]
+        ETF symbols.
+    names : Sequence[str]
+        Fund names, in the same order as symbols.
+    asset_classes : Sequence[str], optional
+        Asset classes, in the same order as symbols.
+    volumes : Sequence[float], optional
+        Average volumes used to rank equally good matches, most traded first.
+    min_score : float, default=0.6
+        Minimum fraction of query trigrams a name needs to contain to match.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        names: Sequence[str],
+        asset_classes: Optional[Sequence[str]] = None,
+        volumes: Optional[Iterable[float]] = None,
+        min_score: float = 0.6,
+    ):
+        self._symbols = [s.upper() for s in symbols]
+        self._names = list(names)
+        self._asset_classes = (
+            list(asset_classes)
+            if asset_classes is not None
+            else [None] * len(self._symbols)
+        )
+        volumes = np.nan_to_num(
+            np.asarray(list(volumes) if volumes is not None else [], dtype=float)
+        )
+        self._volumes = volumes if len(volumes) else np.zeros(len(self._symbols))
+        self.min_score = min_score
+
+        ranked = sorted(
+            range(len(self._symbols)),
+            key=lambda i: (len(self._symbols[i]), -self._volumes[i], self._symbols[i]),
+        )
+        self._trie: Dict = {_IDS: []}
+        for i in ranked:
+            node = self._trie
+            node[_IDS].append(i)
+            for char in self._symbols[i]:
+                node = node.setdefault(char, {_IDS: []})
+                node[_IDS].append(i)
+
+        postings = defaultdict(set)
+        for i, name in enumerate(self._names):
+            for gram in _ngrams(name or ""):
+                postings[gram].add(i)
+        self._postings = {
+            gram: np.fromiter(sorted(ids), dtype=np.int32, count=len(ids))
+            for gram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def _symbol_matches(self, query: str) -> List[int]:
+        node = self._trie
+        for char in query.upper():
+            node = node.get(char)
+            if node is None:
+                return []
+        return node[_IDS]
+
+    def _name_matches(self, query: str) -> List[int]:
+        grams = _ngrams(query)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not grams or not hits:
+            return []
+        counts = np.bincount(np.concatenate(hits), minlength=len(self._symbols))
+        scores = counts / len(grams)
+        candidates = np.flatnonzero(scores >= self.min_score)
+        order = np.lexsort((-self._volumes[candidates], -scores[candidates]))
+        return candidates[order].tolist()
+
+    def _record(self, i: int) -> Dict[str, str]:
+        return {
+            "symbol": self._symbols[i],
+            "name": self._names[i],
+            "asset_class": self._asset_classes[i],
+        }
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, str]]:
+        """Searches ETFs by symbol prefix and fund name.
+
+        Exact symbol match comes first, then symbols starting with the query
+        (shortest and most traded first), then best matching fund names.
+
+        Parameters
+        ----------
+        query : str
+            Symbol prefix or (part of) fund name.
+        limit : int, default=10
+            Maximum number of matches to return.
+
+        Returns
+        -------
+        List[Dict[str, str]]
+            Matches with ``symbol``, ``name`` and ``asset_class`` keys.
+        """
+        query = query.strip()
+        if not query or limit < 1:
+            return []
+        results = self._symbol_matches(query)[:limit]
+        if len(results) < limit:
+            seen = set(results)
+            for i in self._name_matches(query):
+                if i not in seen:
+                    results.append(i)
+                    if len(results) == limit:
+                        break
+        return [self._record(i) for i in results]
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, NamedTuple, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    ticker TEXT NOT NULL,
+    section TEXT NOT NULL,
+    data TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ticker, section)
+)
+"""
+
+
+class StoredSection(NamedTuple):
+    """Parsed section read from ``SectionStore``."""
+
+    data: Any
+    content_hash: str
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Checks whether the section was parsed less than ``ttl`` seconds ago."""
+        return time.time() - self.fetched_at < ttl
+
+
+class SectionStore:
+    """SQLite store of parsed ETF sections keyed by ticker and section name.
+
+    Every row keeps the section data as json, its sha256 content hash and the
+    time it was parsed, the hash lets readers detect changed sections without
+    comparing their data. The database runs in WAL mode, so several processes
+    can read while one of them writes.
+
+    Parameters
+    ----------
+    path : str
+        Path to the database file, created if it doesn't exist.
+    ttl : float, default=86400
+        Number of seconds stored sections are served instead of fetching
+        and parsing the page again.
+    """
+
+    def __init__(self, path: str, ttl: float = 86400):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path}, ttl={self.ttl})"
+
+    def get(self, ticker: str, section: str) -> Optional[StoredSection]:
+        """Returns stored section of given ticker, fresh or stale, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, content_hash, fetched_at FROM sections "
+                "WHERE ticker = ? AND section = ?",
+                (ticker.upper(), section),
+            ).fetchone()
+        if row is None:
+            return None
+        data, content_hash, fetched_at = row
+        return StoredSection(json.loads(data), content_hash, fetched_at)
+
+    def get_fresh(self, ticker: str, section: str) -> Optional[StoredSection]:
+        """Returns stored section of given ticker if it's younger than ``ttl``."""
+        stored = self.get(ticker, section)
+        return stored if stored is not None and stored.is_fresh(self.ttl) else None
+
+    def put(self, ticker: str, section: str, data: Any) -> StoredSection:
+        """Stores parsed section of given ticker, replacing the previous one.
+
+        Parameters
+        ----------
+        ticker : str
+            ETF symbol.
+        section : str
+            Section name e.g. ``holdings``.
+        data : Any
+            Json serializable section data.
+
+        Returns
+        -------
+        StoredSection
+            The stored section.
+        """
+        payload = json.dumps(data)
+        content_hash = hashlib.sha256(payload.encode("utf8")).hexdigest()
+        fetched_at = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO sections (ticker, section, data, content_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (ticker, section) DO UPDATE SET "
+                "data = excluded.data, content_hash = excluded.content_hash, "
+                "fetched_at = excluded.fetched_at",
+                (ticker.upper(), section, payload, content_hash, fetched_at),
+            )
+        return StoredSection(data, content_hash, fetched_at)
+
+    def delete(self, ticker: str, section: Optional[str] = None) -> None:
+        """Removes given section, or all sections, of given ticker."""
+        query, params = "DELETE FROM sections WHERE ticker = ?", [ticker.upper()]
+        if section is not None:
+            query += " AND section = ?"
+            params.append(section)
+        with self._lock:
+            self._connection.execute(query, params)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,129 @@
+import functools
+import os
+import threading
+import weakref
+from typing import Optional, Sequence
+
+import requests
+
+from etfpy.utils import get_retry_session
+
+# pools of the process, reset in children after fork
+_POOLS: "weakref.WeakSet[SessionPool]" = weakref.WeakSet()
+
+
+class SessionPool:
+    """Lazily created ``requests.Session`` shared by all clients of the process.
+
+    Reusing one session keeps connections to etfdb alive between clients,
+    so loading many ETFs pays the TCP and TLS handshake once per pooled
+    connection instead of once per ticker. Connection pools of the session
+    are thread-safe, every host keeps up to ``pool_maxsize`` idle connections.
+
+    Sockets can't be shared with a forked child, so the pool drops its session
+    in the child after ``os.fork`` and the child opens its own on first use.
+
+    Parameters
+    ----------
+    pool_maxsize : int, default=10
+        Number of connections kept open per host, set it to at least the
+        number of threads sharing the session.
+    retries : int, default=6
+        Number of connection and read retries.
+    backoff_factor : float, default=0.1
+        Backoff factor of retries.
+    status_forcelist : Sequence[int], default=(406,)
+        Response statuses retried by the session, throttled responses are
+        retried by ``RetryPolicy``.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        retries: int = 6,
+        backoff_factor: float = 0.1,
+        status_forcelist: Sequence[int] = (406,),
+    ):
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = tuple(status_forcelist)
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        _POOLS.add(self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(pool_maxsize={self.pool_maxsize})"
+
+    def _new_session(self) -> requests.Session:
+        return get_retry_session(
+            retries=self.retries,
+            backoff_factor=self.backoff_factor,
+            pool_maxsize=self.pool_maxsize,
+            status_forcelist=self.status_forcelist,
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Returns the shared session, created on first use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._new_session()
+                session = self._session
+        return session
+
+    def grow(self, pool_maxsize: int) -> requests.Session:
+        """Makes the pool keep at least ``pool_maxsize`` connections per host,
+        e.g. before ``pool_maxsize`` threads share the session.
+
+        The adapters of the shared session are replaced in one assignment, so
+        threads using the session always find a complete set of open adapters.
+        Idle connections of the replaced pools are closed after the swap, the
+        ones of requests in flight are closed once the requests finish.
+
+        Returns
+        -------
+        requests.Session
+            The shared session.
+        """
+        with self._lock:
+            if pool_maxsize > self.pool_maxsize:
+                self.pool_maxsize = pool_maxsize
+                if self._session is not None:
+                    replaced = self._session.adapters
+                    self._session.adapters = self._new_session().adapters
+                    for adapter in replaced.values():
+                        adapter.close()
+        return self.session
+
+    def close(self) -> None:
+        """Closes the session and its connections, the next use opens
+        a new session."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def reset(self) -> None:
+        """Forgets the session without closing its connections, used in
+        a forked child where the connections belong to the parent."""
+        self._lock = threading.Lock()
+        self._session = None
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_POOLS):
+        pool.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session_pool() -> SessionPool:
+    """Returns the process-wide session pool used by clients created
+    without a session."""
+    return SessionPool()
@@ -0,0 +1,122 @@
+import asyncio
+import functools
+import json
+import threading
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+def request_key(
+    method: str, url: str, params: Optional[Dict] = None, body: Optional[Dict] = None
+) -> Tuple[str, str, str, str]:
+    """Returns key of a request with given method, url, query parameters
+    and json body, requests with equal keys get equal responses."""
+    return (
+        method.upper(),
+        url,
+        json.dumps(params, sort_keys=True, default=str),
+        json.dumps(body, sort_keys=True, default=str),
+    )
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one call.
+
+    The first caller of a key runs the call, callers arriving while it is in
+    flight wait for it and get its result, or its exception, instead of
+    running the call again. Once the call finishes the key is forgotten, so
+    the next caller runs it again; nothing is cached.
+
+    Blocking calls (``do``) are shared between threads, coroutine calls
+    (``ado``) between tasks of the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self):
+        return len(self._calls) + len(self._async_calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Runs ``fn`` unless a call with the same key is in flight,
+        and returns its result.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the call e.g. requested url.
+        fn : Callable[[], T]
+            The call.
+
+        Returns
+        -------
+        T
+            Result of the call, shared by all concurrent callers.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(self._calls, key)
+            future.set_exception(e)
+            raise
+        self._finish(self._calls, key)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits ``fn()`` unless a call with the same key is in flight in
+        the running event loop, and returns its result, see ``do``."""
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self._lock:
+            future = self._async_calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._async_calls[key] = loop.create_future()
+        if not leader:
+            # a cancelled waiter mustn't cancel the call shared with others
+            return await asyncio.shield(future)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._finish(self._async_calls, key)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._finish(self._async_calls, key)
+            future.set_exception(e)
+            future.exception()  # retrieved, the leader raises it
+            raise
+        self._finish(self._async_calls, key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, calls: Dict[Hashable, Any], key: Hashable) -> None:
+        with self._lock:
+            del calls[key]
+
+
+@functools.lru_cache(maxsize=None)
+def get_single_flight() -> SingleFlight:
+    """Returns the process-wide ``SingleFlight`` shared by all clients."""
+    return SingleFlight()
@@ -0,0 +1,172 @@
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from etfpy.client._extraction import CONTAINERS, matches_container
+
+
+class Fragment(NamedTuple):
+    """Source of one container element found in a streamed page.
+
+    ``start`` and ``end`` are offsets of the kept source in the page, the
+    subtree for containers with ``subtree``, the whole element otherwise.
+    """
+
+    name: str
+    html: str
+    start: int
+    end: int
+
+
+class _Open:
+    """Element whose end tag wasn't fed yet, ``depth`` counts open elements
+    of its tag name (including itself)."""
+
+    def __init__(self, name: str, tag: str, start: int, start_tag: str):
+        self.name = name
+        self.tag = tag
+        self.start = start
+        self.start_tag = start_tag
+        self.depth = 1
+        self.subtree: Optional[_Open] = None
+
+
+def _matches_selector(selector: str, tag: str, attrs: Dict) -> bool:
+    # ``tag.class1.class2`` selectors of ``Container.subtree``
+    selector_tag, *classes = selector.split(".")
+    element_classes = (attrs.get("class") or "").split()
+    return tag == selector_tag and all(c in element_classes for c in classes)
+
+
+class ContainerScanner(HTMLParser):
+    """Incremental HTML tokenizer locating section containers in a page fed
+    chunk by chunk, without building a tree.
+
+    Only start and end tags of the container tag names are counted, so an
+    element is complete as soon as its end tag is fed. A container with
+    ``subtree`` is complete once the end tag of its subtree is fed.
+    Containers with ``many`` are complete after ``max_count`` elements,
+    or at the end of the page.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Names of containers from ``CONTAINERS`` to locate.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        super().__init__(convert_charrefs=False)
+        self.names = list(dict.fromkeys(names))
+        self.fragments: Dict[str, List[Fragment]] = {n: [] for n in self.names}
+        self._complete = set()
+        self._open: List[_Open] = []
+        self._chunks: List[str] = []
+        self._source = ""
+        self._size = 0
+        self._line_starts = [0]
+
+    @property
+    def done(self) -> bool:
+        """Whether all containers are complete, the rest of the page
+        isn't needed."""
+        return len(self._complete) == len(self.names)
+
+    def is_complete(self, name: str) -> bool:
+        """Whether the container of given name is complete."""
+        return name in self._complete
+
+    def feed(self, data: str) -> None:
+        """Feeds next chunk of the page."""
+        newline = data.find("\n")
+        while newline != -1:
+            self._line_starts.append(self._size + newline + 1)
+            newline = data.find("\n", newline + 1)
+        self._size += len(data)
+        self._chunks.append(data)
+        super().feed(data)
+
+    def close(self) -> None:
+        """Marks the end of the page, all containers become complete."""
+        super().close()
+        self._complete.update(self.names)
+
+    def _flush(self) -> str:
+        if self._chunks:
+            self._source += "".join(self._chunks)
+            self._chunks.clear()
+        return self._source
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        start = self._offset()
+        for element in self._open:
+            if element.subtree is not None:
+                element.subtree.depth += tag == element.subtree.tag
+                continue
+            subtree = CONTAINERS[element.name].subtree
+            if subtree is not None and _matches_selector(subtree, tag, attrs):
+                element.subtree = _Open(element.name, tag, start, "")
+            elif tag == element.tag:
+                element.depth += 1
+
+        for name in self.names:
+            if name in self._complete or not matches_container(name, tag, attrs):
+                continue
+            if any(o.name == name for o in self._open):
+                continue
+            self._open.append(_Open(name, tag, start, self.get_starttag_text()))
+
+    def handle_endtag(self, tag):
+        end = None
+        for element in list(self._open):
+            tracked = element.subtree or element
+            if tracked.tag != tag:
+                continue
+            tracked.depth -= 1
+            if tracked.depth:
+                continue
+            if end is None:
+                end = self._flush().index(">", self._offset()) + 1
+            if element.subtree is not None:
+                html = self._source[tracked.start : end]
+                html = f"{element.start_tag}{html}</{element.tag}>"
+                fragment = Fragment(element.name, html, tracked.start, end)
+            elif CONTAINERS[element.name].subtree is not None:
+                # the subtree wasn't found, keep the empty container
+                html = f"{element.start_tag}</{element.tag}>"
+                fragment = Fragment(element.name, html, element.start, element.start)
+            else:
+                html = self._source[element.start : end]
+                fragment = Fragment(element.name, html, element.start, end)
+            self._close(element, fragment)
+
+    def _close(self, element: _Open, fragment: Fragment) -> None:
+        self._open.remove(element)
+        container = CONTAINERS[element.name]
+        fragments = self.fragments[element.name]
+        fragments.append(fragment)
+        if not container.many or (
+            container.max_count is not None and len(fragments) >= container.max_count
+        ):
+            self._complete.add(element.name)
+
+    def document(self, names: Optional[Iterable[str]] = None) -> str:
+        """Returns source of a document made of given containers, all by
+        default, in page order.
+
+        Containers located inside another kept container are not repeated.
+        """
+        names = self.names if names is None else names
+        fragments = sorted(
+            (f for n in names for f in self.fragments.get(n, ())),
+            key=lambda f: (f.start, -f.end),
+        )
+        kept: List[Fragment] = []
+        for fragment in fragments:
+            if kept and fragment.end <= kept[-1].end:
+                continue
+            kept.append(fragment)
+        return "".join(f.html for f in kept)
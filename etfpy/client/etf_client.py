@@ -1,27 +1,89 @@
+import contextlib
 import functools
 import json
 import os
-import re
+import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import bs4
+import pandas as pd
 
 from etfpy.client._base_client import BaseClient
+from etfpy.client._catalog import ColumnarCatalog, records_to_frame
+from etfpy.client._extraction import (
+    SECTION_CONTAINERS,
+    containers_for,
+    locate_containers,
+)
+from etfpy.client._parsers import available_parsers, default_parser, parse_html
+from etfpy.client._schema import VALUATION_NAME, extract
+from etfpy.client._search import ETFSearchIndex
+from etfpy.client._section_store import SectionStore
+from etfpy.client._streaming import ContainerScanner
 from etfpy.exc import InvalidETFException
 from etfpy.log import get_logger
 from etfpy.utils import (
     _handle_nth_child,
-    _handle_spans,
     chunkify,
-    handle_find_all_rows,
-    handle_tbody_thead,
+    compact_data,
+    first_nth_child,
 )
 
 logger = get_logger("etf_client")
 
 
+ETFS_DATA_PATH = os.path.join(Path(__file__).parent.parent.resolve(), "data", "etfs")
+
+
+def iter_etfs_catalog(file_path: str) -> Iterator[Dict[str, str]]:
+    """Iterates over records of ETF catalog stored either as a json
+    list or as newline-delimited json (one record per line).
+
+    Newline-delimited files are read line by line, so also partially written
+    files can be read, and only one record is kept in memory at once.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the catalog file.
+
+    Yields
+    ------
+    Dict[str, str]
+        Catalog records.
+    """
+    with open(file_path, "r", encoding="utf8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[":
+            yield from json.load(f)
+            return
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def load_etfs_catalog(file_path: str) -> List[Dict[str, str]]:
+    """Loads ETF catalog stored either as a json list or as newline-delimited json.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the catalog file.
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        Catalog records.
+    """
+    return list(iter_etfs_catalog(file_path))
+
+
 def _load_available_etfs() -> list:
     """Loads all available tickers from etfdb.com
 
@@ -29,37 +91,425 @@ def _load_available_etfs() -> list:
     -------
     list of available etf tickers
     """
-    root = Path(__file__).parent.parent.resolve()
-    path = os.path.join(root, "data", "etfs", "etfs_list.json")
+    return load_etfs_catalog(os.path.join(ETFS_DATA_PATH, "etfs_list.json"))
+
+
+def load_columnar_catalog(file_path: Optional[str] = None) -> ColumnarCatalog:
+    """Memory-maps the binary columnar ETF catalog.
+
+    Parameters
+    ----------
+    file_path : str, optional
+        Path to the catalog file. Defaults to the bundled ``etfs_list.bin``.
+
+    Returns
+    -------
+    ColumnarCatalog
+        Read-only catalog backed by the mapped file.
+    """
+    if file_path is None:
+        file_path = os.path.join(ETFS_DATA_PATH, "etfs_list.bin")
+    return ColumnarCatalog(file_path)
+
+
+class ETFUniverse:
+    """Symbol-keyed registry of the ETFs available in ETF Database.
+
+    Catalog records are indexed by upper-case symbol, so membership checks and
+    metadata lookups (asset class, name, price, volume ...) are O(1) dictionary
+    lookups instead of scans over the whole catalog.
 
-    with open(path, "r") as f:
-        data = json.load(f)
-    return data
+    Parameters
+    ----------
+    records : Iterable[Dict[str, str]]
+        Catalog records as produced by ``ETFListScraper``. When a symbol occurs
+        more than once, the first record wins.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, str]]):
+        index: Dict[str, Dict[str, str]] = {}
+        for record in records:
+            symbol = record.get("symbol")
+            if symbol:
+                index.setdefault(symbol.upper(), record)
+        self._index = index
+
+    def __contains__(self, symbol) -> bool:
+        return isinstance(symbol, str) and symbol.upper() in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(etfs={len(self)})"
+
+    @property
+    def symbols(self) -> List[str]:
+        """Returns all symbols in catalog order."""
+        return list(self._index)
+
+    def get(self, symbol: str, default=None) -> Optional[Dict[str, str]]:
+        """Returns the catalog record for given symbol, or ``default``."""
+        return self._index.get(symbol.upper(), default)
+
+    def asset_class(self, symbol: str) -> Optional[str]:
+        """Returns the asset class for given symbol, or None if unknown."""
+        record = self.get(symbol)
+        return record.get("asset_class") if record else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the universe as a DataFrame with numeric price, volume
+        and return columns."""
+        return records_to_frame(self._index.values())
+
+
+@functools.lru_cache(maxsize=None)
+def get_etf_universe() -> Union[ETFUniverse, ColumnarCatalog]:
+    """Returns the process-wide ETF universe registry.
+
+    The bundled catalog is loaded and indexed on first use only,
+    every later call returns the same registry. The memory-mapped columnar
+    catalog is preferred when it is bundled, so processes share its pages,
+    otherwise the json catalog is indexed in memory.
+    """
+    try:
+        return load_columnar_catalog()
+    except (OSError, ValueError) as e:
+        logger.debug("columnar catalog unavailable, falling back to json: %s", e)
+    return ETFUniverse(_load_available_etfs())
 
 
 @functools.lru_cache()
 def get_available_etfs_list():
-    return [etf["symbol"] for etf in _load_available_etfs()]
+    return get_etf_universe().symbols
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_index() -> ETFSearchIndex:
+    """Returns the process-wide search index over the ETF universe,
+    built on first use."""
+    df = get_etf_universe().to_frame()
+    return ETFSearchIndex(
+        df["symbol"], df["name"], df["asset_class"], df["average_volume"]
+    )
+
+
+def search_etfs(query: str, limit: int = 10) -> List[Dict[str, str]]:
+    """Searches available ETFs by symbol prefix or fund name.
+
+    Parameters
+    ----------
+    query : str
+        Symbol prefix or (part of) fund name, typos are tolerated.
+    limit : int, default=10
+        Maximum number of matches to return.
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        Best matches first, with ``symbol``, ``name`` and ``asset_class`` keys.
+
+    Examples
+    --------
+    >>> search_etfs("vanguard total", limit=2)
+    [{'symbol': 'BND', 'name': 'Vanguard Total Bond Market ETF', 'asset_class': 'Bond'},
+     {'symbol': 'VTI', 'name': 'Vanguard Total Stock Market ETF', 'asset_class': 'Equity'}]
+    """
+    return get_search_index().search(query, limit)
 
 
 class ETFDBClient(BaseClient):
-    def __init__(self, ticker: str, **kwargs):
+    """Client scraping ETF page from etfdb.com.
+
+    Parameters
+    ----------
+    ticker : str
+        ETF symbol e.g. SPY.
+    lazy : bool, default=False
+        Don't fetch the ETF page when the client is created, but on first
+        access to data parsed from it. Ticker, url and asset class come from
+        the local ETF universe and are always available without a request.
+    cache_ttl : float, optional
+        Number of seconds parsed sections are served from memory. After that
+        the page is fetched again on next access. Cached forever by default.
+    parser : str, optional
+        HTML parser backend: ``selectolax``, ``lxml`` or ``html.parser``.
+        Defaults to the fastest installed one, see ``available_parsers``.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default. Only page
+        containers those sections read are turned into tree nodes, other
+        sections can't be accessed.
+    section_store : SectionStore, optional
+        Store of parsed sections shared between clients and processes. While
+        the page isn't fetched, fresh sections are read from the store with no
+        request and no parsing, and newly parsed sections are written to it.
+    low_memory : bool, default=False
+        Parse all requested sections as soon as the page is fetched, keep them
+        in compact form and release the parsed page, see ``release_page``.
+        The client holds just the section data, not the page tree.
+    stream : bool, default=False
+        Download the page in chunks and stop reading it as soon as the
+        containers of requested sections are complete, see ``stream_sections``.
+        Only the containers are parsed. Sections at the end of the page
+        (technicals, volatility, exposure) still need the whole page.
+    kwargs : Any
+        Additional keyword arguments passed to ``BaseClient``.
+    """
+
+    # section name -> parser method, section names match ETF properties
+    _SECTIONS = {
+        "info": "_basic_info",
+        "holdings": "_holdings",
+        "asset_categories": "_asset_categories",
+        "holding_statistics": "_number_of_holdings",
+        "exposure": "_exposure",
+        "volatility": "_volatility",
+        "technicals": "_technicals",
+        "performance": "_performance",
+        "dividends": "_dividends",
+    }
+
+    def __init__(
+        self,
+        ticker: str,
+        lazy: bool = False,
+        cache_ttl: Optional[float] = None,
+        parser: Optional[str] = None,
+        sections: Optional[Iterable[str]] = None,
+        section_store: Optional[SectionStore] = None,
+        low_memory: bool = False,
+        stream: bool = False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        if ticker.upper() in get_available_etfs_list():
+        self.cache_ttl = cache_ttl
+        self.low_memory = low_memory
+        self.stream = stream
+        self.sections = self._check_sections(sections)
+        self.section_store = section_store
+        self.parser = parser or default_parser()
+        if self.parser not in available_parsers():
+            raise ValueError(
+                f"parser {parser} is not available, use one of: {available_parsers()}"
+            )
+        self._sections_cache: Dict[str, Tuple[float, Any]] = {}
+        self._streamed_containers: Optional[Dict[str, Any]] = None
+        if ticker.upper() in get_etf_universe():
             self.ticker = ticker.upper()
             self.ticker_url = f"{self._base_url}/etf/{self.ticker}"
         else:
             raise InvalidETFException(f"{ticker} doesn't exist in ETF Database")
 
         self.asset_class = self._add_meta_information(self.ticker)
-        self._soup = self._make_soup_request()
+        self._soup = None
+        if not lazy and not self._all_sections_stored():
+            self.prefetch()
+
+    @property
+    def _soup(self) -> bs4.BeautifulSoup:
+        """Parsed ETF page, fetched on first access."""
+        if self._page_soup is None:
+            self._page_soup = self._make_soup_request()
+        return self._page_soup
+
+    @_soup.setter
+    def _soup(self, soup: Optional[bs4.BeautifulSoup]) -> None:
+        self._page_soup = soup
+        self._page_containers = None
+
+    def _container(self, name: str):
+        """Returns section container of the page, see ``CONTAINERS``.
+
+        All containers are located in one walk over the page on first call.
+        While a streamed section is parsed, its containers are returned instead.
+        """
+        if self._streamed_containers is not None:
+            return self._streamed_containers[name]
+        if self._page_containers is None:
+            self._page_containers = locate_containers(self._soup)
+        return self._page_containers[name]
+
+    def prefetch(self) -> "ETFDBClient":
+        """Fetches and parses the ETF page now, if it wasn't fetched yet.
+
+        Returns
+        -------
+        ETFDBClient
+            The client itself, so it can be chained e.g. ``ETF("SPY", lazy=True).prefetch()``.
+        """
+        _ = self._soup
+        if self.low_memory:
+            self.release_page()
+        return self
+
+    def release_page(self) -> "ETFDBClient":
+        """Parses all requested sections not parsed yet, keeps them in
+        compact form and drops the parsed page.
+
+        Sections stay available from memory. Sections invalidated or expired
+        afterwards need the page to be fetched again.
+
+        Returns
+        -------
+        ETFDBClient
+            The client itself.
+        """
+        now = time.monotonic()
+        for section in self.sections:
+            if section not in self._sections_cache:
+                self._sections_cache[section] = (now, self._load_section(section))
+        self._sections_cache = {
+            section: (parsed_at, compact_data(data))
+            for section, (parsed_at, data) in self._sections_cache.items()
+        }
+        self._soup = None
+        return self
+
+    def refresh(self) -> "ETFDBClient":
+        """Drops cached page and parsed sections, and fetches the page again.
+
+        Returns
+        -------
+        ETFDBClient
+            The client itself.
+        """
+        self._sections_cache.clear()
+        self._soup = None
+        return self.prefetch()
+
+    def invalidate(self, section: Optional[str] = None) -> None:
+        """Drops cached parse result of given section, or of all sections.
+        The section is parsed again from the already fetched page on next access.
+
+        Parameters
+        ----------
+        section : str, optional
+            Section name e.g. ``holdings``. All sections if not provided.
+
+        Raises
+        ------
+        ValueError
+            If the section doesn't exist.
+        """
+        if section is None:
+            self._sections_cache.clear()
+        elif section in self._SECTIONS:
+            self._sections_cache.pop(section, None)
+        else:
+            raise ValueError(f"unknown section: {section}")
+
+    @classmethod
+    def _check_sections(cls, sections: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        """Returns given section names, or all section names if not provided.
+
+        Raises
+        ------
+        ValueError
+            If any of the sections doesn't exist.
+        """
+        if sections is None:
+            return tuple(cls._SECTIONS)
+        sections = tuple(sections)
+        unknown = [s for s in sections if s not in cls._SECTIONS]
+        if unknown:
+            raise ValueError(f"unknown sections: {unknown}")
+        return sections
+
+    def _get_section(self, section: str) -> Any:
+        """Returns parsed section, parsing it on first access only.
+
+        The returned object is shared between calls, copy it before mutating.
+
+        Raises
+        ------
+        ValueError
+            If the section wasn't requested with ``sections``.
+        """
+        if section not in self.sections:
+            raise ValueError(
+                f"{section} isn't parsed for {self.ticker}, "
+                f"available sections: {list(self.sections)}"
+            )
+        cached = self._cached_section(section)
+        if cached is not None:
+            return cached[1]
+        data = self._load_section(section)
+        self._sections_cache[section] = (time.monotonic(), data)
+        if self.low_memory and self._page_soup is not None:
+            return self.release_page()._sections_cache[section][1]
+        return data
+
+    def _cached_section(self, section: str) -> Optional[Tuple[float, Any]]:
+        """Returns memoized parse time and data of section if fresh per
+        ``cache_ttl``. Once it expires, parsed sections and the page are
+        dropped, so the page is fetched again."""
+        cached = self._sections_cache.get(section)
+        if cached is None:
+            return None
+        if self.cache_ttl is None or time.monotonic() - cached[0] < self.cache_ttl:
+            return cached
+        logger.debug("%s of %s expired, fetching page again", section, self.ticker)
+        self._sections_cache.clear()
+        self._soup = None
+        return None
+
+    def _load_section(self, section: str) -> Any:
+        """Parses section from the page, or reads it from ``section_store``
+        if it's fresh there and the page wasn't fetched yet."""
+        store = self.section_store
+        if store is not None and self._page_soup is None:
+            stored = store.get_fresh(self.ticker, section)
+            if stored is not None:
+                return stored.data
+        data = getattr(self, self._SECTIONS[section])()
+        if store is not None:
+            store.put(self.ticker, section, data)
+        return data
+
+    def _section_stored(self, section: str) -> bool:
+        """Checks whether section is fresh in ``section_store``."""
+        return (
+            self.section_store is not None
+            and self.section_store.get_fresh(self.ticker, section) is not None
+        )
+
+    def _all_sections_stored(self) -> bool:
+        """Checks whether all requested sections are fresh in ``section_store``."""
+        return all(self._section_stored(s) for s in self.sections)
+
+    def extract_sections(
+        self, sections: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """Parses given sections, all requested ones by default,
+        from one walk over the page.
+
+        Section containers are located in a single pass over the document
+        and every parser only searches its own container.
+
+        Parameters
+        ----------
+        sections : Iterable[str], optional
+            Section names e.g. ``["holdings", "performance"]``.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed data keyed by section name.
+
+        Raises
+        ------
+        ValueError
+            If any of the sections doesn't exist or wasn't requested.
+        """
+        sections = self.sections if sections is None else self._check_sections(sections)
+        return {section: self._get_section(section) for section in sections}
 
     @staticmethod
     def _add_meta_information(ticker):
-        for etf in _load_available_etfs():
-            if etf.get("symbol") == ticker:
-                return etf.get("asset_class")
-        return None
+        return get_etf_universe().asset_class(ticker)
 
     def __repr__(self):
         return f"{self.__class__.__name__}(ticker={self.ticker})"
@@ -78,11 +528,131 @@ class ETFDBClient(BaseClient):
         -------
         BeautifulSoup object ready to parse with bs4 library
         """
-        url = self._prepare_url()
-        response = self._session.get(url)
-        if response.status_code != 200:
-            raise Exception(f"response {response.status_code}: {response.reason}")
-        return bs4.BeautifulSoup(response.text, "html.parser")
+        if self.stream:
+            return self._coalesced(
+                ("stream",) + self._soup_key(),
+                lambda: self._parse_page(self._scan_page().document()),
+            )
+        return self._coalesced(
+            self._soup_key(),
+            lambda: self._parse_page(self._get_page(self._prepare_url())),
+        )
+
+    def _scan_page(self, sections: Optional[Iterable[str]] = None) -> ContainerScanner:
+        """Streams the page until containers of given sections, requested
+        ones by default, are complete, and returns the scanner holding them."""
+        for scanner in self._iter_scan(containers_for(sections or self.sections)):
+            pass
+        return scanner
+
+    def _iter_scan(self, names: Iterable[str]) -> Iterator[ContainerScanner]:
+        """Feeds the streamed page to a ``ContainerScanner`` of given
+        containers, yielding it after every chunk. Stops reading once all
+        containers are complete."""
+        scanner = ContainerScanner(names)
+        with contextlib.closing(self._stream_page(self._prepare_url())) as chunks:
+            for chunk in chunks:
+                scanner.feed(chunk)
+                if scanner.done:
+                    yield scanner
+                    return
+                yield scanner
+        scanner.close()
+        yield scanner
+
+    def stream_sections(
+        self, sections: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """Streams the page and yields every section as soon as its
+        containers are downloaded.
+
+        Sections already parsed, parseable from the fetched page or fresh in
+        ``section_store`` are yielded first, and only the others are streamed.
+        Page chunks are fed to an incremental tokenizer as they arrive, a
+        section is parsed from its containers only once they are complete,
+        and the download stops when all given sections are yielded. Streamed
+        sections are cached and stored like sections parsed from the whole
+        page, in compact form with ``low_memory``.
+
+        Parameters
+        ----------
+        sections : Iterable[str], optional
+            Section names e.g. ``["info", "holdings"]``, all requested
+            ones by default.
+
+        Yields
+        ------
+        Tuple[str, Any]
+            Section name and its parsed data, in the order sections
+            become complete.
+
+        Raises
+        ------
+        ValueError
+            If any of the sections doesn't exist or wasn't requested.
+
+        Examples
+        --------
+        >>> for section, data in ETF("SPY", lazy=True).stream_sections(["info"]):
+        ...     print(section, data["Issuer"])
+        """
+        sections = self.sections if sections is None else self._check_sections(sections)
+        missing = [s for s in sections if s not in self.sections]
+        if missing:
+            raise ValueError(f"{missing} aren't parsed for {self.ticker}")
+        pending = []
+        for section in dict.fromkeys(sections):
+            if (
+                self._cached_section(section) is not None
+                or self._page_soup is not None
+                or self._section_stored(section)
+            ):
+                yield section, self._get_section(section)
+            else:
+                pending.append(section)
+        if not pending:
+            return
+        for scanner in self._iter_scan(containers_for(pending)):
+            complete = [
+                section
+                for section in pending
+                if all(scanner.is_complete(n) for n in SECTION_CONTAINERS[section])
+            ]
+            for section in complete:
+                pending.remove(section)
+                yield section, self._parse_streamed(scanner, section)
+
+    def _parse_streamed(self, scanner: ContainerScanner, section: str) -> Any:
+        """Parses section from its containers located by the scanner, kept
+        in compact form with ``low_memory`` like in ``release_page``.
+
+        The page and its located containers are left as they are."""
+        names = SECTION_CONTAINERS[section]
+        streamed = parse_html(scanner.document(names), self.parser, names)
+        self._streamed_containers = locate_containers(streamed)
+        try:
+            data = self._load_section(section)
+        finally:
+            self._streamed_containers = None
+        if self.low_memory:
+            data = compact_data(data)
+        self._sections_cache[section] = (time.monotonic(), data)
+        return data
+
+    def _soup_key(self) -> tuple:
+        """Key of the parsed page, concurrent clients of the same ticker
+        parsing it the same way share one fetch and parse."""
+        return "soup", self._prepare_url(), self.parser, frozenset(self.sections)
+
+    def _parse_page(self, html: str) -> bs4.BeautifulSoup:
+        """Parses page source, only containers of requested sections
+        if not all sections are requested."""
+        containers = (
+            containers_for(self.sections)
+            if set(self.sections) != set(self._SECTIONS)
+            else None
+        )
+        return parse_html(html, self.parser, containers)
 
     def _profile_container(self) -> dict:
         """Parses the profile container into a dictionary.
@@ -90,15 +660,7 @@ class ETFDBClient(BaseClient):
         Returns:
             A dictionary containing the profile information.
         """
-        profile_container = self._soup.find("div", {"class": "profile-container"})
-        results: List[Tuple] = []
-        for row in profile_container.find_all("div", class_="row"):
-            spans = row.find_all("span")
-            record = _handle_spans(spans)
-            if record is None:
-                continue
-            results.append(record)
-        return dict(results)
+        return extract("profile", self._container)
 
     def _trading_data(self) -> dict:
         """Parses the data-trading bar-charts-table into dictionary.
@@ -112,53 +674,33 @@ class ETFDBClient(BaseClient):
                    'Shares': '0.4 M'
                }
         """
-        trading_data = self._soup.find(
-            "div", {"class": "data-trading bar-charts-table"}
-        ).find_all("li")
-        trading_dict = {
-            _handle_nth_child(li, 1): _handle_nth_child(li, 2) for li in trading_data
-        }
-        return {k: v for k, v in trading_dict.items() if v != ""}
+        return extract("trading", self._container)
 
     def _asset_categories(self) -> dict:
         """Get asset categories data"""
-
-        theme = self._soup.find("div", {"id": "etf-ticker-body"}).find_all(
-            "div", class_="ticker-assets"
-        )
-        if not theme or len(theme) < 1:
-            return {}
-        theme_dict = handle_find_all_rows(theme[1].find_all("div", class_="row"))
-        return theme_dict
+        return extract("asset_categories", self._container)
 
     def _factset_classification(self) -> dict:
         """Get factset information"""
-        factset = self._soup.find("div", {"id": "factset-classification"}).find_all(
-            "tr"
-        )
-        factset_dict = handle_find_all_rows(factset)
-        return factset_dict
+        return extract("factset", self._container)
 
     def _number_of_holdings(self) -> dict:
         """Get number of holdings for given etf"""
-        return handle_tbody_thead(self._soup, "holdings-table")
+        return extract("holding_statistics", self._container)
 
     def _size_locations(self) -> dict:
         """Get size allocations of holdings for given etf"""
-        return handle_tbody_thead(self._soup, "size-table")
+        return extract("size", self._container)
 
     def _valuation(self) -> dict:
         """Get ETF valuation metrics."""
         valuation = (
-            self._soup.find("div", {"id": "etf-ticker-valuation-dividend_tab"})
+            self._container("valuation_tab")
             .find("div", {"id": "valuation"})
             .find_all("div", class_="row")
         )
         names = [
-            [
-                i.text.strip()
-                for i in div.find_all("div", {"class": re.compile("h4 center*")})
-            ]
+            [i.text.strip() for i in div.find_all("div", {"class": VALUATION_NAME})]
             for div in valuation
         ][1]
         values = [
@@ -171,13 +713,13 @@ class ETFDBClient(BaseClient):
 
     def _dividends(self) -> Dict:
         """Get ETF dividend information."""
-        return handle_tbody_thead(self._soup, "dividend-table", tag="div")
+        return extract("dividends", self._container)
 
     def _holdings(self) -> List[Dict]:
         """Get ETF holdings information."""
         results = []
         try:
-            tbody = self._soup.find("div", {"id": "holding_section"}).find("tbody")
+            tbody = self._container("holding_section").find("tbody")
             holdings = list(tbody.find_all("tr"))
             for record in holdings:
                 record_texts = record.find_all("td")
@@ -203,47 +745,19 @@ class ETFDBClient(BaseClient):
 
     def _performance(self) -> Dict:
         """Get ETF performance."""
-        performance = handle_tbody_thead(self._soup, "performance-collapse", tag="div")
-        cleaned_dict = {}
-        try:
-            for outer_key, _ in performance.items():
-                cleaned_dict[outer_key] = {}
-                for inner_key, inner_value in performance[outer_key].items():
-                    new_key = inner_key.replace("\n\n", " ")
-                    cleaned_dict[outer_key][new_key] = inner_value
-        except (KeyError, AttributeError) as kae:
-            logger.warning("couldn't clean performance dict %s", kae)
-        return cleaned_dict
+        return extract("performance", self._container)
 
     def _technicals(self) -> Dict:
         """Get technical analysis indicators for etf."""
-        sections = list(
-            self._soup.find("div", {"id": "technicals-collapse"}).find_all(
-                "ul", class_="list-unstyled"
-            )
-        )
-
-        results = []
-        for section in sections:
-            try:
-                results += [s.text.strip().split("\n") for s in section.find_all("li")]
-            except (KeyError, TypeError) as e:
-                logger.error(e)
-        return dict(results)
+        return extract("technicals", self._container)
 
     def _volatility(self) -> Dict:
         """Get Volatility  information."""
-        metrics = [
-            x.text.strip().split("\n\n\n\n")
-            for x in self._soup.find("div", {"id": "technicals-collapse"}).find_all(
-                "div", class_=re.compile("row relative-metric")
-            )
-        ]
-        return dict(metrics)
+        return extract("volatility", self._container)
 
     def _exposure(self) -> Dict:
         """Get ETF exposure information."""
-        charts_data = self._soup.find_all("table", class_="chart base-table")
+        charts_data = self._container("charts")
         if not charts_data:
             return {"Data": "Region, country, sector breakdown data not found"}
         parse_data = []
@@ -259,14 +773,12 @@ class ETFDBClient(BaseClient):
         """Gets basic information about ETF.
         Like profile information, trading data, valuation, assets etc.
         """
-        etf_ticker_body = self._soup.find("div", {"id": "etf-ticker-body"}).find(
-            "div", class_="row"
-        )
+        etf_ticker_body = self._container("etf_ticker_body").find("div", class_="row")
         basic_information = {"Symbol": self.ticker, "Url": self.ticker_url}
 
         for row in etf_ticker_body.find_all("div", class_="row"):
             key = _handle_nth_child(row, 1)
-            value = row.select_one(":nth-child(2)")
+            value = first_nth_child(row, 2)
             try:
                 href = value.find("a")["href"]
                 if href and key != "ETF Home Page":
@@ -291,3 +803,35 @@ class ETFDBClient(BaseClient):
         basic_information.update(self._asset_categories())
         basic_information.update(self._factset_classification())
         return basic_information
+
+
+def parse_etf_page(
+    ticker: str,
+    html: str,
+    sections: Optional[Iterable[str]] = None,
+    parser: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Parses sections of already downloaded ETF page.
+
+    Used as a worker of process pools: it takes and returns only plain
+    picklable data, the parsed tree never leaves the function.
+
+    Parameters
+    ----------
+    ticker : str
+        ETF symbol e.g. SPY.
+    html : str
+        ETF page source.
+    sections : Iterable[str], optional
+        Sections to parse, all by default.
+    parser : str, optional
+        HTML parser backend, the fastest installed one by default.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed data keyed by section name.
+    """
+    client = ETFDBClient(ticker, lazy=True, parser=parser, sections=sections)
+    client._soup = client._parse_page(html)
+    return client.extract_sections()
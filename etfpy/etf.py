@@ -1,7 +1,71 @@
+import asyncio
+import contextlib
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
 from etfpy.analytics.tabular_etf import TabularETF, convert_etf_to_tabular
-from etfpy.client.etf_client import ETFDBClient as _ETFDBClient
+from etfpy.client._async_client import AsyncETFDBClient, get_async_http_client
+from etfpy.client._page_cache import PageCache
+from etfpy.client._section_store import SectionStore
+from etfpy.client._session_pool import get_session_pool
+from etfpy.client.etf_client import ETFDBClient as _ETFDBClient, parse_etf_page
+from etfpy.log import get_logger
 from etfpy.scripts.scrape_etfs import all_etfs_json
-from etfpy.utils import get_class_property_methods
+from etfpy.utils import compact_data, get_class_property_methods
+
+logger = get_logger(__name__)
+
+
+class ETFSnapshot(NamedTuple):
+    """Parsed sections of an ETF as a small picklable value, see ``ETF.snapshot``.
+
+    Sections are available as attributes like on ``ETF`` e.g.
+    ``snapshot.holdings``, without session, page or parsing, so snapshots
+    can be sent to worker processes and converted to tabular form there.
+
+    Attributes
+    ----------
+    ticker : str
+        ETF symbol.
+    asset_class : str, optional
+        Asset class of the ETF.
+    sections : Dict[str, Any]
+        Parsed data keyed by section name.
+    created_at : float
+        Unix time the snapshot was taken.
+    """
+
+    ticker: str
+    asset_class: Optional[str]
+    sections: Dict[str, Any]
+    created_at: float
+
+    def __getattr__(self, name: str) -> Any:
+        sections = self.sections
+        if name in sections:
+            return sections[name]
+        raise AttributeError(f"{name} isn't in the snapshot of {self.ticker}")
+
+    def to_tabular(self) -> TabularETF:
+        """Returns a tabular ETF wrapper of the snapshot sections."""
+        return convert_etf_to_tabular(self)
 
 
 class ETF(_ETFDBClient):
@@ -14,9 +78,71 @@ class ETF(_ETFDBClient):
 
     """
 
-    def __init__(self, ticker: str) -> None:
-        """Initialize ETF class"""
-        super().__init__(ticker)
+    def __init__(
+        self,
+        ticker: str,
+        lazy: bool = False,
+        cache_ttl: Optional[float] = None,
+        parser: Optional[str] = None,
+        sections: Optional[Iterable[str]] = None,
+        page_cache: Optional[PageCache] = None,
+        section_store: Optional[SectionStore] = None,
+        low_memory: bool = False,
+        stream: bool = False,
+        **kwargs,
+    ) -> None:
+        """Initialize ETF class
+
+        Every section (info, holdings ...) is parsed on first access only and
+        then served from memory. Use ``invalidate()`` to parse a section again
+        or ``refresh()`` to fetch the page again.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker symbol of the ETF e.g. SPY.
+        lazy : bool, default=False
+            Fetch ETF page on first access to any section (info, holdings ...)
+            instead of right away. Use ``prefetch()`` to fetch it explicitly.
+        cache_ttl : float, optional
+            Number of seconds parsed sections are kept, after that the page
+            is fetched again on next access. Kept forever by default.
+        parser : str, optional
+            HTML parser backend: ``selectolax``, ``lxml`` or ``html.parser``.
+            Defaults to the fastest installed one.
+        sections : Iterable[str], optional
+            Sections to parse e.g. ``["holdings", "exposure"]``, all by default.
+            Only the page parts they need are parsed, accessing other
+            sections raises ValueError.
+        page_cache : PageCache, optional
+            Disk cache of downloaded pages, shared by processes using
+            the same directory. Pages are always downloaded by default.
+        section_store : SectionStore, optional
+            SQLite store of parsed sections. Sections fresh in the store are
+            served from it without fetching and parsing the page.
+        low_memory : bool, default=False
+            Parse all sections once the page is fetched and release the page,
+            the ETF keeps only compact section data. Use it to hold thousands
+            of ETFs in memory.
+        stream : bool, default=False
+            Download the page in chunks and stop once the requested sections
+            are downloaded, see ``stream_sections``. Cuts download time of
+            sections near the top of the page e.g. ``["info", "holdings"]``.
+        kwargs : Any
+            Additional keyword arguments passed to the client e.g. ``session``.
+        """
+        super().__init__(
+            ticker,
+            lazy=lazy,
+            cache_ttl=cache_ttl,
+            parser=parser,
+            sections=sections,
+            page_cache=page_cache,
+            section_store=section_store,
+            low_memory=low_memory,
+            stream=stream,
+            **kwargs,
+        )
 
     @property
     def info(self) -> dict:
@@ -58,7 +184,7 @@ class ETF(_ETFDBClient):
          'Url': 'https://etfdb.com/etf/SPY',
          'Weighting Scheme': 'Market Cap'}
         """
-        return self._basic_info()
+        return self._get_section("info")
 
     @property
     def holdings(self) -> list:
@@ -131,15 +257,15 @@ class ETF(_ETFDBClient):
                'Url': '/stock/AVGO/'}
                ],
         """
-        return self._holdings()
+        return self._get_section("holdings")
 
     @property
     def asset_categories(self) -> dict:
-        return self._asset_categories()
+        return self._get_section("asset_categories")
 
     @property
     def holding_statistics(self):
-        return self._number_of_holdings()
+        return self._get_section("holding_statistics")
 
     @property
     def exposure(self) -> dict:
@@ -183,7 +309,7 @@ class ETF(_ETFDBClient):
                       'Transportation': 1.6,
                       'Utilities': 2.45}}
         """
-        return self._exposure()
+        return self._get_section("exposure")
 
     @property
     def volatility(self) -> dict:
@@ -203,7 +329,7 @@ class ETF(_ETFDBClient):
          }
 
         """
-        return self._volatility()
+        return self._get_section("volatility")
 
     @property
     def technicals(self) -> dict:
@@ -247,7 +373,7 @@ class ETF(_ETFDBClient):
          'Williams % Range 20 Day': '82.58'
          }
         """
-        return self._technicals()
+        return self._get_section("technicals")
 
     @property
     def performance(self) -> dict:
@@ -278,7 +404,7 @@ class ETF(_ETFDBClient):
                 'Factset Segment Average': '6.70%',
                 'SPY': '13.02%'}}
         """
-        return self._performance()
+        return self._get_section("performance")
 
     @property
     def dividends(self) -> dict:
@@ -304,7 +430,7 @@ class ETF(_ETFDBClient):
                            'SPY': '2023-09-15'}
         }
         """
-        return self._dividends()
+        return self._get_section("dividends")
 
     def get_quotes(self, interval="daily", periods=360, order="asc"):
         df = self._get_quotes(self.ticker, interval, periods, order)
@@ -323,6 +449,8 @@ class ETF(_ETFDBClient):
         data = {}
         method_list = get_class_property_methods(self.__class__)
         for m in method_list:
+            if m in self._SECTIONS and m not in self.sections:
+                continue
             if not m.startswith("_"):
                 data[m.title()] = getattr(self, m)
         return data
@@ -331,8 +459,53 @@ class ETF(_ETFDBClient):
         """Returns a tabular ETF wrapper object for the given ETF object."""
         return convert_etf_to_tabular(self)
 
+    def snapshot(self) -> ETFSnapshot:
+        """Returns all requested sections as a picklable ``ETFSnapshot``,
+        parsing the ones not parsed yet.
 
-def load_etf(etf: str) -> ETF:
+        Examples
+        --------
+        >>> snapshot = ETF("SPY").snapshot()
+        >>> with ProcessPoolExecutor() as executor:
+        ...     executor.submit(ETFSnapshot.to_tabular, snapshot).result().holdings
+        """
+        return ETFSnapshot(
+            self.ticker,
+            self.asset_class,
+            compact_data(self.extract_sections()),
+            time.time(),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ETFSnapshot, **kwargs) -> "ETF":
+        """Creates ETF serving sections of the snapshot, with no request
+        and no parsing.
+
+        Parameters
+        ----------
+        snapshot : ETFSnapshot
+            Snapshot returned by ``snapshot``.
+        kwargs : Any
+            Additional keyword arguments passed to ``ETF`` e.g. ``cache_ttl``.
+
+        Returns
+        -------
+        ETF
+            ETF with the sections of the snapshot, other sections aren't available.
+        """
+        kwargs["lazy"] = True
+        etf = cls(snapshot.ticker, sections=snapshot.sections, **kwargs)
+        etf.asset_class = snapshot.asset_class
+        now = time.monotonic()
+        etf._sections_cache = {
+            section: (now, data) for section, data in snapshot.sections.items()
+        }
+        return etf
+
+
+def load_etf(
+    etf: str, lazy: bool = False, sections: Optional[Iterable[str]] = None
+) -> ETF:
     """
     Load an ETF object.
 
@@ -340,6 +513,10 @@ def load_etf(etf: str) -> ETF:
     ----------
     etf : str
         The ticker symbol of the ETF to load.
+    lazy : bool, default=False
+        Fetch ETF page on first access to any section instead of right away.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
 
     Returns
     -------
@@ -350,10 +527,12 @@ def load_etf(etf: str) -> ETF:
     --------
     >>> etf = load_etf("SPY")
     """
-    return ETF(etf)
+    return ETF(etf, lazy=lazy, sections=sections)
 
 
-def load_etf_as_tabular(etf: str) -> TabularETF:
+def load_etf_as_tabular(
+    etf: str, sections: Optional[Iterable[str]] = None
+) -> TabularETF:
     """
     Load an ETF object wrapped with pandas tabular representation of methods
 
@@ -361,6 +540,8 @@ def load_etf_as_tabular(etf: str) -> TabularETF:
     ----------
     etf : str
         The ticker symbol of the ETF to load.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
 
     Returns
     -------
@@ -371,7 +552,385 @@ def load_etf_as_tabular(etf: str) -> TabularETF:
     --------
     >>> etf = load_etf_as_tabular("SPY")
     """
-    return ETF(etf).to_tabular()
+    return ETF(etf, sections=sections).to_tabular()
+
+
+class LoadedETFs(dict):
+    """ETFs loaded by ``load_etfs`` keyed by ticker, in the order of requested
+    tickers. Tickers that failed to load are in ``errors`` instead.
+
+    Attributes
+    ----------
+    errors : Dict[str, Exception]
+        Exception raised while loading each failed ticker.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors: Dict[str, Exception] = {}
+
+
+def _load_parsed_etf(ticker: str, **kwargs) -> ETF:
+    etf = ETF(ticker, **kwargs)
+    etf.extract_sections()
+    return etf
+
+
+def iter_etfs(
+    tickers: Iterable[str],
+    max_workers: int = 8,
+    sections: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> Iterator[Tuple[str, Union[ETF, Exception]]]:
+    """
+    Load many ETFs concurrently and yield them as they complete.
+
+    Pages are fetched by a pool of threads sharing one connection pool and
+    every requested section is parsed before the ETF is yielded. A failing
+    ticker yields the raised exception instead of stopping the batch.
+
+    Requests share the process-wide ``RateLimiter`` (5 requests per second
+    per host, bursts of 10), which caps the batch whatever ``max_workers``
+    is. Pass ``rate_limiter=None``, or your own limiter, to lift the cap;
+    throttled requests are still retried by ``retry_policy``.
+
+    Parameters
+    ----------
+    tickers : Iterable[str]
+        The ticker symbols of the ETFs to load, duplicates are loaded once.
+    max_workers : int, default=8
+        Number of ETFs loaded at once.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
+    kwargs : Any
+        Additional keyword arguments passed to ``ETF`` e.g. ``page_cache``.
+
+    Yields
+    ------
+    Tuple[str, Union[ETF, Exception]]
+        Upper-cased ticker and its ETF, or the exception raised loading it.
+
+    Examples
+    --------
+    >>> for ticker, etf in iter_etfs(["SPY", "QQQ"], sections=["holdings"]):
+    ...     print(ticker, etf.holdings[:1])
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    if "session" not in kwargs:
+        get_session_pool().grow(max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_load_parsed_etf, t, sections=sections, **kwargs): t
+            for t in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                yield ticker, future.result()
+            except Exception as e:
+                logger.warning("couldn't load %s: %s", ticker, e)
+                yield ticker, e
+
+
+def load_etfs(
+    tickers: Iterable[str],
+    max_workers: int = 8,
+    sections: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> LoadedETFs:
+    """
+    Load many ETFs concurrently, see ``iter_etfs``, rate limited the same
+    way.
+
+    Parameters
+    ----------
+    tickers : Iterable[str]
+        The ticker symbols of the ETFs to load.
+    max_workers : int, default=8
+        Number of ETFs loaded at once.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
+    kwargs : Any
+        Additional keyword arguments passed to ``ETF`` e.g. ``page_cache``.
+
+    Returns
+    -------
+    LoadedETFs
+        ETF objects keyed by upper-cased ticker in the requested order,
+        with exceptions of tickers that failed in ``errors``.
+
+    Examples
+    --------
+    >>> etfs = load_etfs(["SPY", "QQQ", "NOT_AN_ETF"])
+    >>> etfs["SPY"].holdings
+    >>> etfs.errors
+    {'NOT_AN_ETF': InvalidETFException("NOT_AN_ETF doesn't exist in ETF Database")}
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    loaded = dict(iter_etfs(tickers, max_workers, sections, **kwargs))
+    results = LoadedETFs()
+    for ticker in tickers:
+        if isinstance(loaded[ticker], Exception):
+            results.errors[ticker] = loaded[ticker]
+        else:
+            results[ticker] = loaded[ticker]
+    return results
+
+
+def load_etfs_as_tabular(
+    tickers: Iterable[str],
+    max_workers: int = 8,
+    sections: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> LoadedETFs:
+    """
+    Load many ETFs concurrently wrapped with pandas tabular representation,
+    see ``load_etfs``.
+
+    Returns
+    -------
+    LoadedETFs
+        TabularETF objects keyed by upper-cased ticker, with exceptions of
+        tickers that failed to load or to convert (e.g. unsupported asset
+        class) in ``errors``.
+
+    Examples
+    --------
+    >>> etfs = load_etfs_as_tabular(["SPY", "QQQ"], sections=["holdings"])
+    >>> etfs["QQQ"].holdings
+    """
+    etfs = load_etfs(tickers, max_workers, sections, **kwargs)
+    results = LoadedETFs()
+    results.errors = etfs.errors
+    for ticker, etf in etfs.items():
+        try:
+            results[ticker] = etf.to_tabular()
+        except Exception as e:
+            logger.warning("couldn't convert %s to tabular: %s", ticker, e)
+            results.errors[ticker] = e
+    return results
+
+
+def _download_page(ticker: str, **kwargs) -> str:
+    client = _ETFDBClient(ticker, lazy=True, **kwargs)
+    return client._get_page(client._prepare_url())
+
+
+def iter_etf_sections(
+    tickers: Iterable[str],
+    io_workers: int = 16,
+    parse_workers: Optional[int] = None,
+    sections: Optional[Iterable[str]] = None,
+    parser: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+    """
+    Scrape many ETFs with downloads in threads and parsing in processes.
+
+    Threads only download raw pages, and every downloaded page is handed to
+    a process pool which parses its sections, so parsing scales over all
+    cores. Only page source goes to the workers and only parsed sections
+    (plain dicts and lists) come back. A failing ticker yields the raised
+    exception instead of stopping the batch.
+
+    Downloads share the process-wide ``RateLimiter``, see ``iter_etfs`` on
+    lifting its cap of 5 requests per second whatever ``io_workers`` is.
+
+    Downloads are submitted only while fewer than ``io_workers`` plus twice
+    ``parse_workers`` pages are downloading or waiting to be parsed, so pages
+    don't pile up in memory when parsing (or the consumer) is slower than
+    the network.
+
+    Parameters
+    ----------
+    tickers : Iterable[str]
+        The ticker symbols of the ETFs to scrape, duplicates are scraped once.
+    io_workers : int, default=16
+        Number of pages downloaded at once.
+    parse_workers : int, optional
+        Number of parsing processes, number of CPUs by default.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
+    parser : str, optional
+        HTML parser backend, the fastest installed one by default.
+    kwargs : Any
+        Additional keyword arguments passed to the downloading clients
+        e.g. ``page_cache``.
+
+    Yields
+    ------
+    Tuple[str, Union[Dict[str, Any], Exception]]
+        Upper-cased ticker and its sections keyed by section name,
+        or the exception raised scraping it.
+
+    Examples
+    --------
+    >>> for ticker, sections in iter_etf_sections(get_available_etfs_list()):
+    ...     print(ticker, sections["info"]["Issuer"])
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    sections = _ETFDBClient._check_sections(sections)
+    if "session" not in kwargs:
+        get_session_pool().grow(io_workers)
+    window = io_workers + 2 * (parse_workers or os.cpu_count() or 1)
+    queued = iter(tickers)
+    pending, downloading = {}, set()
+
+    def submit_downloads():
+        while len(downloading) < io_workers and len(pending) < window:
+            ticker = next(queued, None)
+            if ticker is None:
+                return
+            future = downloads.submit(_download_page, ticker, **kwargs)
+            pending[future] = ticker
+            downloading.add(future)
+
+    with ThreadPoolExecutor(max_workers=io_workers) as downloads, ProcessPoolExecutor(
+        max_workers=parse_workers
+    ) as parsing:
+        submit_downloads()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker = pending.pop(future)
+                downloaded = future in downloading
+                downloading.discard(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning("couldn't scrape %s: %s", ticker, e)
+                    yield ticker, e
+                    continue
+                if downloaded:
+                    job = parsing.submit(
+                        parse_etf_page, ticker, result, sections, parser
+                    )
+                    pending[job] = ticker
+                else:
+                    yield ticker, result
+            submit_downloads()
+
+
+def load_etf_sections(
+    tickers: Iterable[str],
+    io_workers: int = 16,
+    parse_workers: Optional[int] = None,
+    sections: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> LoadedETFs:
+    """
+    Scrape sections of many ETFs using all CPU cores, see ``iter_etf_sections``.
+
+    Returns
+    -------
+    LoadedETFs
+        Sections keyed by section name for every upper-cased ticker in the
+        requested order, with exceptions of tickers that failed in ``errors``.
+
+    Examples
+    --------
+    >>> etfs = load_etf_sections(["SPY", "QQQ"], sections=["holdings", "exposure"])
+    >>> etfs["SPY"]["holdings"]
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    scraped = dict(
+        iter_etf_sections(tickers, io_workers, parse_workers, sections, **kwargs)
+    )
+    results = LoadedETFs()
+    for ticker in tickers:
+        if isinstance(scraped[ticker], Exception):
+            results.errors[ticker] = scraped[ticker]
+        else:
+            results[ticker] = scraped[ticker]
+    return results
+
+
+class AsyncETF(AsyncETFDBClient, ETF):
+    """ETF with pages fetched asynchronously, see ``AsyncETFDBClient``.
+
+    Properties are the same as in ``ETF``, available after ``await prefetch()``.
+
+    Examples
+    --------
+    >>> etf = await AsyncETF.load("SPY", sections=["holdings"])
+    >>> etf.holdings
+    >>> await etf.get_quotes()
+    >>> await etf.to_tabular().aget_quotes()
+    """
+
+    async def get_quotes(self, interval="daily", periods=360, order="asc"):
+        """Fetches quotes of the ETF, see ``ETF.get_quotes``."""
+        df = await self._get_quotes(self.ticker, interval, periods, order)
+        return df.to_dict("records")
+
+
+async def aload_etfs(
+    tickers: Iterable[str],
+    max_concurrency: int = 100,
+    sections: Optional[Iterable[str]] = None,
+    http_client=None,
+    **kwargs,
+) -> LoadedETFs:
+    """
+    Load many ETFs with async requests, see ``load_etfs``.
+
+    Pages are fetched over one pooled keep-alive HTTP client and parsed in
+    worker threads, so the event loop stays responsive. Requests share the
+    process-wide ``RateLimiter`` whatever ``max_concurrency`` is, see
+    ``iter_etfs``.
+
+    Parameters
+    ----------
+    tickers : Iterable[str]
+        The ticker symbols of the ETFs to load.
+    max_concurrency : int, default=100
+        Number of ETFs loaded at once.
+    sections : Iterable[str], optional
+        Sections to parse e.g. ``["holdings"]``, all by default.
+    http_client : httpx.AsyncClient, optional
+        Client used to send requests, one is created for the batch by default.
+    kwargs : Any
+        Additional keyword arguments passed to ``AsyncETF`` e.g. ``page_cache``.
+
+    Returns
+    -------
+    LoadedETFs
+        AsyncETF objects keyed by upper-cased ticker in the requested order,
+        with exceptions of tickers that failed in ``errors``.
+
+    Examples
+    --------
+    >>> etfs = await aload_etfs(["SPY", "QQQ"], sections=["holdings"])
+    >>> etfs["SPY"].holdings
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def load(ticker: str, client) -> AsyncETF:
+        async with semaphore:
+            etf = await AsyncETF.load(
+                ticker, http_client=client, sections=sections, **kwargs
+            )
+            await asyncio.to_thread(etf.extract_sections)
+            return etf
+
+    async with contextlib.AsyncExitStack() as stack:
+        if http_client is None:
+            http_client = await stack.enter_async_context(
+                get_async_http_client(max_connections=max_concurrency)
+            )
+        loaded = await asyncio.gather(
+            *(load(t, http_client) for t in tickers), return_exceptions=True
+        )
+
+    results = LoadedETFs()
+    for ticker, etf in zip(tickers, loaded):
+        if isinstance(etf, Exception):
+            logger.warning("couldn't load %s: %s", ticker, etf)
+            results.errors[ticker] = etf
+        else:
+            results[ticker] = etf
+    return results
 
 
 def etfs_to_json(file_path: str = None) -> None:
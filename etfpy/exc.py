@@ -1,2 +1,10 @@
 class InvalidETFException(Exception):
     """Invalid ETF Exception class"""
+
+
+class NotArchivedException(LookupError):
+    """Request missing in the HTTP archive replayed offline"""
+
+
+class ExpiredSectionException(RuntimeError):
+    """Section of an async client expired, the page needs to be fetched again"""
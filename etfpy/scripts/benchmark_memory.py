@@ -0,0 +1,118 @@
+import argparse
+import gc
+import random
+import re
+import statistics
+import tempfile
+import tracemalloc
+from typing import Dict, List
+
+from etfpy.client._page_cache import PageCache
+from etfpy.client.etf_client import get_available_etfs_list
+from etfpy.etf import ETF
+from etfpy.log import get_logger
+
+logger = get_logger(__name__)
+
+
+_TEXT_RE = re.compile(r">[^<>]+<")
+
+
+def _distinct_page(html: str, seed: str) -> str:
+    """Permute the digits of the page text with a per-seed shuffle, so every
+    ETF holds its own values, as real pages do, while the labels and markup
+    every section parser relies on stay intact."""
+    digits = list("0123456789")
+    random.Random(seed).shuffle(digits)
+    table = str.maketrans("0123456789", "".join(digits))
+    return _TEXT_RE.sub(lambda m: m.group(0).translate(table), html)
+
+
+def _page_cache(html: str, tickers: List[str], directory: str) -> PageCache:
+    """Serve a distinct variant of the page for every ticker from a fresh page
+    cache, so no request is sent."""
+    cache = PageCache(directory, ttl=float("inf"))
+    for ticker in tickers:
+        cache.put(f"https://etfdb.com/etf/{ticker}/", _distinct_page(html, ticker))
+    return cache
+
+
+def measure_etfs_memory(
+    html: str, count: int = 20, low_memory: bool = False
+) -> Dict[str, float]:
+    """Measure memory held by loaded ETFs with all sections parsed.
+
+    ``tracemalloc`` counts the Python heap allocations still alive, not the
+    resident size of the process, so allocator overhead and memory held by
+    C extensions outside the Python allocator are not included. ETFs are
+    loaded one by one and the per-ETF figure is the median memory each one
+    adds, so one-off costs like parser imports or growing the interned
+    strings table don't skew it.
+
+    Args:
+        html (str): ETF page source, varied per ticker by
+            ``_distinct_page`` so ETFs hold their own values.
+        count (int, default=20): Number of ETFs held in memory.
+        low_memory (bool, default=False): Create the ETFs with ``low_memory``.
+
+    Returns:
+        Dict[str, float]: Total and median per-ETF size (KiB) of the Python
+        heap allocations made by the ETFs and still alive.
+    """
+    tickers = get_available_etfs_list()[:count]
+    etfs, added = [], []
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _page_cache(html, tickers, directory)
+        gc.collect()
+        tracemalloc.start()
+        baseline = held = tracemalloc.get_traced_memory()[0]
+        for ticker in tickers:
+            etf = ETF(ticker, page_cache=cache, low_memory=low_memory)
+            etf.extract_sections()
+            etfs.append(etf)
+            gc.collect()
+            added.append(tracemalloc.get_traced_memory()[0] - held)
+            held += added[-1]
+        tracemalloc.stop()
+    return {
+        "total_kib": (held - baseline) / 1024,
+        "per_etf_kib": statistics.median(added) / 1024,
+    }
+
+
+def benchmark_memory(html_path: str, count: int = 20) -> None:
+    """Print Python heap memory held per ETF (median) and in total with and
+    without ``low_memory``, as traced by ``tracemalloc`` (not resident size).
+
+    Args:
+        html_path (str): Path to a saved ETF page, e.g. tests/data/jepy.html.
+        count (int, default=20): Number of ETFs held in memory.
+    """
+    with open(html_path, "r", encoding="utf8") as f:
+        html = f.read()
+    print("Python heap allocations traced by tracemalloc, not resident size")
+    print(f"{'mode':<12}{'median per ETF (KiB)':>24}{'total (KiB)':>16}")
+    for low_memory in (False, True):
+        result = measure_etfs_memory(html, count, low_memory)
+        mode = "low_memory" if low_memory else "default"
+        print(f"{mode:<12}{result['per_etf_kib']:>24,.1f}{result['total_kib']:>16,.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--html",
+        dest="html_path",
+        type=str,
+        default="tests/data/jepy.html",
+        help="path to saved ETF page, varied per ticker",
+    )
+    parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        default=20,
+        help="number of ETFs held in memory",
+    )
+    args = parser.parse_args()
+    benchmark_memory(args.html_path, args.count)
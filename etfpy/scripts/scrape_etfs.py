@@ -1,13 +1,17 @@
 #!/bin/bash
 
+import argparse
 import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
-import argparse
+from typing import Dict, Iterable, List, Optional
 
-from etfpy.client._etfs_scraper import get_all_etfs
+from etfpy.client._catalog import columnar_path_for, write_columnar_catalog
+from etfpy.client._etfs_scraper import ETFListScraper, get_all_etfs
+from etfpy.client.etf_client import iter_etfs_catalog, load_etfs_catalog
 from etfpy.log import get_logger
-
+from etfpy.utils import atomic_write
 
 ETFS_DATA_PATH = os.path.join(Path(__file__).parent.parent, "data", "etfs")
 DEFAULT_FILE_NAME = "etfs_list.json"
@@ -34,11 +38,165 @@ def all_etfs_json(file_path: str = None) -> None:
     page_size = 250
     logger.info("Scraping all ETFs data from etfdb.com")
 
-    with open(file_path, "w") as f:
-        json.dump(get_all_etfs(page_size), f)
+    etfs = get_all_etfs(page_size)
+    with atomic_write(file_path) as f:
+        json.dump(etfs, f)
+    write_columnar_catalog(etfs, columnar_path_for(file_path))
     logger.debug("ETFs data saved to %s", display_path)
 
 
+def all_etfs_ndjson(file_path: str, page_size: int = 250) -> int:
+    """Scrape all ETFs data from etfdb.com and stream it to a newline-delimited json file.
+
+    Every page is appended to `<file_path>.partial` as soon as it's scraped,
+    so memory use doesn't grow with the number of ETFs. The partial file is
+    renamed to `file_path` when scraping finishes and kept as it is if it fails.
+
+    Args:
+        file_path (str): Path to save the newline-delimited json file.
+        page_size (int, default=250): The number of ETFs to scrape per page.
+
+    Returns:
+        int: Number of saved ETFs.
+    """
+    partial_path = file_path + ".partial"
+    logger.info("Streaming all ETFs data from etfdb.com to %s", partial_path)
+
+    count = 0
+    with open(partial_path, "w", encoding="utf8") as f:
+        for page in ETFListScraper().get_etfs(page_size):
+            f.writelines(json.dumps(record) + "\n" for record in page)
+            f.flush()
+            count += len(page)
+            logger.debug("saved %s ETFs", count)
+    os.replace(partial_path, file_path)
+    logger.debug("ETFs data saved to %s", file_path)
+    return count
+
+
+def _record_key(record: Dict, fields: Optional[Iterable[str]]) -> tuple:
+    if fields is None:
+        return tuple(sorted(record.items()))
+    return tuple(record.get(field) for field in fields)
+
+
+def diff_etfs(
+    old: Iterable[Dict],
+    pages: Iterable[List[Dict]],
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, List[str]]:
+    """Compare freshly scraped pages of ETFs against the existing catalog.
+
+    Args:
+        old (Iterable[Dict]): Records of the existing catalog.
+        pages (Iterable[List[Dict]]): Pages of scraped records, as yielded by
+        `ETFListScraper.get_etfs`.
+        fields (Iterable[str], optional): Fields to compare when looking for
+        modified ETFs e.g. `["name", "asset_class"]`. All fields by default.
+
+    Returns:
+        Dict[str, List[str]]: Symbols `added`, `removed` and `modified`, plus
+        the new list of `records` in scraped order.
+    """
+    fields = list(fields) if fields is not None else None
+    existing = {}
+    for record in old:
+        existing.setdefault(record["symbol"], _record_key(record, fields))
+
+    added, modified, records, seen = [], [], [], set()
+    for page in pages:
+        for record in page:
+            symbol = record["symbol"]
+            records.append(record)
+            if symbol in seen:
+                continue
+            seen.add(symbol)
+            if symbol not in existing:
+                added.append(symbol)
+            elif existing[symbol] != _record_key(record, fields):
+                modified.append(symbol)
+    removed = [symbol for symbol in existing if symbol not in seen]
+    return {
+        "added": added,
+        "removed": removed,
+        "modified": modified,
+        "records": records,
+    }
+
+
+def refresh_etfs_json(
+    file_path: str,
+    fields: Optional[Iterable[str]] = None,
+    max_removed_ratio: float = 0.1,
+) -> Dict[str, List[str]]:
+    """Incrementally refresh ETFs catalog stored in json file.
+
+    Scraped pages are compared against the existing catalog, the catalog
+    (and its columnar copy) is atomically rewritten only when some ETF was
+    added, removed or modified, and a changelog is saved next to it
+    with `.changes.json` extension.
+
+    Args:
+        file_path (str): Path to the json catalog. It's created when missing.
+        fields (Iterable[str], optional): Fields to compare when looking for
+        modified ETFs. All fields by default.
+        max_removed_ratio (float, default=0.1): Refuse to save the catalog when
+        more than this fraction of existing ETFs disappeared, which usually
+        means that the scrape was interrupted.
+
+    Returns:
+        Dict[str, List[str]]: Changelog with `added`, `removed` and `modified` symbols.
+    """
+    old = load_etfs_catalog(file_path) if os.path.exists(file_path) else []
+
+    logger.info("Refreshing ETFs data from etfdb.com")
+    diff = diff_etfs(old, ETFListScraper().get_etfs(), fields=fields)
+    records = diff.pop("records")
+    changelog = {"timestamp": datetime.now(timezone.utc).isoformat(), **diff}
+    logger.info(
+        "added: %s, removed: %s, modified: %s",
+        len(diff["added"]),
+        len(diff["removed"]),
+        len(diff["modified"]),
+    )
+
+    if old and len(diff["removed"]) > max_removed_ratio * len(old):
+        logger.error(
+            "%s of %s ETFs disappeared, catalog is not saved",
+            len(diff["removed"]),
+            len(old),
+        )
+        return changelog
+    if not any(diff.values()):
+        logger.debug("ETFs data is up to date")
+        return changelog
+
+    with atomic_write(file_path) as f:
+        json.dump(records, f)
+    write_columnar_catalog(records, columnar_path_for(file_path))
+    with atomic_write(os.path.splitext(file_path)[0] + ".changes.json") as f:
+        json.dump(changelog, f)
+    logger.debug("ETFs data saved to %s", file_path)
+    return changelog
+
+
+def build_columnar_catalog(json_path: str, file_path: str = None) -> str:
+    """Build the binary columnar catalog from an existing json catalog.
+
+    Args:
+        json_path (str): Path to the json (or newline-delimited json) catalog.
+        file_path (str, optional): Path to save the columnar catalog.
+        If None, it's saved next to the json file with `.bin` extension.
+
+    Returns:
+        str: Path to the columnar catalog.
+    """
+    file_path = file_path or columnar_path_for(json_path)
+    rows = write_columnar_catalog(iter_etfs_catalog(json_path), file_path)
+    logger.debug("columnar catalog with %s ETFs saved to %s", rows, file_path)
+    return file_path
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -58,10 +216,46 @@ if __name__ == "__main__":
         help="update json file",
         dest="update",
     )
+    parser.add_argument(
+        "-c",
+        "--columnar-only",
+        action="store_true",
+        default=False,
+        required=False,
+        help="only rebuild columnar catalog from existing json file",
+        dest="columnar_only",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        default=False,
+        required=False,
+        help="save json file only when ETFs changed, with changelog",
+        dest="incremental",
+    )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        default=False,
+        required=False,
+        help="stream ETFs to newline-delimited json file page by page",
+        dest="stream",
+    )
     args = parser.parse_args()
     fp = ETFS_DATA_PATH if args.update is True else args.file_path
     if fp is not None:
-        if not fp.endswith(".json"):
+        if not fp.endswith((".json", ".ndjson")):
             fp = os.path.join(fp, DEFAULT_FILE_NAME)
     logger.info("application args: %s", args)
-    all_etfs_json(file_path=fp)
+    if args.columnar_only:
+        build_columnar_catalog(fp or os.path.join(ETFS_DATA_PATH, DEFAULT_FILE_NAME))
+    elif args.stream:
+        fp = fp or os.path.join(Path(__file__).resolve().parents[1], DEFAULT_FILE_NAME)
+        fp = os.path.splitext(fp)[0] + ".ndjson"
+        all_etfs_ndjson(file_path=fp)
+    elif args.incremental:
+        refresh_etfs_json(fp or os.path.join(ETFS_DATA_PATH, DEFAULT_FILE_NAME))
+    else:
+        all_etfs_json(file_path=fp)
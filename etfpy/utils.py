@@ -1,5 +1,9 @@
+import contextlib
 import inspect
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+import os
+import sys
+import tempfile
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 import bs4
 import requests
@@ -39,12 +43,20 @@ def get_headers() -> Dict:
     }
 
 
-def get_retry_session(retries=6, backoff_factor=0.1) -> requests.Session:
+def get_retry_session(
+    retries=6,
+    backoff_factor=0.1,
+    pool_maxsize=10,
+    status_forcelist=(500, 502, 503, 504, 406),
+) -> requests.Session:
     """Get a Session object with retry capabilities.
 
     Args:
         retries: The number of retries to attempt before giving up.
         backoff_factor: The factor by which to increase the wait time between retries.
+        pool_maxsize: The number of connections kept open per host, set it to
+            the number of threads sharing the session.
+        status_forcelist: Response statuses retried by the session.
 
     Returns:
         A Session object with retry capabilities.
@@ -55,9 +67,9 @@ def get_retry_session(retries=6, backoff_factor=0.1) -> requests.Session:
         read=retries,
         connect=retries,
         backoff_factor=backoff_factor,
-        status_forcelist=[500, 502, 503, 504, 406],
+        status_forcelist=list(status_forcelist),
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     session.mount("https://etfdb.com", adapter)
@@ -65,6 +77,56 @@ def get_retry_session(retries=6, backoff_factor=0.1) -> requests.Session:
     return session
 
 
+def compact_data(data: Any) -> Any:
+    """Return a copy of parsed section data sharing equal short strings.
+
+    Dict keys and short values repeat across rows (e.g. holdings columns, "N/A"),
+    interning them keeps one string object per distinct text instead of one per row.
+
+    Args:
+        data: Section data made of dicts, lists, strings and numbers.
+
+    Returns:
+        Equal data with interned dict keys and short string values.
+    """
+    if isinstance(data, dict):
+        return {compact_data(k): compact_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [compact_data(x) for x in data]
+    if isinstance(data, str) and len(data) <= 32:
+        return sys.intern(data)
+    return data
+
+
+@contextlib.contextmanager
+def atomic_write(file_path: str, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """Open a temporary file next to `file_path` and move it over `file_path`
+    once the block finishes without errors, so readers never see a partially
+    written file.
+
+    Args:
+        file_path: The destination path.
+        mode: The mode to open the temporary file with, `w` or `wb`.
+        kwargs: Additional keyword arguments passed to `open`.
+
+    Yields:
+        A file object to write to.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 def _handle_spans(spans) -> Optional[Tuple[Any]]:
     """Parses a list of spans into a record.
 
@@ -106,12 +168,42 @@ def _handle_nth_child(x: bs4.element.Tag, child_num: int) -> Optional[str]:
         stripped text from nth-child
     """
     try:
-        return x.select_one(f":nth-child({child_num})").text.strip()
+        return first_nth_child(x, child_num).text.strip()
     except Exception as e:
         logger.warning(str(e))
         return None
 
 
+def first_nth_child(x: bs4.element.Tag, child_num: int) -> Optional[bs4.element.Tag]:
+    """Returns the first descendant of a tag (in document order) which is the
+    nth element child of its parent, same as ``x.select_one(":nth-child(n)")``
+    but without compiling and matching a CSS selector.
+
+    Parameters
+    ----------
+    x : bs4.element.Tag
+        beautiful soup tag
+    child_num : int
+        1-based position of the child among its element siblings
+
+    Returns
+    -------
+    bs4.element.Tag
+        matching descendant, or None if there is none
+    """
+    position = 0
+    for child in x.children:
+        if not isinstance(child, bs4.element.Tag):
+            continue
+        position += 1
+        if position == child_num:
+            return child
+        found = first_nth_child(child, child_num)
+        if found is not None:
+            return found
+    return None
+
+
 def handle_find_all_rows(rows: bs4.element.ResultSet) -> Dict[str, str]:
     """
     Extract data from a ResultSet of BeautifulSoup elements representing
@@ -220,14 +312,14 @@ def _get_tbody_thead(
     >>> print(thead)
     ['Header 2']
     """
-    rows = [
-        x.text.strip()
-        for x in soup.find(tag, {"id": table_id}).find("tbody").find_all("td")
-    ]
-    thead = [
-        x.text.strip()
-        for x in soup.find(tag, {"id": table_id}).find("thead").find_all("th")
-    ]
+    return _table_tbody_thead(soup.find(tag, {"id": table_id}))
+
+
+def _table_tbody_thead(table: bs4.element.Tag) -> Tuple[List[str], List[str]]:
+    """Get the table body and header rows of given table element.
+    See `_get_tbody_thead`."""
+    rows = [x.text.strip() for x in table.find("tbody").find_all("td")]
+    thead = [x.text.strip() for x in table.find("thead").find_all("th")]
     return rows, thead[1:]
 
 
@@ -265,7 +357,25 @@ def handle_tbody_thead(soup, table_id: str, tag="table") -> Dict:
     {'Small': {'Value': '10'}, 'Medium': {'Value': '20'}, 'Large': {'Value': '30'}}
     """
 
-    rows, header = _get_tbody_thead(soup, table_id, tag)
+    return handle_table(soup.find(tag, {"id": table_id}))
+
+
+def handle_table(table: bs4.element.Tag) -> Dict:
+    """Extract data from body and header of given table element,
+    and return a dictionary of key-value pairs. See `handle_tbody_thead`.
+
+    Parameters
+    ----------
+    table : bs4.element.Tag
+        The element holding `thead` and `tbody` of the table.
+
+    Returns
+    -------
+    typing.Dict[str, typing.Dict[str, str]]
+        A dictionary mapping the first column of every row
+        to the dictionary of header values and row values.
+    """
+    rows, header = _table_tbody_thead(table)
     results = {}
     for row in list(chunkify(rows, 4)):
         size_key = row.pop(0)
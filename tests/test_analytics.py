@@ -153,3 +153,20 @@ def test_replace_value_in_df_cell_parametrize(
 ):
     new_col = replace_value_in_df_cell(col, to_replace, value, as_type)
     assert new_col.tolist() == expected_result
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", soup)
+def test_etf_with_sections_exports_only_them():
+    etf = ETF("JEPY", sections=["holdings", "exposure"])
+    assert set(etf.to_dict()) == {"Holdings", "Exposure"}
+    assert etf.holdings[0]["Holding"] == "U.S. Dollar"
+    with pytest.raises(ValueError):
+        etf.performance
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", soup)
+def test_low_memory_etf_converts_to_tabular(etf):
+    low_memory = ETF("JEPY", low_memory=True)
+    assert low_memory._page_soup is None
+    assert low_memory.to_dict() == etf.to_dict()
+    assert low_memory.to_tabular().holdings.equals(etf.to_tabular().holdings)
@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from etfpy.client._async_client import (  # noqa: E402
+    AsyncBaseClient,
+    AsyncETFDBClient,
+    get_async_http_client,
+)
+from etfpy.etf import AsyncETF, aload_etfs  # noqa: E402
+from etfpy.exc import ExpiredSectionException  # noqa: E402
+from tests.utils import get_quotes, jepy_html  # noqa: E402
+
+
+def _transport(requests):
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/etf/JEPY/":
+            return httpx.Response(200, text=jepy_html())
+        if request.url.path == "/api/screener/":
+            return httpx.Response(200, json={"meta": {"total_records": 1}})
+        if "queryeod" in request.url.path:
+            return httpx.Response(200, text=get_quotes())
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+def _client(requests):
+    return get_async_http_client(transport=_transport(requests))
+
+
+def test_async_etf_uses_shared_parsers():
+    async def run():
+        requests = []
+        async with _client(requests) as client:
+            etf = await AsyncETF.load("JEPY", http_client=client)
+            holdings = etf.holdings
+            with pytest.raises(RuntimeError):
+                AsyncETFDBClient("JEPY", http_client=client).extract_sections()
+        return holdings, len(requests)
+
+    holdings, n_requests = asyncio.run(run())
+    assert holdings[0]["Holding"] == "U.S. Dollar" and n_requests == 1
+
+
+def test_async_etf_expired_sections_need_refresh():
+    async def run():
+        requests = []
+        async with _client(requests) as client:
+            etf = await AsyncETF.load("JEPY", http_client=client, cache_ttl=60)
+            info = etf.info
+            etf._sections_cache["info"] = (time.monotonic() - 61, info)
+            with pytest.raises(ExpiredSectionException):
+                etf.info
+            await etf.refresh()
+            return etf.info == info, len(requests)
+
+    assert asyncio.run(run()) == (True, 2)
+
+
+def test_async_screener_and_quotes():
+    async def run():
+        async with _client([]) as client:
+            base = AsyncBaseClient(http_client=client)
+            return await base.get_metadata(), await base._get_quotes("SPY")
+
+    metadata, quotes = asyncio.run(run())
+    assert metadata == {"meta": {"total_records": 1}}
+    assert isinstance(quotes, pd.DataFrame) and quotes["symbol"].unique()[0] == "SPY"
+
+
+def test_async_etf_quotes():
+    async def run():
+        async with _client([]) as client:
+            etf = await AsyncETF.load("JEPY", http_client=client, sections=["info"])
+            tabular = etf.to_tabular()
+            with pytest.raises(TypeError):
+                tabular.get_quotes()
+            return await etf.get_quotes(), await tabular.aget_quotes()
+
+    quotes, df = asyncio.run(run())
+    assert quotes == df.to_dict("records") and len(quotes) > 1
+
+
+def test_aload_etfs_collects_errors():
+    async def run():
+        requests = []
+        async with _client(requests) as client:
+            etfs = await aload_etfs(
+                ["JEPY", "SPY", "NOT_AN_ETF"], http_client=client, sections=["exposure"]
+            )
+        return etfs, requests
+
+    etfs, requests = asyncio.run(run())
+    assert list(etfs) == ["JEPY"] and etfs["JEPY"].exposure
+    assert set(etfs.errors) == {"SPY", "NOT_AN_ETF"}
+    assert len(requests) == 2
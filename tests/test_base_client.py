@@ -70,9 +70,12 @@ def test_service_get(mock_request_get, client):
     def res():
         r = requests.Response()
         r.status_code = 200
-        type(r).text = mock.PropertyMock(return_value=get_quotes())  # property mock
         return r
 
     mock_request_get.return_value = res()
-    quotes = client._get_quotes("SPY")
+    with mock.patch.object(  # property mock, restored after the test
+        requests.Response, "text", new_callable=mock.PropertyMock
+    ) as text:
+        text.return_value = get_quotes()
+        quotes = client._get_quotes("SPY")
     assert isinstance(quotes, pd.DataFrame) and quotes["symbol"].unique()[0] == "SPY"
@@ -0,0 +1,113 @@
+import json
+import math
+import os
+
+import pytest
+
+from etfpy.client._catalog import (
+    NUMERIC_COLUMNS,
+    STRING_COLUMNS,
+    ColumnarCatalog,
+    columnar_path_for,
+    parse_catalog_number,
+    write_columnar_catalog,
+)
+from etfpy.client.etf_client import (
+    ETFS_DATA_PATH,
+    ETFUniverse,
+    _load_available_etfs,
+    load_columnar_catalog,
+    load_etfs_catalog,
+)
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "symbol": "SPY",
+            "asset_class": "Equity",
+            "price": "$523.07",
+            "average_volume": "75,663,711",
+            "name": "SPDR S&P 500 ETF Trust",
+            "url": "https://etfdb.com/etf/SPY/",
+            "one_year_return": "10.39%",
+        },
+        {
+            "symbol": "AGG",
+            "asset_class": "Bond",
+            "price": "N/A",
+            "average_volume": "N/A",
+            "name": "iShares Core U.S. Aggregate Bond ETF – ünïcode",
+            "url": "https://etfdb.com/etf/AGG/",
+            "one_year_return": "-1.99%",
+        },
+    ]
+
+
+@pytest.fixture
+def catalog(records, tmp_path):
+    path = os.path.join(tmp_path, "etfs.bin")
+    assert write_columnar_catalog(records + records[:1], path) == 2
+    catalog = ColumnarCatalog(path)
+    yield catalog
+    catalog.close()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("$523.07", 523.07), ("75,663,711", 75663711.0), ("-1.99%", -1.99)],
+)
+def test_parse_catalog_number(value, expected):
+    assert parse_catalog_number(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "N/A", ""])
+def test_parse_catalog_number_missing(value):
+    assert math.isnan(parse_catalog_number(value))
+
+
+def test_columnar_catalog_roundtrip(catalog, records):
+    assert len(catalog) == 2 and catalog.symbols == ["SPY", "AGG"]
+    assert catalog.get("spy") == records[0] and catalog.get("AGG") == records[1]
+    assert "agg" in catalog and "QQQ" not in catalog and catalog.get("QQQ") is None
+    assert catalog.asset_class("AGG") == "Bond"
+    assert catalog.column("name") == [r["name"] for r in records]
+    prices = catalog.column("price_value")
+    assert prices[0] == 523.07 and math.isnan(prices[1])
+    assert catalog.columns == list(STRING_COLUMNS) + list(NUMERIC_COLUMNS)
+    assert catalog.column("average_volume_value")[0] == 75663711.0
+
+
+def test_columnar_catalog_rejects_other_files(tmp_path):
+    path = os.path.join(tmp_path, "etfs.json")
+    with open(path, "w") as f:
+        json.dump([], f)
+    with pytest.raises(ValueError):
+        ColumnarCatalog(path)
+    assert columnar_path_for(path) == os.path.join(tmp_path, "etfs.bin")
+
+
+def test_bundled_columnar_catalog_matches_json():
+    universe = ETFUniverse(_load_available_etfs())
+    catalog = load_columnar_catalog(os.path.join(ETFS_DATA_PATH, "etfs_list.bin"))
+    assert catalog.symbols == universe.symbols
+    for symbol in ("SPY", "TLT", "JEPY", "JHPI"):
+        assert catalog.get(symbol) == universe.get(symbol)
+
+
+def test_columnar_catalog_to_frame(catalog, records):
+    df = catalog.to_frame()
+    assert df.equals(ETFUniverse(records).to_frame())
+    assert df["average_volume"].tolist()[0] == 75663711.0
+
+
+def test_load_etfs_catalog_formats(records, tmp_path):
+    json_path = os.path.join(tmp_path, "etfs.json")
+    with open(json_path, "w", encoding="utf8") as f:
+        f.write("\n  ")
+        json.dump(records, f, indent=4)
+    ndjson_path = os.path.join(tmp_path, "etfs.ndjson")
+    with open(ndjson_path, "w", encoding="utf8") as f:
+        f.writelines(json.dumps(r) + "\n\n" for r in records)
+    assert load_etfs_catalog(json_path) == load_etfs_catalog(ndjson_path) == records
@@ -1,9 +1,66 @@
 from unittest import mock
 
-from etfpy.client.etf_client import ETFDBClient
+import pytest
+
+from etfpy.client._catalog import ColumnarCatalog
+from etfpy.client._extraction import CONTAINERS, locate_containers
+from etfpy.client.etf_client import (
+    ETFDBClient,
+    ETFUniverse,
+    get_available_etfs_list,
+    get_etf_universe,
+)
+from etfpy.exc import InvalidETFException
 from tests.utils import soup
 
 
+def test_etf_universe_lookup():
+    universe = ETFUniverse(
+        [
+            {"symbol": "SPY", "asset_class": "Equity", "name": "SPDR S&P 500"},
+            {"symbol": "BND", "asset_class": "Bond", "name": "Vanguard Bond"},
+            {"symbol": "SPY", "asset_class": "Bond", "name": "Duplicate"},
+        ]
+    )
+    assert len(universe) == 2 and universe.symbols == ["SPY", "BND"]
+    assert "spy" in universe and "QQQ" not in universe and None not in universe
+    assert universe.asset_class("SPY") == "Equity"
+    assert universe.asset_class("QQQ") is None
+    assert universe.get("bnd")["name"] == "Vanguard Bond"
+
+
+@mock.patch(
+    "etfpy.client.etf_client.load_columnar_catalog", side_effect=FileNotFoundError
+)
+def test_etf_universe_is_loaded_once(_):
+    get_etf_universe.cache_clear()
+    try:
+        with mock.patch(
+            "etfpy.client.etf_client._load_available_etfs",
+            return_value=[{"symbol": "JEPY", "asset_class": "Equity"}],
+        ) as m:
+            assert get_etf_universe() is get_etf_universe()
+            assert isinstance(get_etf_universe(), ETFUniverse)
+            assert m.call_count == 1
+    finally:
+        get_etf_universe.cache_clear()
+
+
+def test_etf_universe_prefers_columnar_catalog():
+    universe = get_etf_universe()
+    assert isinstance(universe, ColumnarCatalog)
+    assert "SPY" in universe and universe.asset_class("TLT") == "Bond"
+    assert "SPY" in get_available_etfs_list()
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+def test_client_uses_universe_metadata():
+    etf = ETFDBClient("jepy")
+    assert etf.ticker == "JEPY" and etf.asset_class == "Equity"
+    with pytest.raises(InvalidETFException):
+        ETFDBClient("NOT_AN_ETF")
+
+
 @mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
 def test_basic_info():
     etf = ETFDBClient("JEPY")
@@ -195,3 +252,105 @@ def test_performance():
             "Factset Segment Average": "2.08%",
         },
     }
+
+
+def test_lazy_client_fetches_page_on_first_access():
+    with mock.patch(
+        "etfpy.client.etf_client.ETFDBClient._make_soup_request", side_effect=soup
+    ) as m:
+        etf = ETFDBClient("JEPY", lazy=True)
+        assert m.call_count == 0 and etf._page_soup is None
+        assert etf.asset_class == "Equity"
+        assert etf._holdings()[0]["Holding"] == "U.S. Dollar"
+        assert etf._technicals()["Support Level 1"] == "$19.50"
+        assert m.call_count == 1
+
+        etf = ETFDBClient("JEPY", lazy=True)
+        assert etf.prefetch() is etf and m.call_count == 2
+        etf.prefetch()
+        assert m.call_count == 2
+
+        ETFDBClient("JEPY")
+        assert m.call_count == 3
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+def test_sections_are_parsed_once():
+    etf = ETFDBClient("JEPY")
+    with mock.patch.object(
+        ETFDBClient, "_exposure", autospec=True, side_effect=ETFDBClient._exposure
+    ) as m:
+        exposure = etf._get_section("exposure")
+        assert etf._get_section("exposure") is exposure
+        assert m.call_count == 1
+
+        etf.invalidate("exposure")
+        assert etf._get_section("exposure") == exposure
+        assert m.call_count == 2
+
+        etf.invalidate()
+        etf._get_section("exposure")
+        assert m.call_count == 3
+
+    with pytest.raises(ValueError):
+        etf.invalidate("not_a_section")
+
+
+def test_refresh_and_ttl_fetch_page_again():
+    with mock.patch(
+        "etfpy.client.etf_client.ETFDBClient._make_soup_request", side_effect=soup
+    ) as m, mock.patch("etfpy.client.etf_client.time.monotonic") as now:
+        now.return_value = 100.0
+        etf = ETFDBClient("JEPY", cache_ttl=60)
+        holdings = etf._get_section("holdings")
+        now.return_value = 159.0
+        assert etf._get_section("holdings") is holdings
+        assert m.call_count == 1
+
+        now.return_value = 161.0
+        assert etf._get_section("holdings") == holdings
+        assert m.call_count == 2
+
+        assert etf.refresh() is etf and m.call_count == 3
+        assert etf._sections_cache == {}
+
+
+def test_locate_containers_finds_every_container():
+    located = locate_containers(soup())
+    assert set(located) == set(CONTAINERS)
+    assert located["holdings_table"]["id"] == "holdings-table"
+    assert len(located["ticker_assets"]) >= 2
+    assert all(t.name == "table" for t in located["charts"])
+    assert locate_containers(soup(), ["profile"])["profile"] is not None
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+def test_extract_sections_walks_page_once():
+    etf = ETFDBClient("JEPY")
+    with mock.patch(
+        "etfpy.client.etf_client.locate_containers", side_effect=locate_containers
+    ) as m:
+        sections = etf.extract_sections()
+        assert m.call_count == 1
+    assert list(sections) == list(ETFDBClient._SECTIONS)
+    assert sections["holdings"] == etf._holdings()
+    assert sections["technicals"] == etf._technicals()
+    assert etf.extract_sections(["dividends"]) == {"dividends": etf._dividends()}
+
+    with pytest.raises(ValueError):
+        etf.extract_sections(["not_a_section"])
+
+
+def test_low_memory_client_releases_page():
+    with mock.patch(
+        "etfpy.client.etf_client.ETFDBClient._make_soup_request", side_effect=soup
+    ) as m:
+        expected = ETFDBClient("JEPY").extract_sections()
+        etf = ETFDBClient("JEPY", low_memory=True)
+        assert etf._page_soup is None and set(etf._sections_cache) == set(expected)
+        assert etf.extract_sections() == expected
+
+        etf = ETFDBClient("JEPY", lazy=True, low_memory=True, sections=["holdings"])
+        assert etf._get_section("holdings") == expected["holdings"]
+        assert etf._page_soup is None
+        assert m.call_count == 3
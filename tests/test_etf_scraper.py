@@ -1,6 +1,7 @@
 from unittest import mock
 
 import pytest
+from requests.exceptions import ConnectionError
 
 from etfpy.client._etfs_scraper import ETFListScraper, get_all_etfs
 
@@ -247,11 +248,63 @@ def test_scrape_page(m, etf_scraper_client):
 
 
 def test_should_get_etfs(etf_scraper_client):
+    etf_scraper_client._fetch_page = lambda page, page_size: {
+        "data": _scrape_page(page, page_size)
+    }
     etf_scraper_client._scrape_page = _scrape_page
     results = list(etf_scraper_client.get_etfs(10))
     assert len(results) == 3 and len(results[0]) == 10
 
 
+def _fetch_page(page, page_size, total_records=45):
+    data = [
+        {"symbol": {"text": f"ETF{i}", "url": f"/etf/ETF{i}/"}}
+        for i in range((page - 1) * page_size, min(page * page_size, total_records))
+    ]
+    return {"meta": {"total_records": total_records}, "data": data}
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_should_get_etfs_pages_in_order(etf_scraper_client, max_workers):
+    etf_scraper_client._fetch_page = _fetch_page
+    results = list(etf_scraper_client.get_etfs(10, max_workers=max_workers))
+    assert [len(page) for page in results] == [10, 10, 10, 10, 5]
+    symbols = [etf["symbol"] for page in results for etf in page]
+    assert symbols == [f"ETF{i}" for i in range(45)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_should_retry_failed_pages(etf_scraper_client, max_workers):
+    failures = {3: 2}
+
+    def fetch_page(page, page_size):
+        if failures.get(page):
+            failures[page] -= 1
+            return {}
+        return _fetch_page(page, page_size)
+
+    etf_scraper_client._fetch_page = fetch_page
+    results = list(etf_scraper_client.get_etfs(10, max_workers=max_workers))
+    assert [len(page) for page in results] == [10, 10, 10, 10, 5]
+
+    failures[3] = 3
+    with pytest.raises(ConnectionError):
+        list(etf_scraper_client.get_etfs(10, max_workers=max_workers))
+
+
+@pytest.mark.parametrize(
+    "meta, expected",
+    [
+        ({"total_records": 501}, 3),
+        ({"total_records": "250"}, 1),
+        ({}, None),
+        (None, None),
+    ],
+)
+def test_count_pages(meta, expected):
+    assert ETFListScraper._count_pages(meta, 250) == expected
+
+
 @mock.patch("etfpy.client._etfs_scraper.ETFListScraper.get_etfs")
 def test_get_all_etfs(m):
     data = ScrapedPage().data
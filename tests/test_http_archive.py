@@ -0,0 +1,128 @@
+import asyncio
+import gzip
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+import requests
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._http_archive import HTTPArchive
+from etfpy.client.etf_client import ETFDBClient
+from etfpy.exc import NotArchivedException
+from tests.utils import get_quotes, jepy_html
+
+
+def _response(content, status_code=200, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.headers.update(headers or {"Content-Type": "text/html; charset=utf-8"})
+    response._content = content.encode("utf8")
+    response.encoding = "utf-8"
+    return response
+
+
+def _serve(method, url, **kwargs):
+    if url.endswith("/etf/JEPY/"):
+        return _response(jepy_html())
+    if "screener" in url:
+        return _response('{"meta": {"total_records": 1}}', headers={"ETag": "x"})
+    return _response(get_quotes())
+
+
+def _record(path, sections=None):
+    archive = HTTPArchive(path, mode="record")
+    client = ETFDBClient(
+        "JEPY", lazy=True, sections=sections, http_archive=archive, single_flight=None
+    )
+    with mock.patch.object(client._session, "request", side_effect=_serve) as m:
+        recorded = (
+            client.extract_sections(),
+            client.get_metadata(),
+            client._get_quotes("SPY"),
+        )
+    archive.close()
+    assert m.call_count == 3
+    return recorded
+
+
+def test_replay_serves_recorded_responses_offline(tmp_path):
+    path = str(tmp_path / "crawl.har.gz")
+    sections, metadata, quotes = _record(path, ["holdings", "info"])
+
+    client = ETFDBClient(
+        "JEPY", lazy=True, sections=["holdings", "info"], http_archive=HTTPArchive(path)
+    )
+    with mock.patch.object(client._session, "request", side_effect=AssertionError):
+        assert client.extract_sections() == sections
+        assert client.get_metadata() == metadata
+        assert client._get_quotes("SPY").equals(quotes)
+        with pytest.raises(NotArchivedException):
+            client._get_quotes("QQQ")
+
+
+def test_replayed_page_is_byte_for_byte(tmp_path):
+    path = str(tmp_path / "crawl.har.gz")
+    _record(path)
+    client = BaseClient(http_archive=HTTPArchive(path))
+    response = client._request("GET", "https://etfdb.com/etf/JEPY/")
+    assert response.content == jepy_html().encode("utf8")
+    assert response.text == jepy_html()
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+
+
+def test_recording_client_never_joins_live_request(tmp_path):
+    path, url = str(tmp_path / "crawl.har.gz"), "https://etfdb.com/etf/JEPY/"
+    live_started, recorded = threading.Event(), threading.Event()
+
+    def serve_live(method, url, **kwargs):
+        live_started.set()
+        recorded.wait(5)
+        return _serve(method, url)
+
+    live = BaseClient(rate_limiter=None)
+    recording = BaseClient(rate_limiter=None, http_archive=HTTPArchive(path, "record"))
+    live._requests_session = mock.Mock(request=mock.Mock(side_effect=serve_live))
+    recording._requests_session = mock.Mock(request=mock.Mock(side_effect=_serve))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = executor.submit(live._get_page, url)
+        live_started.wait(5)
+        assert recording._get_page(url) == jepy_html()
+        recorded.set()
+        assert pending.result() == jepy_html()
+    recording.http_archive.close()
+
+    # the recording client sent its own request instead of joining the live one
+    assert recording._session.request.call_count == 1
+    assert BaseClient(http_archive=HTTPArchive(path))._get_page(url) == jepy_html()
+
+
+def test_truncated_archive_keeps_complete_records(tmp_path):
+    path = tmp_path / "crawl.har.gz"
+    _record(str(path))
+    with open(path, "ab") as f:
+        f.write(gzip.compress(b'{"params": null}\n')[:10])
+    client = BaseClient(http_archive=HTTPArchive(str(path)))
+    assert client._request("GET", "https://etfdb.com/etf/JEPY/").status_code == 200
+
+
+def test_async_client_replays_archive(tmp_path):
+    pytest.importorskip("httpx")
+    from etfpy.client._async_client import AsyncBaseClient
+
+    path = str(tmp_path / "crawl.har.gz")
+    _, metadata, quotes = _record(path)
+
+    async def run():
+        client = AsyncBaseClient(http_archive=HTTPArchive(path))
+        return await client.get_metadata(), await client._get_quotes("SPY")
+
+    replayed_metadata, replayed_quotes = asyncio.run(run())
+    assert replayed_metadata == metadata and replayed_quotes.equals(quotes)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        HTTPArchive("crawl.har.gz", mode="write")
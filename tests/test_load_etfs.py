@@ -0,0 +1,113 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+
+from etfpy.analytics.tabular_etf import TabularEquityETFData
+from etfpy.client.etf_client import get_available_etfs_list, parse_etf_page
+from etfpy.etf import (
+    ETF,
+    ETFSnapshot,
+    iter_etf_sections,
+    iter_etfs,
+    load_etf_sections,
+    load_etfs,
+    load_etfs_as_tabular,
+)
+from etfpy.exc import InvalidETFException
+from tests.utils import jepy_html, soup
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", side_effect=soup)
+def test_load_etfs_collects_errors(m):
+    etfs = load_etfs(["jepy", "NOT_AN_ETF", "JEPY"], max_workers=2)
+    assert list(etfs) == ["JEPY"] and m.call_count == 1
+    assert isinstance(etfs["JEPY"], ETF)
+    assert isinstance(etfs.errors["NOT_AN_ETF"], InvalidETFException)
+    assert etfs["JEPY"]._sections_cache.keys() == set(ETF._SECTIONS)
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", side_effect=soup)
+def test_iter_etfs_shares_session(_):
+    results = dict(iter_etfs(["JEPY", "SPY"], sections=["holdings"]))
+    assert set(results) == {"JEPY", "SPY"}
+    assert results["JEPY"]._session is results["SPY"]._session
+    assert results["SPY"].sections == ("holdings",)
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", side_effect=soup)
+def test_load_etfs_as_tabular(_):
+    etfs = load_etfs_as_tabular(["JEPY", "NOT_AN_ETF", "GLD"])
+    assert isinstance(etfs["JEPY"], TabularEquityETFData) and list(etfs) == ["JEPY"]
+    assert list(etfs.errors) == ["NOT_AN_ETF", "GLD"]
+    assert "Commodity" in str(etfs.errors["GLD"])
+
+
+def _download(ticker, **kwargs):
+    if ticker != "JEPY":
+        raise ConnectionError(ticker)
+    return jepy_html()
+
+
+@mock.patch("etfpy.etf._download_page", side_effect=_download)
+def test_load_etf_sections_parses_in_processes(_):
+    etfs = load_etf_sections(
+        ["JEPY", "SPY"], io_workers=2, parse_workers=2, sections=["holdings", "info"]
+    )
+    assert list(etfs) == ["JEPY"] and set(etfs["JEPY"]) == {"holdings", "info"}
+    assert etfs["JEPY"]["holdings"][0]["Holding"] == "U.S. Dollar"
+    assert isinstance(etfs.errors["SPY"], ConnectionError)
+
+
+def test_iter_etf_sections_bounds_pages_in_flight():
+    started = []
+
+    def download(ticker, **kwargs):
+        started.append(ticker)
+        return jepy_html()
+
+    tickers = get_available_etfs_list()[:12]
+    with mock.patch("etfpy.etf._download_page", side_effect=download):
+        for yielded, (ticker, sections) in enumerate(
+            iter_etf_sections(
+                tickers, io_workers=2, parse_workers=1, sections=["info"]
+            ),
+            start=1,
+        ):
+            # io_workers + 2 * parse_workers pages downloading or parsing
+            assert len(started) - yielded < 4
+            assert sections["info"]["Issuer"]
+    assert sorted(started) == sorted(tickers)
+
+
+def test_parse_etf_page_returns_plain_sections():
+    sections = parse_etf_page("JEPY", jepy_html(), ["exposure"])
+    assert list(sections) == ["exposure"] and isinstance(sections["exposure"], dict)
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", side_effect=soup)
+def test_snapshot_round_trip(m):
+    etf = ETF("JEPY")
+    snapshot = pickle.loads(pickle.dumps(etf.snapshot()))
+    assert snapshot.sections == etf.extract_sections()
+    assert snapshot.holdings == etf.holdings and snapshot.asset_class == "Equity"
+    assert len(pickle.dumps(snapshot)) < 20_000
+    with pytest.raises(AttributeError):
+        snapshot.quotes
+
+    restored = ETF.from_snapshot(snapshot)
+    assert restored.to_dict() == etf.to_dict() and m.call_count == 1
+    assert snapshot.to_tabular().holdings.equals(etf.to_tabular().holdings)
+
+    partial = ETF.from_snapshot(ETF("JEPY", sections=["info"]).snapshot())
+    assert partial.sections == ("info",) and partial._page_soup is None
+
+
+@mock.patch("etfpy.etf.ETF._make_soup_request", side_effect=soup)
+def test_snapshot_is_converted_in_worker_process(_):
+    snapshot = ETF("JEPY").snapshot()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        tabular = executor.submit(ETFSnapshot.to_tabular, snapshot).result()
+    assert isinstance(tabular, TabularEquityETFData)
+    assert tabular.holdings.equals(snapshot.to_tabular().holdings)
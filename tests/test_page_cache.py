@@ -0,0 +1,119 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._page_cache import PageCache
+
+URL = "https://etfdb.com/etf/SPY/"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(str(tmp_path / "pages"), ttl=60)
+
+
+def _response(status_code=200, text="", headers=None):
+    return mock.Mock(status_code=status_code, text=text, headers=headers or {})
+
+
+def test_put_and_get(cache):
+    assert cache.get(URL) is None
+    cache.put(URL, "<html>\nbody\r\n</html>", etag='"abc"', last_modified="Mon")
+    page = cache.get(URL)
+    assert page.body == "<html>\nbody\r\n</html>"
+    assert page.validators == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"}
+    assert page.is_fresh(60) and not page.is_fresh(0)
+
+    cache.invalidate(URL)
+    assert cache.get(URL) is None
+
+
+def test_touch_refreshes_entry(cache):
+    page = cache.put(URL, "body")
+    os.utime(cache._path(URL), (0, 0))
+    assert not cache.get(URL).is_fresh(60)
+    cache.touch(page)
+    assert cache.get(URL).is_fresh(60) and cache.get(URL).body == "body"
+
+
+def test_get_page_serves_fresh_entry_without_request(cache):
+    client = BaseClient(page_cache=cache)
+    with mock.patch.object(client, "_request", return_value=_response(text="v1")) as m:
+        assert client._get_page(URL) == "v1"
+        assert client._get_page(URL) == "v1"
+        assert m.call_count == 1
+
+
+def test_get_page_revalidates_stale_entry(cache):
+    client = BaseClient(page_cache=cache)
+    cache.put(URL, "v1", etag='"1"')
+    os.utime(cache._path(URL), (0, 0))
+    with mock.patch.object(client, "_request", return_value=_response(304)) as m:
+        assert client._get_page(URL) == "v1"
+        assert m.call_args.kwargs["headers"] == {"If-None-Match": '"1"'}
+    assert cache.get(URL).is_fresh(60)
+
+    os.utime(cache._path(URL), (0, 0))
+    response = _response(text="v2", headers={"ETag": '"2"'})
+    with mock.patch.object(client, "_request", return_value=response):
+        assert client._get_page(URL) == "v2"
+    assert cache.get(URL).etag == '"2"'
+
+
+def test_get_page_without_cache():
+    client = BaseClient()
+    with mock.patch.object(client, "_request", return_value=_response(text="v1")) as m:
+        assert client._get_page(URL) == "v1"
+        assert client._get_page(URL) == "v1"
+        assert m.call_count == 2
+    with mock.patch.object(client, "_request", return_value=_response(500)):
+        with pytest.raises(Exception):
+            client._get_page(URL)
+
+
+def test_cached_client_never_joins_uncached_request(cache):
+    uncached_started, cached_done = threading.Event(), threading.Event()
+
+    def slow(method, url, **kwargs):
+        uncached_started.set()
+        cached_done.wait(5)
+        return _response(text="v1")
+
+    uncached, cached = BaseClient(), BaseClient(page_cache=cache)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with mock.patch.object(uncached, "_request", side_effect=slow):
+            pending = executor.submit(uncached._get_page, URL)
+            uncached_started.wait(5)
+            with mock.patch.object(
+                cached, "_request", return_value=_response(text="v1")
+            ) as m:
+                assert cached._get_page(URL) == "v1"
+            cached_done.set()
+            assert pending.result() == "v1"
+    # the cached client sent its own request and stored the page
+    assert m.call_count == 1 and cache.get(URL).body == "v1"
+
+
+def _write(directory, n):
+    cache = PageCache(directory)
+    for i in range(20):
+        cache.put(URL, str(n) * 10_000, etag=str(n))
+
+
+def test_concurrent_writers(cache):
+    processes = [
+        multiprocessing.Process(target=_write, args=(cache.directory, n))
+        for n in range(4)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    page = cache.get(URL)
+    assert page.body == page.etag * 10_000
+    assert [f for f in os.listdir(cache.directory) if f.endswith(".tmp")] == []
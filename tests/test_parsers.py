@@ -0,0 +1,63 @@
+from unittest import mock
+
+import pytest
+
+from etfpy.client._parsers import (
+    BACKENDS,
+    available_parsers,
+    default_parser,
+    parse_html,
+)
+from etfpy.client.etf_client import ETFDBClient
+from tests.utils import jepy_html
+
+
+def _sections(parser):
+    soup = parse_html(jepy_html(), parser)
+    with mock.patch.object(ETFDBClient, "_make_soup_request", return_value=soup):
+        return ETFDBClient("JEPY", parser=parser).extract_sections()
+
+
+@pytest.mark.parametrize("parser", ["selectolax", "lxml"])
+def test_backends_produce_identical_sections(parser):
+    pytest.importorskip(parser)
+    assert _sections(parser) == _sections("html.parser")
+
+
+def test_default_parser_is_fastest_available():
+    assert available_parsers()[-1] == "html.parser"
+    assert default_parser() == available_parsers()[0]
+    assert set(available_parsers()) <= set(BACKENDS)
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError):
+        parse_html("<html></html>", "not_a_parser")
+    with pytest.raises(ValueError):
+        ETFDBClient("JEPY", lazy=True, parser="not_a_parser")
+
+
+def _client(parser, sections=None):
+    etf = ETFDBClient("JEPY", lazy=True, parser=parser, sections=sections)
+    etf._requests_session = mock.Mock()
+    etf._requests_session.request.return_value = mock.Mock(
+        status_code=200, text=jepy_html()
+    )
+    return etf
+
+
+@pytest.mark.parametrize("parser", BACKENDS)
+def test_partial_parsing_gives_same_sections(parser):
+    if parser != "html.parser":
+        pytest.importorskip(parser)
+    expected = _sections("html.parser")
+    for section in ("holdings", "exposure", "technicals", "info"):
+        etf = _client(parser, [section])
+        assert etf.extract_sections() == {section: expected[section]}
+
+    etf = _client(parser, ["holdings"])
+    assert len(list(etf._soup.descendants)) < 200
+    with pytest.raises(ValueError):
+        etf._get_section("performance")
+    with pytest.raises(ValueError):
+        _client(parser, ["not_a_section"])
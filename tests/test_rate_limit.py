@@ -0,0 +1,106 @@
+import asyncio
+import time
+from email.utils import formatdate
+from unittest import mock
+
+import pytest
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._rate_limit import (
+    RateLimiter,
+    RetryPolicy,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status_code=200, headers=None):
+    return mock.Mock(status_code=status_code, text="", headers=headers or {})
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 0 < parse_retry_after(formatdate(2**31, usegmt=True))
+    assert parse_retry_after(formatdate(0, usegmt=True)) == 0.0
+
+
+def test_bucket_allows_burst_then_rate():
+    limiter = RateLimiter(rate=2, burst=3, clock=Clock())
+    delays = [limiter.bucket("https://etfdb.com/etf/SPY/").reserve() for _ in range(5)]
+    assert delays == [0, 0, 0, 0.5, 1.0]
+    # every host has its own budget
+    assert limiter.bucket("https://etfflows.websol.barchart.com/q").reserve() == 0
+
+
+def test_throttled_response_pauses_host():
+    limiter = RateLimiter(rate=4, burst=1, clock=Clock())
+    url = "https://etfdb.com/etf/SPY/"
+    bucket = limiter.bucket(url)
+    limiter.report(url, 429, 10)
+    assert bucket.rate == 2
+    assert bucket.reserve() == pytest.approx(10)
+    assert bucket.reserve() == pytest.approx(10.5)
+
+    limiter.report(url, 503, 2)
+    limiter.report(url, 200)
+    assert bucket.rate == pytest.approx(1 + 0.4)
+
+
+def test_retry_policy():
+    policy = RetryPolicy(max_retries=2, backoff=1, max_backoff=3)
+    assert policy.wait({"Retry-After": "10"}, 0) == 3
+    assert [policy.wait({}, attempt) for attempt in range(3)] == [1, 2, 3]
+    assert policy.should_retry(503, 1) and not policy.should_retry(503, 2)
+    assert not policy.should_retry(200, 0)
+
+
+def test_client_retries_throttled_requests():
+    limiter = RateLimiter(rate=1000, burst=10)
+    client = BaseClient(rate_limiter=limiter, retry_policy=RetryPolicy(backoff=0))
+    responses = [_response(429, {"Retry-After": "0"}), _response(502), _response()]
+    with mock.patch.object(client._session, "request", side_effect=responses) as m:
+        assert client._request("GET", "https://etfdb.com/").status_code == 200
+    assert m.call_count == 3
+    # connections of retried responses are released, the returned one is kept
+    assert [r.close.call_count for r in responses] == [1, 1, 0]
+
+
+def test_client_without_limiter_still_retries():
+    client = BaseClient(rate_limiter=None, retry_policy=RetryPolicy(backoff=0.05))
+    responses = [_response(503), _response()]
+    with mock.patch.object(client._session, "request", side_effect=responses):
+        start = time.monotonic()
+        assert client._request("GET", "https://etfdb.com/").status_code == 200
+        assert time.monotonic() - start >= 0.05
+
+    client = BaseClient(rate_limiter=None, retry_policy=None)
+    with mock.patch.object(client._session, "request", return_value=_response(429)):
+        assert client._request("GET", "https://etfdb.com/").status_code == 429
+
+
+def test_limiter_is_shared_by_clients():
+    assert BaseClient().rate_limiter is BaseClient().rate_limiter is get_rate_limiter()
+
+
+def test_async_acquire_waits_without_blocking():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(
+            *(limiter.aacquire("https://etfdb.com/") for _ in range(3))
+        )
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.09
@@ -0,0 +1,51 @@
+import bs4
+
+from etfpy.client._extraction import CONTAINERS
+from etfpy.client._schema import SCHEMA, Lines, Rows, Table, extract
+
+
+def _containers(html):
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    return lambda name: soup.find(id=name)
+
+
+def test_schema_refers_to_known_containers():
+    assert all(spec.container in CONTAINERS for spec in SCHEMA.values())
+
+
+def test_rows():
+    containers = _containers(
+        "<table id='t'><tr class='x'><td>a</td><td>1</td></tr>"
+        "<tr><td></td><td>2</td></tr><tr><td>c</td><td></td></tr></table>"
+    )
+    assert Rows("t", "tr").extract(containers) == {"a": "1", "c": ""}
+    assert Rows("t", "tr", "x").extract(containers) == {"a": "1"}
+    assert Rows("t", "tr", skip_empty_values=True).extract(containers) == {"a": "1"}
+
+
+def test_table():
+    containers = _containers(
+        "<table id='t'><thead><tr><th></th><th>A\n\nB</th></tr></thead>"
+        "<tbody><tr><td>x</td><td>1</td></tr><tr><td>y</td><td>2</td></tr></tbody>"
+        "</table>"
+    )
+    spec = Table("t", columns=2, clean_header=lambda h: h.replace("\n\n", " "))
+    assert spec.extract(containers) == {"x": {"A B": "1"}, "y": {"A B": "2"}}
+
+
+def test_lines():
+    containers = _containers(
+        "<div id='t'><ul class='list-unstyled'><li>a\nb</li></ul>"
+        "<ul><li>c\nd</li></ul></div>"
+    )
+    assert Lines("t", "li", within=("ul", "list-unstyled")).extract(containers) == {
+        "a": "b"
+    }
+    assert Lines("t", "li").extract(containers) == {"a": "b", "c": "d"}
+
+
+def test_extract_uses_schema():
+    containers = _containers(
+        "<table id='factset'><tr><td>Category</td><td>Bond</td></tr></table>"
+    )
+    assert extract("factset", lambda name: containers(name)) == {"Category": "Bond"}
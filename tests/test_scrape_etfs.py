@@ -0,0 +1,109 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from etfpy.client._catalog import ColumnarCatalog
+from etfpy.client.etf_client import load_etfs_catalog
+from etfpy.scripts.scrape_etfs import (
+    all_etfs_ndjson,
+    diff_etfs,
+    refresh_etfs_json,
+)
+
+
+def _record(symbol, price="$10.00", name=None):
+    return {"symbol": symbol, "price": price, "name": name or f"{symbol} ETF"}
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = os.path.join(tmp_path, "etfs_list.json")
+    with open(path, "w") as f:
+        json.dump([_record(s) for s in ("SPY", "IVV", "VOO", "QQQ")], f)
+    return path
+
+
+def test_diff_etfs():
+    old = [_record("SPY"), _record("IVV"), _record("VOO")]
+    pages = [[_record("SPY"), _record("IVV", price="$11.00")], [_record("QQQ")]]
+    diff = diff_etfs(old, pages)
+    assert diff["added"] == ["QQQ"]
+    assert diff["removed"] == ["VOO"]
+    assert diff["modified"] == ["IVV"]
+    assert [r["symbol"] for r in diff["records"]] == ["SPY", "IVV", "QQQ"]
+
+    diff = diff_etfs(old, pages, fields=["name"])
+    assert diff["modified"] == []
+
+
+@mock.patch("etfpy.scripts.scrape_etfs.ETFListScraper.get_etfs")
+def test_refresh_writes_only_on_changes(m, catalog_path):
+    m.return_value = iter([[_record(s) for s in ("SPY", "IVV", "VOO", "QQQ")]])
+    changelog = refresh_etfs_json(catalog_path)
+    assert changelog["added"] == changelog["removed"] == changelog["modified"] == []
+    assert not os.path.exists(catalog_path.replace(".json", ".changes.json"))
+    assert not os.path.exists(catalog_path.replace(".json", ".bin"))
+
+    pages = [[_record("SPY", price="$11.00"), _record("IVV"), _record("VOO")]]
+    m.return_value = iter(pages + [[_record("QQQ"), _record("DIA")]])
+    changelog = refresh_etfs_json(catalog_path)
+    assert changelog["added"] == ["DIA"] and changelog["modified"] == ["SPY"]
+
+    with open(catalog_path) as f:
+        assert [r["symbol"] for r in json.load(f)] == [
+            "SPY",
+            "IVV",
+            "VOO",
+            "QQQ",
+            "DIA",
+        ]
+    with open(catalog_path.replace(".json", ".changes.json")) as f:
+        assert json.load(f)["added"] == ["DIA"]
+    catalog = ColumnarCatalog(catalog_path.replace(".json", ".bin"))
+    assert "DIA" in catalog and catalog.get("SPY")["price"] == "$11.00"
+    assert [
+        f for f in os.listdir(os.path.dirname(catalog_path)) if f.endswith(".tmp")
+    ] == []
+
+
+@mock.patch("etfpy.scripts.scrape_etfs.ETFListScraper.get_etfs")
+def test_refresh_refuses_truncated_scrape(m, catalog_path):
+    m.return_value = iter([[_record("SPY")]])
+    changelog = refresh_etfs_json(catalog_path)
+    assert changelog["removed"] == ["IVV", "VOO", "QQQ"]
+    with open(catalog_path) as f:
+        assert len(json.load(f)) == 4
+
+
+@mock.patch("etfpy.scripts.scrape_etfs.ETFListScraper.get_etfs")
+def test_all_etfs_ndjson_streams_pages(m, tmp_path):
+    path = os.path.join(tmp_path, "etfs_list.ndjson")
+    written = []
+
+    def pages(*args, **kwargs):
+        yield [_record("SPY"), _record("IVV")]
+        with open(path + ".partial") as f:
+            written.append(f.read().count("\n"))
+        yield [_record("QQQ")]
+
+    m.side_effect = pages
+    assert all_etfs_ndjson(path) == 3
+    assert written == [2] and not os.path.exists(path + ".partial")
+    assert [r["symbol"] for r in load_etfs_catalog(path)] == ["SPY", "IVV", "QQQ"]
+
+
+@mock.patch("etfpy.scripts.scrape_etfs.ETFListScraper.get_etfs")
+def test_all_etfs_ndjson_keeps_partial_progress(m, tmp_path):
+    path = os.path.join(tmp_path, "etfs_list.ndjson")
+
+    def pages(*args, **kwargs):
+        yield [_record("SPY"), _record("IVV")]
+        raise ConnectionError
+
+    m.side_effect = pages
+    with pytest.raises(ConnectionError):
+        all_etfs_ndjson(path)
+    assert not os.path.exists(path)
+    assert len(load_etfs_catalog(path + ".partial")) == 2
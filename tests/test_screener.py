@@ -0,0 +1,84 @@
+import gc
+import weakref
+
+import pandas as pd
+import pytest
+
+from etfpy.analytics.screener import screen
+from etfpy.client.etf_client import ETFUniverse
+
+
+@pytest.fixture(scope="module")
+def universe():
+    def record(symbol, asset_class, price, volume, ret):
+        return {
+            "symbol": symbol,
+            "asset_class": asset_class,
+            "price": price,
+            "average_volume": volume,
+            "name": f"{symbol} ETF",
+            "url": f"https://etfdb.com/etf/{symbol}/",
+            "one_year_return": ret,
+        }
+
+    return ETFUniverse(
+        [
+            record("SPY", "Equity", "$523.07", "75,663,711", "10.39%"),
+            record("QQQ", "Equity", "$440.00", "40,000,000", "30.00%"),
+            record("IWM", "Equity", "$200.00", "30,000,000", "-2.50%"),
+            record("AGG", "Bond", "$97.00", "8,000,000", "-1.99%"),
+            record("TLT", "Bond", "$92.00", "42,541,301", "-5.00%"),
+            record("NEW", "Bond", "N/A", "N/A", "N/A"),
+        ]
+    )
+
+
+def test_screen_parses_numeric_columns(universe):
+    df = screen(universe=universe)
+    assert len(df) == 6
+    assert df["price"].dtype == "float64" and df["average_volume"].dtype == "float64"
+    assert df.loc[df["symbol"] == "SPY", "one_year_return"].item() == 10.39
+    assert pd.isna(df.loc[df["symbol"] == "NEW", "price"].item())
+
+
+def test_screen_filters(universe):
+    assert screen(asset_class="Bond", universe=universe)["symbol"].tolist() == [
+        "AGG",
+        "TLT",
+        "NEW",
+    ]
+    df = screen(min_price=100, max_price=450, min_return=0, universe=universe)
+    assert df["symbol"].tolist() == ["QQQ"]
+    df = screen(asset_class=["Bond", "Equity"], min_volume=35e6, universe=universe)
+    assert df["symbol"].tolist() == ["SPY", "QQQ", "TLT"]
+
+
+def test_screen_sort_and_top(universe):
+    df = screen(sort_by="one_year_return", top=2, universe=universe)
+    assert df["symbol"].tolist() == ["QQQ", "SPY"]
+    df = screen(sort_by="price", ascending=True, universe=universe)
+    assert df["symbol"].tolist()[-1] == "NEW"
+    df = screen(
+        sort_by="average_volume", top=1, top_per_asset_class=True, universe=universe
+    )
+    assert df["symbol"].tolist() == ["SPY", "TLT"]
+
+
+def test_screen_invalid_sort_column(universe):
+    with pytest.raises(ValueError):
+        screen(sort_by="volume", universe=universe)
+
+
+def test_screen_bundled_universe():
+    df = screen(asset_class="Equity", sort_by="average_volume", top=10)
+    assert len(df) == 10 and set(df["asset_class"]) == {"Equity"}
+    assert df["average_volume"].is_monotonic_decreasing
+
+
+def test_screen_empty_universe_is_not_the_bundled_one():
+    universe = ETFUniverse([])
+    assert screen(universe=universe).empty
+    ref = weakref.ref(universe)
+    del universe
+    gc.collect()
+    assert ref() is None
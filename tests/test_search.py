@@ -0,0 +1,60 @@
+import pytest
+
+from etfpy.client._search import ETFSearchIndex, _ngrams
+from etfpy.client.etf_client import search_etfs
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ETFSearchIndex(
+        symbols=["SPY", "SPYG", "SP", "VOO", "VTI", "BND", "QQQ"],
+        names=[
+            "SPDR S&P 500 ETF Trust",
+            "SPDR Portfolio S&P 500 Growth ETF",
+            "Some Other Fund",
+            "Vanguard S&P 500 ETF",
+            "Vanguard Total Stock Market ETF",
+            "Vanguard Total Bond Market ETF",
+            "Invesco QQQ Trust Series I",
+        ],
+        asset_classes=["Equity", "Equity", "Equity", "Equity", "Equity", "Bond", None],
+        volumes=[75e6, 2e6, 1e3, 5e6, 3e6, 6e6, 40e6],
+    )
+
+
+def _symbols(results):
+    return [r["symbol"] for r in results]
+
+
+def test_ngrams():
+    assert _ngrams("S&P 500") == ["  s", "  p", "  5", " 50", "500"]
+
+
+def test_symbol_prefix_search(index):
+    assert _symbols(index.search("sp", limit=3)) == ["SP", "SPY", "SPYG"]
+    assert _symbols(index.search("SPY", limit=2)) == ["SPY", "SPYG"]
+    assert index.search("qqq", limit=1) == [
+        {"symbol": "QQQ", "name": "Invesco QQQ Trust Series I", "asset_class": None}
+    ]
+
+
+def test_name_search(index):
+    assert _symbols(index.search("vanguard total")) == ["BND", "VTI", "VOO"]
+    assert _symbols(index.search("vangaurd total stock")) == ["VTI"]
+    assert _symbols(index.search("vangu", limit=10)) == ["BND", "VOO", "VTI"]
+
+
+def test_symbol_matches_rank_before_names(index):
+    results = _symbols(index.search("spdr", limit=10))
+    assert results == ["SPY", "SPYG"]
+    assert _symbols(index.search("sp", limit=10))[:3] == ["SP", "SPY", "SPYG"]
+
+
+@pytest.mark.parametrize("query, limit", [("", 10), ("   ", 10), ("spy", 0)])
+def test_empty_search(index, query, limit):
+    assert index.search(query, limit) == []
+
+
+def test_search_bundled_universe():
+    assert search_etfs("SPY", limit=1)[0]["symbol"] == "SPY"
+    assert "VTI" in _symbols(search_etfs("vanguard total stock"))
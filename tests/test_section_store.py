@@ -0,0 +1,48 @@
+from unittest import mock
+
+import pytest
+
+from etfpy.client._section_store import SectionStore
+from etfpy.client.etf_client import ETFDBClient
+from tests.utils import soup
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SectionStore(str(tmp_path / "sections.db"), ttl=60)
+    yield store
+    store.close()
+
+
+def test_put_and_get(store):
+    assert store.get("SPY", "holdings") is None
+    first = store.put("spy", "holdings", [{"Symbol": "AAPL"}])
+    stored = store.get("SPY", "holdings")
+    assert stored.data == [{"Symbol": "AAPL"}]
+    assert stored.content_hash == first.content_hash
+    assert store.get_fresh("SPY", "holdings") is not None
+
+    assert store.put("SPY", "holdings", []).content_hash != first.content_hash
+    store.delete("SPY")
+    assert store.get("SPY", "holdings") is None
+
+
+def test_stale_sections_are_not_served(store):
+    store.put("SPY", "holdings", [])
+    store.ttl = 0
+    assert store.get_fresh("SPY", "holdings") is None
+    assert store.get("SPY", "holdings") is not None
+
+
+def test_client_reads_sections_from_store(store):
+    with mock.patch.object(ETFDBClient, "_make_soup_request", side_effect=soup) as m:
+        expected = ETFDBClient("JEPY", section_store=store).extract_sections()
+        assert m.call_count == 1
+
+        etf = ETFDBClient("JEPY", section_store=store)
+        assert etf.extract_sections() == expected
+        assert m.call_count == 1 and etf._page_soup is None
+
+        store.ttl = 0
+        assert ETFDBClient("JEPY", section_store=store).extract_sections() == expected
+        assert m.call_count == 2
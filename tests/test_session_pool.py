@@ -0,0 +1,79 @@
+import os
+import threading
+
+import pytest
+import requests
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._session_pool import SessionPool, get_session_pool
+
+
+def test_clients_share_pooled_session():
+    assert BaseClient()._session is BaseClient()._session is get_session_pool().session
+
+
+def test_session_is_created_once_by_many_threads():
+    pool = SessionPool()
+    sessions = []
+    threads = [
+        threading.Thread(target=lambda: sessions.append(pool.session)) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_grow_keeps_session_and_enlarges_pools():
+    pool = SessionPool(pool_maxsize=2)
+    session = pool.session
+    assert pool.grow(16) is session
+    assert {a._pool_maxsize for a in session.adapters.values()} == {16}
+    pool.grow(4)
+    assert pool.pool_maxsize == 16
+
+
+def test_grow_closes_adapters_only_after_swapping_them():
+    pool = SessionPool(pool_maxsize=2)
+    session = pool.session
+    replaced = list(session.adapters.values())
+    still_mounted = []
+    for adapter in replaced:
+        adapter.close = lambda a=adapter: still_mounted.append(
+            a in session.adapters.values()
+        )
+    pool.grow(8)
+    # threads using the session never get an adapter that is already closed
+    assert still_mounted == [False] * len(replaced)
+    assert session.get_adapter("https://etfdb.com/")._pool_maxsize == 8
+
+
+def test_close_opens_new_session_on_next_use():
+    pool = SessionPool()
+    session = pool.session
+    pool.close()
+    assert pool.session is not session
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_own_session():
+    pool = SessionPool()
+    parent_session = pool.session
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child
+        os.write(write, b"1" if pool.session is not parent_session else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b"1"
+    assert pool.session is parent_session
+
+
+def test_clients_follow_closed_pool_but_keep_passed_session():
+    client, session = BaseClient(), requests.Session()
+    pinned = BaseClient(session=session)
+    pooled = client._session
+    get_session_pool().close()
+    assert client._session is get_session_pool().session is not pooled
+    assert pinned._session is session
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+import requests
+
+from etfpy.client._base_client import BaseClient
+from etfpy.client._single_flight import SingleFlight, request_key
+from etfpy.client.etf_client import ETFDBClient
+from tests.utils import jepy_html
+
+
+def _slow(calls, result="page", delay=0.1):
+    def fn():
+        calls.append(1)
+        time.sleep(delay)
+        return result
+
+    return fn
+
+
+def test_concurrent_calls_share_one_call():
+    flight, calls = SingleFlight(), []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: flight.do("k", _slow(calls)), range(8)))
+    assert results == ["page"] * 8 and len(calls) == 1 and len(flight) == 0
+    # finished calls are not cached
+    assert flight.do("k", _slow(calls)) == "page" and len(calls) == 2
+
+
+def test_exception_is_shared():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "k", fail)
+        started.wait()
+        follower = executor.submit(flight.do, "k", lambda: "not called")
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+    assert len(flight) == 0
+
+
+def test_async_calls_share_one_call():
+    flight, calls = SingleFlight(), []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "page"
+
+    async def run():
+        return await asyncio.gather(*(flight.ado("k", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["page"] * 5 and len(calls) == 1
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("get", "u", {"a": 1, "b": 2}) == request_key(
+        "GET", "u", {"b": 2, "a": 1}
+    )
+    assert request_key("POST", "u", body={"page": 1}) != request_key(
+        "POST", "u", body={"page": 2}
+    )
+
+
+def test_concurrent_clients_share_page_and_parse():
+    calls = []
+
+    def get_page(self, url):
+        return _slow(calls, jepy_html())()
+
+    with mock.patch.object(ETFDBClient, "_get_page", get_page):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(
+                executor.map(lambda _: ETFDBClient("JEPY", sections=["info"]), range(4))
+            )
+    assert len(calls) == 1
+    assert len({id(c._page_soup) for c in clients}) == 1
+    assert clients[0].extract_sections() == clients[3].extract_sections()
+
+
+def test_concurrent_metadata_callers_get_own_copies():
+    calls = []
+    response = requests.Response()
+    response.status_code, response._content = 200, b'{"meta": {"total_records": 1}}'
+
+    def request(self, method, url, **kwargs):
+        return _slow(calls, response)()
+
+    with mock.patch.object(BaseClient, "_request", request):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: BaseClient().get_metadata(), range(4))
+            )
+    assert len(calls) == 1 and all(r == results[0] for r in results)
+    results[0]["meta"]["total_records"] = 2
+    assert results[1]["meta"]["total_records"] == 1
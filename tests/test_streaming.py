@@ -0,0 +1,147 @@
+import io
+import sys
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from etfpy.client._extraction import CONTAINERS, locate_containers
+from etfpy.client._http_archive import HTTPArchive
+from etfpy.client._page_cache import PageCache
+from etfpy.client._section_store import SectionStore
+from etfpy.client._streaming import ContainerScanner
+from etfpy.client.etf_client import ETFDBClient
+from tests.utils import jepy_html, soup
+
+
+class CountingBody(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.read_bytes = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.read_bytes += len(data)
+        return data
+
+
+@pytest.fixture
+def body():
+    return CountingBody(jepy_html().encode("utf8"))
+
+
+def _streamed(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = body
+    return response
+
+
+def _client(body, **kwargs):
+    client = ETFDBClient("JEPY", lazy=True, single_flight=None, **kwargs)
+    client._requests_session = mock.Mock()
+    client._requests_session.request.return_value = _streamed(body)
+    return client
+
+
+@pytest.fixture(scope="module")
+def expected():
+    with mock.patch.object(ETFDBClient, "_make_soup_request", side_effect=soup):
+        return ETFDBClient("JEPY").extract_sections()
+
+
+def test_scanner_finds_containers_split_across_chunks():
+    html = jepy_html()
+    scanner = ContainerScanner(CONTAINERS)
+    for i in range(0, len(html), 1000):
+        scanner.feed(html[i : i + 1000])
+    scanner.close()
+    located = locate_containers(soup())
+    assert scanner.done
+    assert scanner.fragments["holdings_table"][0].html == str(located["holdings_table"])
+    assert len(scanner.fragments["charts"]) == len(located["charts"])
+    assert len(scanner.fragments["ticker_assets"]) == 2
+
+
+def test_stream_stops_after_requested_sections(body, expected):
+    client = _client(body, sections=["info", "holdings"], stream=True)
+    assert client.extract_sections() == {
+        "info": expected["info"],
+        "holdings": expected["holdings"],
+    }
+    assert body.read_bytes < len(jepy_html().encode("utf8")) / 10
+
+
+def test_stream_sections_yields_sections_as_they_complete(body, expected):
+    client = _client(body)
+    streamed = list(client.stream_sections())
+    assert dict(streamed) == expected
+    assert [s for s, _ in streamed][-1] == "exposure"
+    assert (
+        client._page_soup is None and client._get_section("holdings") is streamed[0][1]
+    )
+
+    client = _client(CountingBody(jepy_html().encode("utf8")), low_memory=True)
+    holdings = dict(client.stream_sections(["holdings"]))["holdings"]
+    assert holdings == expected["holdings"]
+    assert holdings[0]["Holding"] is sys.intern("U.S. Dollar")
+
+    client = _client(CountingBody(jepy_html().encode("utf8")), sections=["info"])
+    with pytest.raises(ValueError):
+        list(client.stream_sections(["holdings"]))
+
+
+def test_stream_sections_streams_only_missing_sections(tmp_path, body, expected):
+    store = SectionStore(str(tmp_path / "sections.db"))
+    client = _client(body, section_store=store)
+    client._sections_cache["holdings"] = (time.monotonic(), expected["holdings"])
+    store.put("JEPY", "info", expected["info"])
+    streamed = list(client.stream_sections(["holdings", "info", "performance"]))
+    assert streamed == [
+        ("holdings", expected["holdings"]),
+        ("info", expected["info"]),
+        ("performance", expected["performance"]),
+    ]
+    assert client._requests_session.request.call_count == 1
+    assert store.get_fresh("JEPY", "performance").data == expected["performance"]
+    assert store.get("JEPY", "holdings") is None
+
+    client = _client(body)
+    client._soup = soup()
+    containers = client._page_containers = locate_containers(client._soup)
+    assert dict(client.stream_sections()) == expected
+    assert client._page_containers is containers
+    client._requests_session.request.assert_not_called()
+    store.close()
+
+
+def test_partially_read_page_is_not_cached(tmp_path, body):
+    cache = PageCache(str(tmp_path))
+    _client(body, sections=["holdings"], stream=True, page_cache=cache)._get_section(
+        "holdings"
+    )
+    assert cache.get("https://etfdb.com/etf/JEPY/") is None
+
+    body = CountingBody(jepy_html().encode("utf8"))
+    client = _client(body, sections=["exposure"], stream=True, page_cache=cache)
+    client._get_section("exposure")
+    assert cache.get("https://etfdb.com/etf/JEPY/").body == jepy_html()
+
+
+def test_stream_replays_http_archive(tmp_path, body, expected):
+    path = str(tmp_path / "crawl.har.gz")
+    archive = HTTPArchive(path, mode="record")
+    client = _client(body, http_archive=archive)
+    client._request("GET", client._prepare_url())
+    archive.close()
+
+    client = ETFDBClient(
+        "JEPY",
+        lazy=True,
+        sections=["info"],
+        stream=True,
+        http_archive=HTTPArchive(path),
+    )
+    assert client._get_section("info") == expected["info"]
@@ -1,18 +1,25 @@
+import os
 from unittest import mock
 
 import bs4
+import pytest
 import requests.adapters
 
 from etfpy.utils import (
     _handle_nth_child,
     _handle_spans,
+    atomic_write,
     chunkify,
+    compact_data,
+    first_nth_child,
     get_class_property_methods,
     get_headers,
     get_retry_session,
     handle_find_all_rows,
+    handle_table,
     handle_tbody_thead,
 )
+from tests.utils import soup
 
 
 @mock.patch(
@@ -80,6 +87,14 @@ def test_should_properly_handle_tbody_thead():
         "Large": {"Value": "30"},
         "Small": {"Value": "10"},
     }
+    assert handle_table(soup.find("table")) == handle_tbody_thead(soup, "my_table")
+
+
+def test_first_nth_child_matches_css_selector():
+    page = soup()
+    for tag in page.find("div", {"id": "etf-ticker-body"}).find_all("div")[:300]:
+        for n in (1, 2):
+            assert first_nth_child(tag, n) is tag.select_one(f":nth-child({n})")
 
 
 def test_should_get_property_methods():
@@ -102,3 +117,26 @@ def test_should_handle_nth_span():
     ).find("tr")
     assert _handle_nth_child(soup, 1) == "1"
     assert _handle_nth_child(5, 12) is None
+
+
+def test_atomic_write(tmp_path):
+    path = os.path.join(tmp_path, "data.json")
+    with atomic_write(path) as f:
+        f.write("first")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("second")
+            raise RuntimeError
+    with open(path) as f:
+        assert f.read() == "first"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_compact_data_shares_equal_strings():
+    rows = [{"".join(["Wei", "ght"]): "".join(["N/", "A"]), "n": 1} for _ in range(2)]
+    compact = compact_data({"rows": rows, "text": "x" * 100})
+    assert compact == {"rows": rows, "text": "x" * 100}
+    first, second = compact["rows"]
+    assert (
+        next(iter(first)) is next(iter(second)) and first["Weight"] is second["Weight"]
+    )
@@ -12,6 +12,11 @@ def soup(*args, **kwargs):
     return data
 
 
+def jepy_html() -> str:
+    with open(os.path.join(here, "data/jepy.html"), encoding="utf8") as f:
+        return f.read()
+
+
 def get_quotes(*args, **kwargs):
     with open(os.path.join(here, "data/test_quotes.txt"), encoding="utf8") as f:
         data = f.read()